@@ -1,8 +1,31 @@
 """Application Tracking Agent - Handles CRUD operations for job applications."""
 
 from google.adk.agents import LlmAgent
+from google.adk.agents.callback_context import CallbackContext
+from storage.applications import get_application_store
 from tools.application_tools import (
-    add_application, delete_application, get_applications, set_active_application, update_application)
+    APPLICATION_CONTEXT_KEY, APPLICATION_CONTEXT_VERSION_KEY, add_application, build_application_context,
+    bulk_add_applications, delete_application, get_applications, search_applications,
+    set_active_application, update_application)
+
+
+async def inject_application_context(callback_context: CallbackContext) -> None:
+    """Compute a compact summary of the user's applications once per session.
+
+    The summary is cached in session state and rendered into the instruction;
+    tools that change applications clear it, and writes from elsewhere bump
+    the store version, so the next turn rebuilds it.
+    """
+    version = await get_application_store().version(callback_context.user_id)
+    if (
+        not callback_context.state.get(APPLICATION_CONTEXT_KEY)
+        or callback_context.state.get(APPLICATION_CONTEXT_VERSION_KEY) != version
+    ):
+        callback_context.state[APPLICATION_CONTEXT_KEY] = await build_application_context(
+            callback_context.user_id
+        )
+        callback_context.state[APPLICATION_CONTEXT_VERSION_KEY] = version
+
 
 application_tracking_agent = LlmAgent(
     name="ApplicationTracking",
@@ -12,9 +35,11 @@ application_tracking_agent = LlmAgent(
 
 Key capabilities:
 - Add new job applications with details like job title, company, pay, location, and resume used
+- Add many applications at once with bulk_add_applications when the user pastes a list or CSV
 - Update existing applications (status, details, etc.)
 - Delete applications
 - Retrieve applications (all or filtered by status)
+- Search applications by keywords, location, company, status and date range with search_applications
 - Set the active application in the UI for viewing
 
 - FRONTEND TOOLS:
@@ -25,159 +50,19 @@ Key capabilities:
 
 When adding or updating applications, try to extract as much information as possible from the user's input.
 Be conversational and helpful in guiding users through managing their applications.
+Use search_applications for questions about specific roles, places or time periods, and
+get_applications for anything else not covered by the summary below.
 
-applications = [{
-    id: "app1",
-    user_id: "user123",
-    job_title: "Software Engineer",
-    company: "Tech Solutions Inc.",
-    pay: 120000,
-    location: "San Francisco, CA",
-    resume_used: "Software_Engineer_Resume.pdf",
-    resume_id: "res1",
-    job_url: "https://example.com/job/app1",
-    status: "applied",
-    created_at: new Date("2024-10-26T10:00:00Z"),
-    updated_at: new Date("2024-10-26T10:00:00Z"),
-  },
-  {
-    id: "app2",
-    user_id: "user123",
-    job_title: "Senior Product Manager",
-    company: "Innovate Co.",
-    pay: 160000,
-    location: "New York, NY",
-    resume_used: "Product_Manager_Resume.pdf",
-    resume_id: "res2",
-    job_url: "https://example.com/job/app2",
-    status: "interviewing",
-    created_at: new Date("2024-10-20T11:30:00Z"),
-    updated_at: new Date("2024-10-28T14:00:00Z"),
-  },
-  {
-    id: "app3",
-    user_id: "user123",
-    job_title: "Data Scientist",
-    company: "Data Insights LLC",
-    pay: 135000,
-    location: "Seattle, WA",
-    resume_used: "Data_Scientist_Resume.pdf",
-    resume_id: "res3",
-    job_url: "https://example.com/job/app3",
-    status: "rejected",
-    created_at: new Date("2024-10-15T09:15:00Z"),
-    updated_at: new Date("2024-11-01T16:00:00Z"),
-  },
-  {
-    id: "app4",
-    user_id: "user123",
-    job_title: "Frontend Developer",
-    company: "WebCrafters",
-    pay: 110000,
-    location: "Remote",
-    resume_used: "Frontend_Resume.pdf",
-    resume_id: "res4",
-    job_url: "https://example.com/job/app4",
-    status: "offer",
-    created_at: new Date("2024-11-01T13:00:00Z"),
-    updated_at: new Date("2024-11-05T10:00:00Z"),
-  },
-  {
-    id: "app5",
-    user_id: "user123",
-    job_title: "DevOps Engineer",
-    company: "CloudOps Inc.",
-    pay: 145000,
-    location: "Austin, TX",
-    resume_used: "DevOps_Resume.pdf",
-    resume_id: "res5",
-    job_url: "https://example.com/job/app5",
-    status: "applied",
-    created_at: new Date("2024-11-05T08:45:00Z"),
-    updated_at: new Date("2024-11-05T08:45:00Z"),
-  },
-  {
-    id: "app6",
-    user_id: "user123",
-    job_title: "Full Stack Engineer",
-    company: "StartupXYZ",
-    pay: 130000,
-    location: "Boston, MA",
-    resume_used: "Software_Engineer_Resume.pdf",
-    resume_id: "res1",
-    job_url: "https://example.com/job/app6",
-    status: "ghosted",
-    created_at: new Date("2024-10-01T14:30:00Z"),
-    updated_at: new Date("2024-10-01T14:30:00Z"),
-  },
-  {
-    id: "app7",
-    user_id: "user123",
-    job_title: "Backend Developer",
-    company: "Enterprise Corp",
-    pay: 125000,
-    location: "Chicago, IL",
-    resume_used: "Software_Engineer_Resume.pdf",
-    resume_id: "res1",
-    job_url: "https://example.com/job/app7",
-    status: "ghosted",
-    created_at: new Date("2024-09-25T09:00:00Z"),
-    updated_at: new Date("2024-09-25T09:00:00Z"),
-  },
-];
-
-resumes = [
-  {
-    id: "res1",
-    user_id: "user123",
-    file_name: "Software_Engineer_Resume.pdf",
-    s3_key: "user123/resumes/Software_Engineer_Resume.pdf",
-    upload_status: "completed",
-    created_at: new Date("2024-10-01T09:00:00Z"),
-    updated_at: new Date("2024-10-01T09:00:00Z"),
-  },
-  {
-    id: "res2",
-    user_id: "user123",
-    file_name: "Product_Manager_Resume.pdf",
-    s3_key: "user123/resumes/Product_Manager_Resume.pdf",
-    upload_status: "completed",
-    created_at: new Date("2024-09-15T14:00:00Z"),
-    updated_at: new Date("2024-09-15T14:00:00Z"),
-  },
-  {
-    id: "res3",
-    user_id: "user123",
-    file_name: "Data_Scientist_Resume.pdf",
-    s3_key: "user123/resumes/Data_Scientist_Resume.pdf",
-    upload_status: "completed",
-    created_at: new Date("2024-10-10T10:30:00Z"),
-    updated_at: new Date("2024-10-10T10:30:00Z"),
-  },
-  {
-    id: "res4",
-    user_id: "user123",
-    file_name: "Frontend_Resume.pdf",
-    s3_key: "user123/resumes/Frontend_Resume.pdf",
-    upload_status: "completed",
-    created_at: new Date("2024-09-20T11:00:00Z"),
-    updated_at: new Date("2024-09-20T11:00:00Z"),
-  },
-  {
-    id: "res5",
-    user_id: "user123",
-    file_name: "DevOps_Resume.pdf",
-    s3_key: "user123/resumes/DevOps_Resume.pdf",
-    upload_status: "completed",
-    created_at: new Date("2024-11-01T16:00:00Z"),
-    updated_at: new Date("2024-11-01T16:00:00Z"),
-  },
+{application_context?}
 """,
+    before_agent_callback=inject_application_context,
     tools=[
         add_application,
+        bulk_add_applications,
         update_application,
         delete_application,
         get_applications,
+        search_applications,
         set_active_application,
     ],
 )
@@ -1,35 +1,120 @@
-from asyncio import sleep
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+
+import httpx
+from google.adk.tools.tool_context import ToolContext
+
+from ingest.applications import import_applications, parse_csv
+from ingest.job_postings import UnsafeURL, get_job_posting_fetcher
+from storage.applications import STATUSES, get_application_store
+from storage.search import get_search_index
+
+# Session state key holding the compact summary rendered into the agent instruction
+APPLICATION_CONTEXT_KEY = "application_context"
+# Store version the summary was built from; writes made outside this session
+# (another session, the fast path, a bulk import) bump it
+APPLICATION_CONTEXT_VERSION_KEY = "application_context_version"
+CONTEXT_RECENT_LIMIT = 20
+# Results are fetched with one IN (...) query; stay well under SQLite's bound-variable limit
+MAX_SEARCH_RESULTS = 200
+
+
+async def build_application_context(user_id: str, limit: int = CONTEXT_RECENT_LIMIT) -> str:
+    """Summarize a user's applications in a few compact lines for the prompt."""
+    store = get_application_store()
+    counts = await store.status_counts(user_id)
+    total = sum(counts.values())
+    if not total:
+        return "The user has no applications yet."
+
+    recent = await store.find(user_id, limit=limit)
+    lines = [
+        f"The user has {total} applications ("
+        + ", ".join(f"{counts[status]} {status}" for status in STATUSES if counts.get(status))
+        + f"). Most recent {len(recent)} (id | job title | company | status | applied):",
+    ]
+    lines.extend(
+        f"{app['id']} | {app['job_title']} | {app['company']} | {app['status']} | {app['created_at'][:10]}"
+        for app in recent
+    )
+    return "\n".join(lines)
+
+
+def _clear_application_context(tool_context: ToolContext) -> None:
+    tool_context.state[APPLICATION_CONTEXT_KEY] = None
 
 
 async def add_application(
-    job_title: str,
-    company: str,
+    tool_context: ToolContext,
+    job_title: str | None = None,
+    company: str | None = None,
     pay: int | None = None,
     location: str | None = None,
     job_url: str | None = None,
     resume_id: str | None = None,
     status: str = "applied",
+    notes: str | None = None,
+    job_description: str | None = None,
 ) -> dict:
-    """Add a new job application. Always assume statu is "applied" if not provided."""
-    await sleep(5)  # Simulate database operation delay
+    """Add a new job application. Always assume statu is "applied" if not provided.
+    When job_url is given, missing details are filled in from the job posting."""
+    posting = None
+    if job_url and not (job_title and company and pay and location):
+        try:
+            posting = await get_job_posting_fetcher().fetch(job_url)
+        except (httpx.HTTPError, httpx.InvalidURL, UnsafeURL):
+            pass
+    if posting:
+        job_title = job_title or posting.title
+        company = company or posting.company
+        pay = pay or posting.pay
+        location = location or posting.location
+
+    if not job_title or not company:
+        return {
+            "status": "error",
+            "message": "A job title and company are required; ask the user for the missing details",
+        }
+
+    _clear_application_context(tool_context)
+    application = await get_application_store().add(
+        tool_context.user_id,
+        job_title=job_title,
+        company=company,
+        pay=pay,
+        location=location,
+        job_url=job_url,
+        resume_id=resume_id,
+        status=status,
+        notes=notes,
+        job_description=job_description,
+    )
     return {
         "status": "success",
         "message": f"Added application for {job_title} at {company}",
-        "data": {
-            "job_title": job_title,
-            "company": company,
-            "pay": pay,
-            "location": location,
-            "job_url": job_url,
-            "resume_id": resume_id,
-            "status": status,
-        },
+        "data": application,
+    }
+
+
+async def bulk_add_applications(
+    tool_context: ToolContext,
+    applications: list[dict] | None = None,
+    csv_text: str | None = None,
+) -> dict:
+    """Add many job applications at once. Pass either a list of application objects
+    (job_title, company, pay, location, job_url, resume_id, status, notes, job_description) or CSV text with a
+    header row. Returns a result for every row."""
+    rows = parse_csv(csv_text) if csv_text else applications or []
+    summary = await import_applications(get_application_store(), tool_context.user_id, rows)
+    _clear_application_context(tool_context)
+    return {
+        "status": "success" if not summary["failed"] else "partial",
+        "message": f"Imported {summary['imported']} applications, {summary['failed']} failed",
+        "data": summary,
     }
 
 
 async def update_application(
+    tool_context: ToolContext,
     application_id: str,
     job_title: str | None = None,
     company: str | None = None,
@@ -38,56 +123,107 @@ async def update_application(
     status: str | None = None,
     resume_id: str | None = None,
     job_url: str | None = None,
+    notes: str | None = None,
+    job_description: str | None = None,
 ) -> dict:
     """Update an existing job application."""
-    await sleep(5)
+    application = await get_application_store().update(
+        tool_context.user_id,
+        application_id,
+        job_title=job_title,
+        company=company,
+        pay=pay,
+        location=location,
+        status=status,
+        resume_id=resume_id,
+        job_url=job_url,
+        notes=notes,
+        job_description=job_description,
+    )
+    if application is None:
+        return {
+            "status": "error",
+            "message": f"Application {application_id} not found",
+        }
+    _clear_application_context(tool_context)
     return {
         "status": "success",
         "message": f"Updated application {application_id}",
-        "data": {
-            "id": application_id,
-            "job_title": job_title,
-            "company": company,
-            "pay": pay,
-            "location": location,
-            "status": status,
-            "resume_id": resume_id,
-            "job_url": job_url,
-        },
+        "data": application,
     }
 
 
-async def delete_application(application_id: str) -> dict:
+async def delete_application(tool_context: ToolContext, application_id: str) -> dict:
     """Delete a job application."""
-    await sleep(5)
+    deleted = await get_application_store().delete(tool_context.user_id, application_id)
+    if not deleted:
+        return {
+            "status": "error",
+            "message": f"Application {application_id} not found",
+        }
+    _clear_application_context(tool_context)
     return {
         "status": "success",
         "message": f"Deleted application {application_id}",
     }
 
 
-async def get_applications(status: str | None = None) -> dict:
-    """Get all job applications, optionally filtered by status."""
-    await sleep(5)
+async def get_applications(
+    tool_context: ToolContext, status: str | None = None, limit: int = 100
+) -> dict:
+    """Get job applications, newest first, optionally filtered by status."""
+    applications = await get_application_store().find(
+        tool_context.user_id, status=status, limit=limit
+    )
+    return {
+        "status": "success",
+        "message": f"Retrieved {len(applications)} applications",
+        "data": applications,
+    }
+
 
+async def search_applications(
+    tool_context: ToolContext,
+    query: str = "",
+    status: str | None = None,
+    location: str | None = None,
+    company: str | None = None,
+    applied_after: str | None = None,
+    applied_before: str | None = None,
+    limit: int = 20,
+) -> dict:
+    """Search job applications by keywords in the job title, company, location, notes and
+    job description, with optional filters. Dates are ISO (YYYY-MM-DD) and inclusive; for
+    "last fall" pass the September to November range. Results are best match first."""
+    try:
+        results = await asyncio.to_thread(
+            get_search_index().search,
+            tool_context.user_id,
+            query,
+            limit=min(limit, MAX_SEARCH_RESULTS),
+            status=status,
+            location=location,
+            company=company,
+            applied_after=applied_after,
+            applied_before=applied_before,
+        )
+    except ValueError as e:
+        return {
+            "status": "error",
+            "message": str(e),
+        }
+    # Descriptions can be long; the match is enough for the agent to go on
+    for application in results:
+        application.pop("job_description", None)
     return {
         "status": "success",
-        "message": "Retrieved applications",
-        "data": [{
-            "id": "1",
-            "job_title": "Software Engineer",
-            "company": "Tech Corp",
-            "status": "applied",
-            "pay": 85000,
-            "location": "San Francisco, CA",
-            "created_at": "2023-10-15T14:30:00Z"
-        }],  # Will be replaced with actual database query
+        "message": f"Found {len(results)} matching applications",
+        "data": results,
     }
 
 
 async def set_active_application(application_id: str) -> dict:
     """Set the active application in the UI."""
-    await sleep(5)
     return {
         "status": "success",
         "message": f"Set active application to {application_id}",
@@ -0,0 +1,87 @@
+"""Benchmark insight queries over incrementally maintained columns.
+
+Compares each insight call against a naive full rescan of the user's rows,
+and times a pay analysis right after each write, which patches the columns
+and copies a new snapshot instead of rescanning.
+
+Usage (from applyflow_agents/):
+    python -m benchmarks.bench_analytics --rows 100000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks.bench_application_store import USER_ID, make_row
+from storage.analytics import AnalyticsStore
+from storage.applications import ApplicationStore
+from storage.columnar import ApplicationColumns
+
+
+def median_ms(fn, iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(samples), 4)
+
+
+async def run(rows: int, iterations: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ApplicationStore(os.path.join(tmp, "bench.db"))
+        analytics = AnalyticsStore(store)
+        for offset in range(0, rows, 10_000):
+            await store.add_many(USER_ID, (make_row(i) for i in range(offset, min(rows, offset + 10_000))))
+
+        start = time.perf_counter()
+        analytics.get(USER_ID)
+        load_ms = (time.perf_counter() - start) * 1000
+
+        def rescan():
+            with store.pool.connection() as conn:
+                ApplicationColumns.from_rows(store._scan(conn, USER_ID)).snapshot().pay_analysis()
+
+        results = {
+            "get_application_stats": median_ms(lambda: analytics.application_stats(USER_ID), iterations),
+            "get_success_rate": median_ms(lambda: analytics.success_rate(USER_ID), iterations),
+            "get_timeline_insights": median_ms(lambda: analytics.timeline(USER_ID, 365 * 3), iterations),
+            "get_pay_analysis": median_ms(lambda: analytics.pay_analysis(USER_ID), iterations),
+            "naive_rescan": median_ms(rescan, 3),
+        }
+
+        write_samples, after_write_samples = [], []
+        for i in range(iterations):
+            start = time.perf_counter()
+            await store.update(USER_ID, f"app{i}", status="offer", pay=150_000 + i)
+            write_samples.append((time.perf_counter() - start) * 1000)
+            start = time.perf_counter()
+            analytics.pay_analysis(USER_ID)
+            after_write_samples.append((time.perf_counter() - start) * 1000)
+        store.close()
+
+    return {
+        "rows": rows,
+        "initial_load_ms": round(load_ms, 1),
+        "query_p50_ms": results,
+        "update_with_aggregates_p50_ms": round(statistics.median(write_samples), 3),
+        "pay_analysis_after_update_p50_ms": round(statistics.median(after_write_samples), 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000])
+    parser.add_argument("--iterations", type=int, default=100)
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        print(json.dumps(asyncio.run(run(rows, args.iterations))))
+
+
+if __name__ == "__main__":
+    main()
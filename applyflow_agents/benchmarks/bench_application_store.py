@@ -0,0 +1,97 @@
+"""Benchmark application store latency at increasing per-user row counts.
+
+Usage (from applyflow_agents/):
+    python -m benchmarks.bench_application_store --rows 10000 100000 1000000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from storage.applications import ApplicationStore
+
+STATUSES = ["applied", "interviewing", "offer", "rejected", "ghosted"]
+USER_ID = "bench_user"
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def make_row(i: int) -> dict:
+    return {
+        "id": f"app{i}",
+        "job_title": f"Engineer {i}",
+        "company": f"Company {i % 5000}",
+        "pay": 60000 + (i * 37) % 140000,
+        "location": f"City {i % 200}",
+        "status": STATUSES[i % len(STATUSES)],
+        "created_at": f"2024-{1 + i % 12:02d}-{1 + i % 28:02d}T00:00:{i % 60:02d}Z",
+    }
+
+
+async def timed(samples: dict[str, list[float]], name: str, coro) -> None:
+    start = time.perf_counter()
+    await coro
+    samples.setdefault(name, []).append((time.perf_counter() - start) * 1000)
+
+
+async def run(rows: int, iterations: int, batch_size: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ApplicationStore(os.path.join(tmp, "bench.db"))
+
+        seed_start = time.perf_counter()
+        for offset in range(0, rows, batch_size):
+            await store.add_many(
+                USER_ID, (make_row(i) for i in range(offset, min(rows, offset + batch_size)))
+            )
+        seed_seconds = time.perf_counter() - seed_start
+
+        samples: dict[str, list[float]] = {}
+        for n in range(iterations):
+            target = f"app{random.randrange(rows)}"
+            await timed(samples, "add_application", store.add(USER_ID, job_title="New", company="Co"))
+            await timed(samples, "update_application", store.update(USER_ID, target, status="interviewing"))
+            await timed(samples, "get_applications", store.find(USER_ID, limit=100))
+            await timed(
+                samples,
+                "get_applications_by_status",
+                store.find(USER_ID, status=STATUSES[n % len(STATUSES)], limit=100),
+            )
+            await timed(samples, "delete_application", store.delete(USER_ID, target))
+
+        store.close()
+
+    return {
+        "rows": rows,
+        "seed_rows_per_sec": round(rows / seed_seconds),
+        "latency_ms": {
+            name: {
+                "p50": round(statistics.median(values), 3),
+                "p99": round(percentile(values, 99), 3),
+            }
+            for name, values in samples.items()
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        print(json.dumps(asyncio.run(run(rows, args.iterations, args.batch_size))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark ATS matching: single-resume latency, batch scoring and prompt savings.
+
+Usage (from applyflow_agents/):
+    python -m benchmarks.bench_ats --resumes 50
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+
+from benchmarks.bench_resume_text import JOB_DESCRIPTION, resume_lines
+from ingest.ats import SKILLS, SkillMatcher, normalize_tokens, profile_text, score_resume, score_resumes
+
+
+def make_resume(seed: int, pages: int) -> str:
+    rng = random.Random(seed)
+    skills = rng.sample(sorted(SKILLS), 12)
+    return "\n".join(resume_lines(pages) + ["Skills", ", ".join(skills)])
+
+
+def median_ms(fn, iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+def run(resumes: int, pages: int, iterations: int) -> dict:
+    texts = {f"res_{i}": make_resume(i, pages) for i in range(resumes)}
+    first = texts["res_0"]
+
+    def cold_single():
+        profile_text.cache_clear()
+        score_resume(JOB_DESCRIPTION, first)
+
+    def cold_batch():
+        profile_text.cache_clear()
+        score_resumes(JOB_DESCRIPTION, texts)
+
+    tokens = normalize_tokens(first)
+    matcher = SkillMatcher(SKILLS)
+    report = score_resume(JOB_DESCRIPTION, first).to_dict()
+    return {
+        "resumes": resumes,
+        "resume_chars": len(first),
+        "automaton_build_ms": median_ms(lambda: SkillMatcher(SKILLS), iterations),
+        "skill_scan_ms": median_ms(lambda: matcher.find(tokens), iterations),
+        "single_cold_ms": median_ms(cold_single, iterations),
+        "single_warm_ms": median_ms(lambda: score_resume(JOB_DESCRIPTION, first), iterations),
+        "batch_cold_ms": median_ms(cold_batch, iterations),
+        # What the model reads: both documents versus the gap report
+        "prompt_chars_full": len(JOB_DESCRIPTION) + len(first),
+        "prompt_chars_report": len(json.dumps(report)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=50)
+    parser.add_argument("--pages", type=int, default=2)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    print(json.dumps(run(args.resumes, args.pages, args.iterations), indent=2))
+
+
+if __name__ == "__main__":
+    main()
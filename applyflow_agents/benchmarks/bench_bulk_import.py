@@ -0,0 +1,64 @@
+"""Storage time for importing N applications: one add per row vs bulk import.
+
+Usage (from applyflow_agents/):
+    python -m benchmarks.bench_bulk_import --rows 50 500
+"""
+
+import argparse
+import asyncio
+import csv
+import io
+import json
+import os
+import tempfile
+import time
+
+from benchmarks.bench_application_store import USER_ID, make_row
+from ingest.applications import import_applications, parse_csv
+from storage.applications import ApplicationStore
+
+
+def make_csv(rows: int) -> str:
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=["job_title", "company", "pay", "location", "status"])
+    writer.writeheader()
+    for i in range(rows):
+        row = make_row(i)
+        writer.writerow({field: row[field] for field in writer.fieldnames})
+    return out.getvalue()
+
+
+async def run(rows: int) -> dict:
+    text = make_csv(rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ApplicationStore(os.path.join(tmp, "bench.db"))
+
+        start = time.perf_counter()
+        for row in parse_csv(text):
+            await store.add(USER_ID, **row)
+        per_row = time.perf_counter() - start
+
+        start = time.perf_counter()
+        summary = await import_applications(store, USER_ID, parse_csv(text))
+        bulk = time.perf_counter() - start
+        store.close()
+
+    return {
+        "rows": rows,
+        "per_row_ms": round(per_row * 1000, 2),
+        "bulk_ms": round(bulk * 1000, 2),
+        "imported": summary["imported"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[50, 500])
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        print(json.dumps(asyncio.run(run(rows))))
+
+
+if __name__ == "__main__":
+    main()
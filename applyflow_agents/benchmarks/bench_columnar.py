@@ -0,0 +1,85 @@
+"""Benchmark the NumPy snapshot engine against a pure-Python baseline.
+
+Usage (from applyflow_agents/):
+    python -m benchmarks.bench_columnar --rows 10000 100000 1000000
+"""
+
+import argparse
+import json
+import statistics
+import time
+from collections import Counter, defaultdict
+from datetime import date, timedelta
+
+from benchmarks.bench_application_store import make_row
+from storage.columnar import ApplicationSnapshot
+
+TODAY = (date(2024, 12, 31) - date(1970, 1, 1)).days
+
+
+def python_pay_analysis(rows: list[dict]) -> dict:
+    pays = sorted(row["pay"] for row in rows if row.get("pay") is not None)
+    by_location = defaultdict(list)
+    for row in rows:
+        if row.get("pay") is not None and row.get("location"):
+            by_location[row["location"]].append(row["pay"])
+    return {
+        "median_pay": statistics.median(pays),
+        "percentiles": statistics.quantiles(pays, n=4),
+        "by_location": {
+            location: {"median_pay": statistics.median(values), "average_pay": statistics.fmean(values)}
+            for location, values in by_location.items()
+        },
+    }
+
+
+def python_timeline(rows: list[dict], days: int) -> dict:
+    first = date(2024, 12, 31) - timedelta(days=days - 1)
+    weeks = Counter()
+    for row in rows:
+        day = date.fromisoformat(row["created_at"][:10])
+        if day >= first:
+            weeks[day - timedelta(days=day.weekday())] += 1
+    return dict(weeks)
+
+
+def timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return round(min(samples), 2)
+
+
+def run(rows: int, repeat: int) -> dict:
+    data = [make_row(i) for i in range(rows)]
+    start = time.perf_counter()
+    snapshot = ApplicationSnapshot.from_rows(data)
+    load_ms = (time.perf_counter() - start) * 1000
+    return {
+        "rows": rows,
+        "snapshot_load_ms": round(load_ms, 1),
+        "pay_analysis_ms": {
+            "numpy": timed(snapshot.pay_analysis, repeat),
+            "python": timed(lambda: python_pay_analysis(data), repeat),
+        },
+        "timeline_365d_ms": {
+            "numpy": timed(lambda: snapshot.timeline(365, today=TODAY), repeat),
+            "python": timed(lambda: python_timeline(data, 365), repeat),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        print(json.dumps(run(rows, args.repeat)))
+
+
+if __name__ == "__main__":
+    main()
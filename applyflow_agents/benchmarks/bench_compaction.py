@@ -0,0 +1,176 @@
+"""Tokens per model call and turn latency over long sessions, with and without history compaction.
+
+Sessions of --turns turns are generated: a user message, a tool call and
+result on some turns, and a model reply. Every model call's history is
+sized with the compactor's token estimate, with compaction off and on. The
+summarizer is an extractive stand-in that sleeps --summary-ms, and runs
+after the turn as it does in the service, so its result applies from the
+next turn on. Turn latency is modeled as --base-ms plus --ms-per-1k-tokens
+for each thousand history tokens per model call; the time spent trimming
+the request is measured.
+
+Usage (from applyflow_agents/):
+    python -m benchmarks.bench_compaction --sessions 5 --turns 200
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from types import SimpleNamespace
+
+from compaction.history import (
+    SUMMARY_KEY, SUMMARY_WORDS, HistoryCompactor, content_tokens, has_content)
+
+AGENT = "ApplicationTracking"
+WORDS = ("offer", "interview", "resume", "google", "stripe", "applied", "status", "role", "salary",
+         "remote", "recruiter", "follow", "up", "engineer", "backend", "onsite", "next", "week")
+CHECKPOINTS = (1, 25, 50, 100, 150, 200)
+
+
+def event(author: str, role: str, **part) -> SimpleNamespace:
+    part = SimpleNamespace(**{"text": None, "function_call": None, "function_response": None, **part})
+    return SimpleNamespace(author=author, partial=False, content=SimpleNamespace(role=role, parts=[part]))
+
+
+def sentence(rng: random.Random, low: int, high: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(low, high)))
+
+
+def turn_events(rng: random.Random, turn: int, tool_rate: float) -> list[list[SimpleNamespace]]:
+    """Events per model call: the first call sees the user message, later ones tool results."""
+    calls = [[event("user", "user", text=f"turn {turn}: {sentence(rng, 8, 40)}")]]
+    if rng.random() < tool_rate:
+        applications = [
+            {"id": f"app{i}", "job_title": sentence(rng, 2, 3), "company": rng.choice(WORDS), "status": "applied"}
+            for i in range(rng.randint(3, 15))
+        ]
+        calls[-1].append(event(AGENT, "model", function_call=SimpleNamespace(
+            name="get_applications", args={"status": "applied"})))
+        calls.append([event(AGENT, "user", function_response=SimpleNamespace(
+            name="get_applications", response={"status": "success", "data": applications}))])
+    calls[-1].append(event(AGENT, "model", text=sentence(rng, 40, 150)))
+    return calls
+
+
+def make_summarizer(delay: float):
+    async def summarize(summary: str | None, lines: list[str]) -> str:
+        await asyncio.sleep(delay)
+        words = (summary or "").split()
+        for line in lines:
+            if line.startswith("user:"):
+                words += line.split()[1:13]
+        return " ".join(words[-SUMMARY_WORDS:])
+    return summarize
+
+
+async def run_session(rng: random.Random, args, compact: bool) -> dict:
+    compactor = HistoryCompactor(make_summarizer(args.summary_ms / 1000), args.threshold, args.keep_turns)
+    events: list[SimpleNamespace] = []
+    state: dict = {}
+    pending: asyncio.Task | None = None
+    tokens, latency, trim_us, compaction_ms = [], [], [], []
+    compactions = 0
+    for turn in range(1, args.turns + 1):
+        # A compaction started after the previous turn lands before this one
+        if pending is not None:
+            delta, elapsed = await pending
+            pending = None
+            if delta:
+                state.update(delta)
+                compactions += 1
+                compaction_ms.append(elapsed)
+
+        turn_ms = 0.0
+        turn_tokens = []
+        for call_events in turn_events(rng, turn, args.tool_rate):
+            # The model sees everything up to the event that ends this call
+            events.extend(call_events[:-1] if call_events[-1].content.role == "model" else call_events)
+            contents = [e.content for e in events if has_content(e)]
+            history = sum(content_tokens(c) for c in contents)
+            if compact:
+                start = time.perf_counter()
+                trimmed = compactor.trim(events, state, contents)
+                trim_us.append((time.perf_counter() - start) * 1e6)
+                if trimmed is not None:
+                    history = sum(content_tokens(c) for c in trimmed) + len(state[SUMMARY_KEY]) // 4
+            turn_tokens.append(history)
+            turn_ms += args.base_ms + args.ms_per_1k_tokens * history / 1000
+            if call_events[-1].content.role == "model":
+                events.append(call_events[-1])
+        tokens.append(turn_tokens)
+        latency.append(turn_ms)
+
+        if compact:
+            async def background() -> tuple[dict | None, float]:
+                start = time.perf_counter()
+                delta = await compactor.compact(list(events), dict(state))
+                return delta, (time.perf_counter() - start) * 1000
+            pending = asyncio.create_task(background())
+    if pending is not None:
+        pending.cancel()
+    return {"tokens": tokens, "latency": latency, "trim_us": trim_us,
+            "compaction_ms": compaction_ms, "compactions": compactions}
+
+
+def summarize_runs(runs: list[dict], turns: int) -> dict:
+    per_call = [t for run in runs for turn in run["tokens"] for t in turn]
+    latency = sorted(ms for run in runs for ms in run["latency"])
+    at = {
+        str(turn): round(statistics.mean(max(run["tokens"][turn - 1]) for run in runs))
+        for turn in CHECKPOINTS if turn <= turns
+    }
+    result = {
+        "tokens_per_call_mean": round(statistics.mean(per_call)),
+        "tokens_per_call_max": max(per_call),
+        "tokens_per_call_at_turn": at,
+        "tokens_total_per_session": round(statistics.mean(sum(map(sum, run["tokens"])) for run in runs)),
+        "turn_latency_p50_ms": round(latency[len(latency) // 2]),
+        "turn_latency_p95_ms": round(latency[int(len(latency) * 0.95) - 1]),
+        "last_turn_latency_ms": round(statistics.mean(run["latency"][-1] for run in runs)),
+    }
+    trim_us = sorted(us for run in runs for us in run["trim_us"])
+    if trim_us:
+        compaction_ms = [ms for run in runs for ms in run["compaction_ms"]]
+        result.update({
+            "compactions_per_session": round(statistics.mean(run["compactions"] for run in runs), 1),
+            "trim_p50_us": round(trim_us[len(trim_us) // 2], 1),
+            "trim_p99_us": round(trim_us[int(len(trim_us) * 0.99) - 1], 1),
+            "background_compaction_p50_ms": round(statistics.median(compaction_ms), 1) if compaction_ms else None,
+        })
+    return result
+
+
+async def run(args) -> dict:
+    results = {}
+    for compact in (False, True):
+        rng = random.Random(args.seed)
+        runs = [await run_session(rng, args, compact) for _ in range(args.sessions)]
+        results["compacted" if compact else "full_history"] = summarize_runs(runs, args.turns)
+    return {
+        "sessions": args.sessions,
+        "turns": args.turns,
+        "threshold_tokens": args.threshold,
+        "keep_turns": args.keep_turns,
+        **results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=5)
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--tool-rate", type=float, default=0.4, help="share of turns that call a tool")
+    parser.add_argument("--threshold", type=int, default=6000)
+    parser.add_argument("--keep-turns", type=int, default=4)
+    parser.add_argument("--summary-ms", type=float, default=5.0, help="stand-in summarizer call time")
+    parser.add_argument("--base-ms", type=float, default=800.0)
+    parser.add_argument("--ms-per-1k-tokens", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=7)
+    print(json.dumps(asyncio.run(run(parser.parse_args())), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Benchmark the combined insights dashboard against sequential tool calls.
+
+Also measures event-loop lag while the dashboard runs, to show the
+aggregations stay off the loop.
+
+Usage (from applyflow_agents/):
+    python -m benchmarks.bench_dashboard --rows 100000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks.bench_application_store import USER_ID, make_row
+from storage.analytics import AnalyticsStore, run_analytics
+from storage.applications import ApplicationStore
+
+
+async def sequential(analytics: AnalyticsStore, days: int) -> dict:
+    # What the agent did before: one tool call after another
+    return {
+        "stats": await run_analytics(analytics.application_stats, USER_ID),
+        "success_rate": await run_analytics(analytics.success_rate, USER_ID),
+        "timeline": await run_analytics(analytics.timeline, USER_ID, days),
+        "pay_analysis": await run_analytics(analytics.pay_analysis, USER_ID),
+        "recommendations": await run_analytics(analytics.recommendations, USER_ID),
+    }
+
+
+async def max_loop_lag(coro, interval: float = 0.001) -> tuple[object, float]:
+    """Run coro while sampling how late a periodic timer wakes up."""
+    lags = []
+    done = asyncio.Event()
+
+    async def probe():
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            lags.append(time.perf_counter() - start - interval)
+
+    task = asyncio.create_task(probe())
+    try:
+        return await coro, max(lags, default=0.0) * 1000
+    finally:
+        done.set()
+        await task
+
+
+async def timed_ms(make_coro, iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await make_coro()
+        samples.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+async def run(rows: int, iterations: int, days: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ApplicationStore(os.path.join(tmp, "bench.db"))
+        analytics = AnalyticsStore(store)
+        for offset in range(0, rows, 10_000):
+            await store.add_many(USER_ID, (make_row(i) for i in range(offset, min(rows, offset + 10_000))))
+
+        # Warm the aggregates and snapshot cache so both paths measure compute only
+        await sequential(analytics, days)
+        dashboard = await analytics.dashboard(USER_ID, days)
+        assert dashboard["stats"] == analytics.application_stats(USER_ID)
+        assert dashboard["success_rate"] == analytics.success_rate(USER_ID)
+
+        _, lag_ms = await max_loop_lag(analytics.dashboard(USER_ID, days))
+        result = {
+            "rows": rows,
+            "sequential_ms": await timed_ms(lambda: sequential(analytics, days), iterations),
+            "dashboard_ms": await timed_ms(lambda: analytics.dashboard(USER_ID, days), iterations),
+            "dashboard_max_loop_lag_ms": round(lag_ms, 3),
+        }
+        store.close()
+        return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--days", type=int, default=365)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.rows, args.iterations, args.days)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
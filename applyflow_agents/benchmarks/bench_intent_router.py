@@ -0,0 +1,127 @@
+"""Replay an utterance corpus through the intent router: hit rate, accuracy and latency saved.
+
+Each corpus line is {"text": ..., "expected": "update_status" | "list_applications" | null}.
+Utterances run against a seeded store through tool functions that make the
+same store calls as the application tools (without importing ADK). Latency
+saved is the model-handled turn time (--model-turn-ms: a tool-picking call
+plus a phrasing call) minus the fast path time, summed over hits.
+
+Usage (from applyflow_agents/):
+    python -m benchmarks.bench_intent_router --model-turn-ms 2400 --repeat 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from routing.intents import IntentRouter, parse_intent
+from storage.applications import ApplicationStore
+
+USER_ID = "bench_user"
+CORPUS = Path(__file__).with_name("intent_corpus.jsonl")
+
+SEED = [
+    ("Backend Engineer", "Stripe", "applied"),
+    ("Product Designer", "Figma", "applied"),
+    ("Software Engineer", "Google", "applied"),
+    ("Staff Engineer", "Google", "interviewing"),
+    ("Frontend Engineer", "Notion", "applied"),
+    ("SRE", "Datadog", "interviewing"),
+    ("Senior Engineer", "Shopify", "interviewing"),
+    ("Data Engineer", "Canva", "applied"),
+]
+
+
+async def seed(store: ApplicationStore) -> None:
+    rows = [
+        {"id": f"app{i}", "job_title": f"Engineer {i}", "company": f"Company {i}", "status": "applied"}
+        for i in range(1, 31)
+    ]
+    rows += [
+        {"job_title": title, "company": company, "status": status}
+        for title, company, status in SEED
+    ]
+    await store.add_many(USER_ID, rows)
+
+
+def store_tools(store: ApplicationStore) -> dict:
+    async def update_application(tool_context, application_id: str, **fields) -> dict:
+        application = await store.update(tool_context.user_id, application_id, **fields)
+        if application is None:
+            return {"status": "error", "message": f"Application {application_id} not found"}
+        return {"status": "success", "data": application}
+
+    async def get_applications(tool_context, status: str | None = None, limit: int = 100) -> dict:
+        applications = await store.find(tool_context.user_id, status=status, limit=limit)
+        return {"status": "success", "data": applications}
+
+    return {"update_application": update_application, "get_applications": get_applications}
+
+
+async def run(corpus: list[dict], repeat: int, model_turn_ms: float) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ApplicationStore(os.path.join(tmp, "bench.db"))
+        await seed(store)
+        router = IntentRouter(store_tools(store), store=store)
+
+        hits, correct, false_hits, missed = 0, 0, [], []
+        hit_ms, miss_ms = [], []
+        for iteration in range(repeat):
+            for item in corpus:
+                start = time.perf_counter()
+                routed = await router.route(USER_ID, item["text"])
+                elapsed = (time.perf_counter() - start) * 1000
+                (hit_ms if routed else miss_ms).append(elapsed)
+                if iteration == 0:
+                    if routed:
+                        hits += 1
+                        if routed.intent.name == item["expected"]:
+                            correct += 1
+                        else:
+                            false_hits.append(item["text"])
+                    elif item["expected"]:
+                        missed.append(item["text"])
+        store.close()
+
+    parse_start = time.perf_counter()
+    for _ in range(repeat):
+        for item in corpus:
+            parse_intent(item["text"])
+    parse_us = (time.perf_counter() - parse_start) * 1e6 / (repeat * len(corpus))
+
+    fast_p50 = statistics.median(hit_ms) if hit_ms else 0.0
+    return {
+        "utterances": len(corpus),
+        "hit_rate": round(hits / len(corpus), 3),
+        "precision": round(correct / hits, 3) if hits else None,
+        "recall": round(correct / sum(1 for item in corpus if item["expected"]), 3),
+        "false_hits": false_hits,
+        "missed": missed,
+        "parse_us": round(parse_us, 1),
+        "fast_path_p50_ms": round(fast_p50, 3),
+        "fast_path_p95_ms": round(sorted(hit_ms)[int(len(hit_ms) * 0.95) - 1], 3) if hit_ms else None,
+        "fallback_overhead_p50_ms": round(statistics.median(miss_ms), 3) if miss_ms else None,
+        "model_turn_ms": model_turn_ms,
+        "saved_per_hit_ms": round(model_turn_ms - fast_p50, 1),
+        "saved_per_utterance_ms": round(hits / len(corpus) * (model_turn_ms - fast_p50), 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", type=Path, default=CORPUS)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--model-turn-ms", type=float, default=2400.0)
+    args = parser.parse_args()
+
+    corpus = [json.loads(line) for line in args.corpus.read_text().splitlines() if line.strip()]
+    print(json.dumps(asyncio.run(run(corpus, args.repeat, args.model_turn_ms)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
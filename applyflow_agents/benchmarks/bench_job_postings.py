@@ -0,0 +1,120 @@
+"""Bulk job posting import throughput against local stand-in job boards.
+
+Starts one HTTP server per simulated host. Pages embed JobPosting JSON-LD and
+support ETag revalidation.
+
+Usage (from applyflow_agents/):
+    python -m benchmarks.bench_job_postings --urls 500 --hosts 5
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ingest.job_postings import JobPostingFetcher
+
+PAGE = """<!doctype html><html><head><title>{title} | Careers</title>
+<meta property="og:site_name" content="{company}">
+<script type="application/ld+json">{ld_json}</script></head>
+<body><h1>{title}</h1><p>{filler}</p><p>Salary: ${low:,} - ${high:,}</p></body></html>"""
+
+
+def make_page(path: str) -> bytes:
+    n = int(hashlib.md5(path.encode()).hexdigest(), 16) % 10_000
+    title, company = f"Software Engineer {n}", f"Company {n % 97}"
+    ld_json = json.dumps({
+        "@context": "https://schema.org",
+        "@type": "JobPosting",
+        "title": title,
+        "hiringOrganization": {"@type": "Organization", "name": company},
+        "jobLocation": {"@type": "Place", "address": {"addressLocality": "Chicago", "addressRegion": "IL"}},
+        "baseSalary": {"@type": "MonetaryAmount", "currency": "USD",
+                       "value": {"@type": "QuantitativeValue", "minValue": 100_000 + n, "maxValue": 150_000 + n, "unitText": "YEAR"}},
+    })
+    return PAGE.format(title=title, company=company, ld_json=ld_json, filler="lorem ipsum " * 2000,
+                       low=100_000 + n, high=150_000 + n).encode()
+
+
+def make_handler(latency: float):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            time.sleep(latency)
+            body = make_page(self.path)
+            etag = f'"{hashlib.md5(body).hexdigest()}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+async def timed_import(fetcher: JobPostingFetcher, urls: list[str]) -> dict:
+    start = time.perf_counter()
+    results = await fetcher.fetch_many(urls)
+    elapsed = time.perf_counter() - start
+    errors = [r for r in results if isinstance(r, Exception)]
+    return {
+        "seconds": round(elapsed, 3),
+        "urls_per_sec": round(len(urls) / elapsed, 1),
+        "errors": len(errors),
+        "first_error": repr(errors[0]) if errors else None,
+    }
+
+
+async def run(urls: list[str], per_host: int) -> dict:
+    with tempfile.TemporaryDirectory() as cache_dir:
+        fetcher = JobPostingFetcher(cache_dir=cache_dir, per_host_limit=per_host, allow_private=True)
+        cold = await timed_import(fetcher, urls)
+        fresh = await timed_import(fetcher, urls)
+        fetcher.cache_max_age = 0
+        revalidated = await timed_import(fetcher, urls)
+        await fetcher.aclose()
+    return {"cold": cold, "cache_fresh": fresh, "etag_revalidated": revalidated}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--urls", type=int, default=500)
+    parser.add_argument("--hosts", type=int, default=5)
+    parser.add_argument("--per-host", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    args = parser.parse_args()
+
+    servers = []
+    for _ in range(args.hosts):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(args.latency_ms / 1000))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+
+    urls = [
+        f"http://127.0.0.1:{servers[i % args.hosts].server_port}/jobs/{i}"
+        for i in range(args.urls)
+    ]
+    try:
+        print(json.dumps({"urls": args.urls, "hosts": args.hosts, **asyncio.run(run(urls, args.per_host))}))
+    finally:
+        for server in servers:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
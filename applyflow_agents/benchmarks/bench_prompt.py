@@ -0,0 +1,104 @@
+"""Compare ApplicationTracking prompt size (and optionally latency) across revisions.
+
+Instructions are read from source with ``ast`` so ADK need not be installed.
+Token counts are estimated at ~4 characters per token unless --live is given,
+in which case Gemini's count_tokens and generate_content are used.
+
+Usage (from applyflow_agents/):
+    python -m benchmarks.bench_prompt --baseline-rev <old commit>
+    python -m benchmarks.bench_prompt --baseline-rev <old commit> --live --calls 5
+"""
+
+import argparse
+import ast
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import storage.applications
+from benchmarks.bench_application_store import make_row
+from storage.applications import ApplicationStore
+
+AGENT_DIR = os.path.join(os.path.dirname(__file__), "..", "application_agent")
+AGENT_PATH = "applyflow_agents/application_agent/application_agent.py"
+
+
+def extract_instruction(source: str) -> str:
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Call) and getattr(node.func, "id", None) == "LlmAgent":
+            for keyword in node.keywords:
+                if keyword.arg == "instruction":
+                    return ast.literal_eval(keyword.value)
+    raise ValueError("No LlmAgent instruction found")
+
+
+def read_revision(rev: str) -> str:
+    return subprocess.run(
+        ["git", "show", f"{rev}:{AGENT_PATH}"], capture_output=True, text=True, check=True
+    ).stdout
+
+
+async def render_current(rows: int) -> str:
+    """Render the current instruction with a context summary for a user with ``rows`` applications."""
+    # Agent modules import their tools as a top-level "tools" package
+    sys.path.insert(0, AGENT_DIR)
+    from tools.application_tools import build_application_context
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = storage.applications._store = ApplicationStore(os.path.join(tmp, "bench.db"))
+        await store.add_many("bench_user", [make_row(i) for i in range(rows)])
+        context = await build_application_context("bench_user")
+        store.close()
+
+    with open(os.path.join(AGENT_DIR, "application_agent.py")) as f:
+        instruction = extract_instruction(f.read())
+    return instruction.replace("{application_context?}", context)
+
+
+def live_stats(prompt: str, calls: int) -> dict:
+    from google import genai
+
+    client = genai.Client()
+    tokens = client.models.count_tokens(model="gemini-2.5-flash", contents=prompt).total_tokens
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        client.models.generate_content(
+            model="gemini-2.5-flash",
+            contents="Which of my applications are interviewing?",
+            config={"system_instruction": prompt},
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+    return {"tokens": tokens, "p50_latency_ms": round(statistics.median(latencies))}
+
+
+def describe(prompt: str, live: bool, calls: int) -> dict:
+    stats = {"chars": len(prompt), "estimated_tokens": round(len(prompt) / 4)}
+    if live:
+        stats.update(live_stats(prompt, calls))
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--baseline-rev", required=True, help="Revision with the old instruction")
+    parser.add_argument("--rows", type=int, default=50, help="Applications in the rendered context")
+    parser.add_argument("--live", action="store_true")
+    parser.add_argument("--calls", type=int, default=5)
+    args = parser.parse_args()
+
+    baseline = extract_instruction(read_revision(args.baseline_rev))
+    current = asyncio.run(render_current(args.rows))
+    print(json.dumps({
+        "baseline": describe(baseline, args.live, args.calls),
+        "current": describe(current, args.live, args.calls),
+    }))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""Replay repeated and paraphrased advice questions through the response cache.
+
+Each session asks every question one to three times, in shuffled order and
+with paraphrases mixed in, against a seeded application and resume store;
+a miss stands in for a model turn of --model-turn-ms. Between sessions the
+user adds or updates an application or uploads a resume, which must
+invalidate every cached answer. Reports hit rate, lookup latency, wrong answers (a hit that
+returns the answer to a different question or to stale data) and the
+latency saved. Two tailoring questions whose job descriptions share their
+boilerplate but not their stack are also checked against each other; they
+must never hit.
+
+Usage (from applyflow_agents/):
+    python -m benchmarks.bench_response_cache --sessions 20 --model-turn-ms 3000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from routing.response_cache import ResponseCache
+from storage.applications import ApplicationStore
+from storage.resumes import ResumeStore
+
+USERS = [f"bench_user_{i}" for i in range(20)]
+
+# Each group is one question; the first phrasing is canonical
+QUESTIONS = [
+    ["What is my offer rate?", "what's my offer rate", "What is my offer rate??", "whats my offer rate"],
+    ["What is my rejection rate?", "what's my rejection rate"],
+    ["How many applications have I sent this month?", "how many applications did I send this month?"],
+    ["How many applications did I send in 2023?"],
+    ["How many applications did I send in 2024?"],
+    ["Which companies have not responded?", "which companies haven't responded yet"],
+    ["Which companies have responded?"],
+    ["How can I improve my resume?", "how can I improve my resume", "How do I improve my resume?"],
+    ["What skills are missing from my resume?", "what skills are missing from my resume"],
+    ["Give me tips for my Google interview", "tips for my google interview"],
+    ["Summarize my job search", "summarise my job search?", "give me a summary of my job search"],
+]
+JD_BOILERPLATE = (
+    "We are a fast-growing fintech company looking for a senior backend engineer to join our platform team. "
+    "You will design, build and operate services used by millions of customers, work closely with product "
+    "and design, mentor other engineers and take part in our on-call rotation. We offer a competitive salary, "
+    "equity, flexible remote work, a learning budget and generous parental leave. Requirements: {stack}."
+)
+# Same wording, different entities: an answer for one is wrong for the other
+DISTINCT_JDS = [
+    "How do I tailor my resume for this job? " + JD_BOILERPLATE.format(
+        stack="5+ years of Python, PostgreSQL and AWS (Lambda, ECS, RDS)"),
+    "How do I tailor my resume for this job? " + JD_BOILERPLATE.format(
+        stack="5+ years of Java, Oracle and Azure (Functions, AKS, Cosmos DB)"),
+]
+QUESTIONS += [[jd] for jd in DISTINCT_JDS]
+FOLLOW_UPS = ["and last month?", "what about Stripe?", "thanks!", "ok, do that"]
+
+
+async def seed(applications: ApplicationStore, resumes: ResumeStore) -> None:
+    for user_id in USERS:
+        await applications.add_many(user_id, [
+            {"job_title": f"Engineer {i}", "company": f"Company {i}", "status": "applied"} for i in range(25)
+        ])
+        await resumes.add_bytes(user_id, "resume.txt", f"{user_id} resume".encode())
+
+
+async def run(sessions: int, model_turn_ms: float, ttl: float, seed_value: int) -> dict:
+    rng = random.Random(seed_value)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = os.path.join(tmp, "bench.db")
+        applications = ApplicationStore(db)
+        resumes = ResumeStore(db, os.path.join(tmp, "resumes"))
+        await seed(applications, resumes)
+
+        async def versions(user_id: str) -> tuple[int, ...]:
+            return (await applications.version(user_id), await resumes.version(user_id))
+
+        cache = ResponseCache(ttl=ttl)
+        stamp = await versions(USERS[0])
+        cache.put("resumes", USERS[0], stamp, DISTINCT_JDS[0], "tailoring for the first job")
+        distinct_jd_hit = cache.get("resumes", USERS[0], stamp, DISTINCT_JDS[1]) is not None
+
+        asked = hits = bypassed = wrong = repeats = 0
+        hit_ms, miss_ms, version_ms = [], [], []
+        for session in range(sessions):
+            for user_id in USERS:
+                start = time.perf_counter()
+                stamp = await versions(user_id)
+                version_ms.append((time.perf_counter() - start) * 1000)
+                turns = [
+                    (group, rng.choice(phrasings))
+                    for group, phrasings in enumerate(QUESTIONS)
+                    for _ in range(rng.randint(1, 3))
+                ]
+                repeats += len(turns) - len(QUESTIONS)
+                turns += [(None, text) for text in FOLLOW_UPS]
+                rng.shuffle(turns)
+                for group, text in turns:
+                    asked += 1
+                    if not cache.cacheable(text):
+                        bypassed += 1
+                        continue
+                    answer = f"{user_id}:{stamp}:{group}"
+                    start = time.perf_counter()
+                    cached = cache.get("insights", user_id, stamp, text)
+                    elapsed = (time.perf_counter() - start) * 1000
+                    if cached is not None:
+                        hits += 1
+                        hit_ms.append(elapsed)
+                        wrong += cached != answer
+                    else:
+                        start = time.perf_counter()
+                        cache.put("insights", user_id, stamp, text, answer)
+                        miss_ms.append(elapsed + (time.perf_counter() - start) * 1000)
+
+                # Data changes between sessions invalidate everything for the user
+                change = rng.randrange(3)
+                if change == 0:
+                    await applications.add(user_id, job_title=f"Role {session}", company="Acme", status="applied")
+                elif change == 1:
+                    await applications.update(user_id, (await applications.find(user_id, limit=1))[0]["id"],
+                                              status="interviewing")
+                else:
+                    await resumes.add_bytes(user_id, "resume.txt", f"{user_id} resume {session}".encode())
+
+        applications.close()
+        resumes.close()
+
+    cacheable = asked - bypassed
+    hit_p50 = statistics.median(hit_ms) if hit_ms else 0.0
+    return {
+        "users": len(USERS),
+        "sessions": sessions,
+        "questions": asked,
+        "bypassed": bypassed,
+        "hit_rate": round(hits / cacheable, 3) if cacheable else None,
+        # Every ask after the first of a question in a session could be a hit
+        "max_hit_rate": round(repeats / cacheable, 3) if cacheable else None,
+        "wrong_answers": wrong,
+        # Must be false: long questions only match exactly
+        "distinct_jd_hit": distinct_jd_hit,
+        "entries": len(cache),
+        "hit_p50_ms": round(hit_p50, 4),
+        "miss_p50_ms": round(statistics.median(miss_ms), 4) if miss_ms else None,
+        "version_read_p50_ms": round(statistics.median(version_ms), 4),
+        "model_turn_ms": model_turn_ms,
+        "saved_ms": round(hits * (model_turn_ms - hit_p50), 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--model-turn-ms", type=float, default=3000.0)
+    parser.add_argument("--ttl", type=float, default=600.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.sessions, args.model_turn_ms, args.ttl, args.seed)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
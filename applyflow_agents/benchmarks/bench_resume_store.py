@@ -0,0 +1,98 @@
+"""Benchmark streaming resume uploads: throughput, dedup and peak memory.
+
+Uploads synthetic multi-MB PDFs in 64 KiB chunks, the way request bodies
+arrive, and checks with tracemalloc that peak memory stays near one chunk
+rather than growing with the file. The stored blob is verified through a
+memory map.
+
+Usage (from applyflow_agents/):
+    python -m benchmarks.bench_resume_store --sizes-mb 2 8 32
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.bench_application_store import USER_ID
+from storage.resumes import ResumeStore
+
+BODY_CHUNK = 64 * 1024
+
+
+def make_pdf(path: str, size: int) -> None:
+    with open(path, "wb") as out:
+        out.write(b"%PDF-1.7\n")
+        remaining = size - 9
+        while remaining > 0:
+            block = os.urandom(min(remaining, 1024 * 1024))
+            out.write(block)
+            remaining -= len(block)
+
+
+async def read_body(path: str):
+    """Yield a file in request-body sized chunks, like Request.stream()."""
+    with open(path, "rb") as source:
+        while chunk := source.read(BODY_CHUNK):
+            yield chunk
+
+
+async def run(size_mb: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ResumeStore(
+            os.path.join(tmp, "bench.db"), os.path.join(tmp, "resumes"), max_bytes=size_mb * 1024 * 1024
+        )
+        source = os.path.join(tmp, "resume.pdf")
+        make_pdf(source, size_mb * 1024 * 1024)
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        first = await store.add(USER_ID, "resume.pdf", read_body(source))
+        upload = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        second = await store.add(USER_ID, "resume-copy.pdf", read_body(source))
+        duplicate = time.perf_counter() - start
+
+        with open(store.blob_path(first["sha256"]), "rb") as blob, \
+                mmap.mmap(blob.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            assert hashlib.sha256(mapped).hexdigest() == first["sha256"]
+        blobs = sum(len(files) for _, _, files in os.walk(store.blobs))
+
+        await store.delete(USER_ID, first["id"])
+        assert store.blob_path(first["sha256"]).exists()
+        await store.delete(USER_ID, second["id"])
+        assert not store.blob_path(first["sha256"]).exists()
+        store.close()
+
+    return {
+        "size_mb": size_mb,
+        "upload_ms": round(upload * 1000, 2),
+        "upload_mb_per_s": round(size_mb / upload, 1),
+        "duplicate_upload_ms": round(duplicate * 1000, 2),
+        "deduplicated": second["deduplicated"],
+        "blobs_stored": blobs,
+        "peak_traced_kib": round(peak / 1024, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes-mb", type=int, nargs="+", default=[2, 8, 32])
+    args = parser.parse_args()
+    for size_mb in args.sizes_mb:
+        result = asyncio.run(run(size_mb))
+        print(json.dumps(result))
+        # Memory must not scale with the file size
+        assert result["peak_traced_kib"] < 1024, "upload buffered the whole file"
+
+
+if __name__ == "__main__":
+    main()
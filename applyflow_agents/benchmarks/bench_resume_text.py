@@ -0,0 +1,116 @@
+"""Benchmark resume advice latency with a cold and a warm text cache.
+
+Cold: the first advice request after upload, which waits for extraction on
+the process pool. Warm: later requests served from the cached text. The
+baseline re-parses the file on every request, as the tools did before.
+
+Usage (from applyflow_agents/):
+    python -m benchmarks.bench_resume_text --pages 10
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+import zipfile
+from xml.sax.saxutils import escape
+
+from benchmarks.bench_application_store import USER_ID
+from ingest.ats import score_resume
+from ingest.resume_text import ResumeTextIndex, extract_resume
+from storage.resumes import ResumeStore
+
+DOCX_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+JOB_DESCRIPTION = """Senior backend engineer to design Python services on Kubernetes. You will own
+PostgreSQL data models, build streaming pipelines with Kafka, and mentor engineers. Experience
+with FastAPI, observability, Terraform and AWS is a plus."""
+
+
+def resume_lines(pages: int) -> list[str]:
+    lines = ["Jordan Example", "jordan@example.com", "Summary", "Backend engineer focused on Python services."]
+    for page in range(pages):
+        lines.append("Experience")
+        for bullet in range(20):
+            lines.append(
+                f"Built Python and FastAPI services handling {bullet * 1000 + page} requests per second, "
+                "with PostgreSQL, Redis and Docker deployments monitored through Prometheus."
+            )
+    lines += ["Skills", "Python, FastAPI, PostgreSQL, Docker, Redis, Prometheus", "Education", "BSc Computer Science"]
+    return lines
+
+
+def write_docx(path: str, lines: list[str]) -> None:
+    body = "".join(f"<w:p><w:r><w:t>{escape(line)}</w:t></w:r></w:p>" for line in lines)
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{body}</w:body></w:document>"
+    )
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("word/document.xml", document)
+
+
+async def timed_ms(make_coro, iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await make_coro()
+        samples.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+async def run(pages: int, iterations: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ResumeStore(os.path.join(tmp, "bench.db"), os.path.join(tmp, "resumes"))
+        index = ResumeTextIndex(store, workers=1)
+
+        path = os.path.join(tmp, "resume.docx")
+        write_docx(path, resume_lines(pages))
+        with open(path, "rb") as source:
+            resume = await store.add_bytes(USER_ID, "resume.docx", source.read(), DOCX_TYPE)
+        blob = str(store.blob_path(resume["sha256"]))
+
+        # Same work as get_resume_advice: look up the resume, get its text, score it
+        async def advice():
+            record = await store.get(USER_ID, resume["id"])
+            score_resume(JOB_DESCRIPTION, (await index.get(record))["text"])
+
+        async def reparse():
+            record = await store.get(USER_ID, resume["id"])
+            extracted = await asyncio.to_thread(extract_resume, blob, record["content_type"])
+            score_resume(JOB_DESCRIPTION, extracted["text"])
+
+        # Start the worker process first so cold latency is extraction, not spawn
+        await asyncio.get_running_loop().run_in_executor(index._get_executor(), os.getpid)
+
+        start = time.perf_counter()
+        await advice()
+        cold = (time.perf_counter() - start) * 1000
+
+        result = {
+            "pages": pages,
+            "file_kib": round(os.path.getsize(path) / 1024, 1),
+            "cold_advice_ms": round(cold, 3),
+            "warm_advice_ms": await timed_ms(advice, iterations),
+            "reparse_advice_ms": await timed_ms(reparse, iterations),
+        }
+        index.close()
+        store.close()
+        return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[2, 10])
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    for pages in args.pages:
+        print(json.dumps(asyncio.run(run(pages, args.iterations))))
+
+
+if __name__ == "__main__":
+    main()
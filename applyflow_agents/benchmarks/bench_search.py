@@ -0,0 +1,107 @@
+"""Benchmark application search latency at 100k rows per user.
+
+Measures index build time, query latency for keyword, filtered and
+filter-only searches (with and without embeddings), and the cost of keeping
+the index current on writes.
+
+Usage (from applyflow_agents/):
+    python -m benchmarks.bench_search --rows 100000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.bench_application_store import USER_ID, percentile
+from storage.applications import ApplicationStore
+from storage.search import ApplicationSearchIndex
+
+TITLES = [
+    "Backend Engineer", "Senior Backend Engineer", "Frontend Developer", "Data Scientist",
+    "Machine Learning Engineer", "Product Manager", "DevOps Engineer", "Full Stack Developer",
+    "Site Reliability Engineer", "Data Engineer", "Mobile Developer", "Engineering Manager",
+]
+CITIES = ["Chicago", "New York", "San Francisco", "Austin", "Seattle", "Boston", "Remote"]
+STATUSES = ["applied", "interviewing", "offer", "rejected", "ghosted"]
+DESCRIPTION_WORDS = (
+    "python go java kubernetes postgres kafka react typescript aws gcp terraform docker "
+    "microservices distributed systems api design ownership mentoring startup fintech healthcare"
+).split()
+
+QUERIES = {
+    "keyword": {"query": "backend engineer"},
+    "keyword_filtered": {
+        "query": "backend", "location": "Chicago",
+        "applied_after": "2024-09-01", "applied_before": "2024-11-30",
+    },
+    "description_term": {"query": "kafka fintech"},
+    "filter_only": {"status": "interviewing", "company": "Company 42"},
+}
+
+
+def make_row(i: int, rng: random.Random) -> dict:
+    return {
+        "id": f"app{i}",
+        "job_title": TITLES[i % len(TITLES)],
+        "company": f"Company {i % 4999}",
+        "location": CITIES[i % len(CITIES)],
+        "status": STATUSES[i % len(STATUSES)],
+        "notes": "referral from a friend" if i % 17 == 0 else None,
+        "job_description": " ".join(rng.choices(DESCRIPTION_WORDS, k=40)),
+        "created_at": f"2024-{1 + i % 11:02d}-{1 + i % 28:02d}T00:00:00Z",
+    }
+
+
+def run(rows: int, iterations: int, embedding_dim: int) -> dict:
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ApplicationStore(os.path.join(tmp, "bench.db"))
+        for offset in range(0, rows, 10_000):
+            asyncio.run(store.add_many(
+                USER_ID, [make_row(i, rng) for i in range(offset, min(rows, offset + 10_000))]
+            ))
+        search = ApplicationSearchIndex(store, embedding_dim=embedding_dim)
+
+        start = time.perf_counter()
+        search.get(USER_ID)
+        result = {"rows": rows, "embedding_dim": embedding_dim, "build_s": round(time.perf_counter() - start, 2)}
+
+        for name, params in QUERIES.items():
+            samples = []
+            for _ in range(iterations):
+                start = time.perf_counter()
+                hits = search.search(USER_ID, limit=20, **params)
+                samples.append((time.perf_counter() - start) * 1000)
+            result[name] = {
+                "p50_ms": round(percentile(samples, 50), 3),
+                "p95_ms": round(percentile(samples, 95), 3),
+                "hits": len(hits),
+            }
+
+        samples = []
+        for i in range(iterations):
+            start = time.perf_counter()
+            asyncio.run(store.update(USER_ID, f"app{i}", notes="recruiter called back"))
+            samples.append((time.perf_counter() - start) * 1000)
+        result["update_with_index_p50_ms"] = round(percentile(samples, 50), 3)
+        assert search.search(USER_ID, "recruiter called back", limit=iterations)
+        store.close()
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--embedding-dim", type=int, nargs="+", default=[0, 64])
+    args = parser.parse_args()
+    for dim in args.embedding_dim:
+        print(json.dumps(run(args.rows, args.iterations, dim), indent=2))
+
+
+if __name__ == "__main__":
+    main()
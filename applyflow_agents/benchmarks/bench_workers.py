@@ -0,0 +1,198 @@
+"""Throughput from 1 to N worker processes sharing one set of SQLite stores.
+
+The default mode runs an agent turn's storage work in each worker process:
+fetch the session (checked against its shared version), append the user
+and model events, read the application context version, list and search
+applications and compute success rates, plus --cpu-ms of busy work
+standing in for request handling. Every turn picks a random session, so
+consecutive turns of a conversation land on different workers, as with
+routing that has no sticky sessions. A small share of turns update an
+application, which the other workers' caches must notice. After each run
+the stores are checked: every session must hold every event appended to it
+and every worker's state keys.
+
+--http instead starts benchmarks.serve_fake with N workers for each N and
+drives it with backend/benchmarks/loadtest.py (needs uvicorn and ADK).
+
+Speedup is bounded by the CPUs available, reported as "cpus"; on fewer
+CPUs than workers the run checks consistency and overhead, not scaling.
+
+Usage (from applyflow_agents/):
+    python -m benchmarks.bench_workers --workers 1 2 4 8 --seconds 10
+    python -m benchmarks.bench_workers --workers 1 2 4 --http --requests 2000
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+APP_NAME = "application_agent"
+USERS = 50
+SESSIONS = 500
+LOADTEST_DIR = Path(__file__).resolve().parent.parent.parent / "backend"
+
+
+def session_key(index: int) -> tuple[str, str]:
+    return f"user_{index % USERS}", f"session_{index}"
+
+
+def busy(ms: float) -> None:
+    deadline = time.perf_counter() + ms / 1000
+    while time.perf_counter() < deadline:
+        pass
+
+
+async def worker_turns(data_dir: str, worker: int, args, start_at: float) -> dict:
+    from storage.analytics import AnalyticsStore
+    from storage.applications import ApplicationStore
+    from storage.search import ApplicationSearchIndex
+    from storage.sessions import SessionStore
+
+    applications = ApplicationStore(os.path.join(data_dir, "applyflow.db"), shared=True)
+    analytics = AnalyticsStore(applications)
+    search = ApplicationSearchIndex(applications, embedding_dim=0)
+    sessions = SessionStore(os.path.join(data_dir, "sessions.db"), memory=(8 * 1024 * 1024, {}), shared=True)
+    rng = random.Random(worker)
+    appended: dict[str, int] = {}
+    turns = 0
+
+    await asyncio.sleep(max(0.0, start_at - time.time()))
+    deadline = time.perf_counter() + args.seconds
+    while time.perf_counter() < deadline:
+        user_id, session_id = session_key(rng.randrange(SESSIONS))
+        session = await sessions.get(APP_NAME, user_id, session_id)
+        await applications.version(user_id)
+        await applications.find(user_id, limit=20)
+        analytics.success_rate(user_id)
+        search.search(user_id, "engineer", limit=5)
+        if rng.random() < args.write_rate:
+            app = (await applications.find(user_id, limit=1))[0]
+            await applications.update(user_id, app["id"], status=rng.choice(("applied", "interviewing")))
+        busy(args.cpu_ms)
+        for author in ("user", "model"):
+            count = appended.get(session_id, 0) + 1
+            delta = {f"worker_{worker}": count}
+            event = {"author": author, "timestamp": time.time(), "text": "turn " * 20, "stateDelta": delta}
+            session["events"].append(event)
+            session["state"].update(delta)
+            await sessions.append_event(APP_NAME, user_id, session_id, event, delta, event["timestamp"])
+            appended[session_id] = count
+        turns += 1
+
+    sessions.close()
+    applications.close()
+    return {"turns": turns, "appended": appended}
+
+
+def run_worker(data_dir: str, worker: int, args, start_at: float, results) -> None:
+    results.put((worker, asyncio.run(worker_turns(data_dir, worker, args, start_at))))
+
+
+def seed(data_dir: str) -> None:
+    from storage.applications import ApplicationStore
+    from storage.sessions import SessionStore
+
+    applications = ApplicationStore(os.path.join(data_dir, "applyflow.db"))
+    sessions = SessionStore(os.path.join(data_dir, "sessions.db"))
+
+    async def fill() -> None:
+        for user in range(USERS):
+            await applications.add_many(f"user_{user}", [
+                {"job_title": f"Engineer {i}", "company": f"Company {i % 7}", "status": "applied"}
+                for i in range(40)
+            ])
+        for index in range(SESSIONS):
+            user_id, session_id = session_key(index)
+            await sessions.create(APP_NAME, user_id, session_id=session_id)
+
+    asyncio.run(fill())
+    applications.close()
+    sessions.close()
+
+
+def verify(data_dir: str, results: dict[int, dict]) -> list[str]:
+    """Check that no worker's events or state keys were lost."""
+    import sqlite3
+
+    conn = sqlite3.connect(os.path.join(data_dir, "sessions.db"))
+    errors = []
+    for index in range(SESSIONS):
+        _, session_id = session_key(index)
+        expected = sum(result["appended"].get(session_id, 0) for result in results.values())
+        events = conn.execute("SELECT COUNT(*) FROM session_events WHERE session_id = ?", (session_id,)).fetchone()[0]
+        state = json.loads(conn.execute("SELECT state FROM sessions WHERE id = ?", (session_id,)).fetchone()[0])
+        if events != expected:
+            errors.append(f"{session_id}: {events} events, expected {expected}")
+        for worker, result in results.items():
+            if result["appended"].get(session_id) and state.get(f"worker_{worker}") != result["appended"][session_id]:
+                errors.append(f"{session_id}: worker_{worker} state lost")
+    conn.close()
+    return errors
+
+
+def run_stores(workers: int, args) -> dict:
+    with tempfile.TemporaryDirectory() as data_dir:
+        seed(data_dir)
+        context = multiprocessing.get_context("spawn")
+        results = context.Queue()
+        start_at = time.time() + 2.0  # after every worker has imported and opened its stores
+        processes = [
+            context.Process(target=run_worker, args=(data_dir, worker, args, start_at, results))
+            for worker in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        collected = dict(results.get() for _ in processes)
+        for process in processes:
+            process.join()
+        errors = verify(data_dir, collected)
+    turns = sum(result["turns"] for result in collected.values())
+    return {"turns_per_s": round(turns / args.seconds, 1), "consistency_errors": len(errors), "examples": errors[:3]}
+
+
+def run_http(workers: int, args) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, "report.json")
+        subprocess.run([
+            sys.executable, "-m", "benchmarks.loadtest", "--service", "agents", "--workers", str(workers),
+            "--concurrency", str(args.concurrency), "--requests", str(args.requests), "--output", output,
+        ], cwd=LOADTEST_DIR, check=True, stdout=subprocess.DEVNULL)
+        report = json.loads(Path(output).read_text())
+    return {name: scenario["rps"] for name, scenario in report["scenarios"].items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--cpu-ms", type=float, default=2.0, help="busy work per turn standing in for request handling")
+    parser.add_argument("--write-rate", type=float, default=0.05)
+    parser.add_argument("--http", action="store_true", help="load test the service through serve_fake")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    results = {}
+    for workers in args.workers:
+        results[workers] = run_http(workers, args) if args.http else run_stores(workers, args)
+        print(f"{workers} workers: {json.dumps(results[workers])}", file=sys.stderr)
+
+    base = results[args.workers[0]]
+    if not args.http:
+        for workers, result in results.items():
+            ratio = result["turns_per_s"] / base["turns_per_s"] if base["turns_per_s"] else 0.0
+            result["speedup"] = round(ratio, 2)
+            result["efficiency"] = round(ratio * args.workers[0] / workers, 2)
+    print(json.dumps({"cpus": os.cpu_count(), "mode": "http" if args.http else "stores", "workers": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
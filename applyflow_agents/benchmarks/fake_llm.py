@@ -0,0 +1,62 @@
+"""Scripted stand-in for Gemini, so agents can be load-tested offline.
+
+Replies echo the latest user message after an optional delay, streamed in
+word chunks when the run asks for streaming. No tools are called, so runs
+measure the service and ADK overhead rather than the model.
+"""
+
+import asyncio
+from typing import AsyncGenerator
+
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+
+class ScriptedLlm(BaseLlm):
+    model: str = "scripted"
+    first_token_delay: float = 0.0
+    chunk_delay: float = 0.0
+    chunk_words: int = 4
+
+    @classmethod
+    def supported_models(cls) -> list[str]:
+        return [r"scripted"]
+
+    def _reply(self, llm_request: LlmRequest) -> str:
+        for content in reversed(llm_request.contents):
+            if content.role == "user":
+                text = " ".join(part.text for part in content.parts or [] if part.text)
+                if text:
+                    return f"You said: {text}"
+        return "How can I help with your job search?"
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        reply = self._reply(llm_request)
+        if self.first_token_delay:
+            await asyncio.sleep(self.first_token_delay)
+        if stream:
+            words = reply.split(" ")
+            for i in range(0, len(words), self.chunk_words):
+                chunk = " ".join(words[i:i + self.chunk_words])
+                if i + self.chunk_words < len(words):
+                    chunk += " "
+                yield LlmResponse(content=types.Content(role="model", parts=[types.Part(text=chunk)]), partial=True)
+                if self.chunk_delay:
+                    await asyncio.sleep(self.chunk_delay)
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[types.Part(text=reply)]),
+            partial=False,
+            turn_complete=True,
+        )
+
+
+def use_scripted_llm(agents, **options) -> None:
+    """Swap the model of each agent and its sub-agents for a ScriptedLlm."""
+    for agent in agents:
+        if hasattr(agent, "model"):
+            agent.model = ScriptedLlm(**options)
+        use_scripted_llm(getattr(agent, "sub_agents", []), **options)
@@ -0,0 +1,65 @@
+"""Serve main:app with every agent on the scripted model, for offline load tests.
+
+Application data, resumes, sessions and caches go to a temporary directory
+unless the APPLYFLOW_* paths are already set. With --workers N, N server
+processes share that directory, as in the service's multi-worker mode.
+
+Usage (from applyflow_agents/):
+    python -m benchmarks.serve_fake --port 8000 --first-token-delay 0.2
+    python -m benchmarks.serve_fake --port 8000 --workers 4
+"""
+
+import argparse
+import os
+import tempfile
+
+# Scripted model options reach worker processes through the environment
+OPTIONS = {
+    "first_token_delay": ("APPLYFLOW_FAKE_FIRST_TOKEN_DELAY", float),
+    "chunk_delay": ("APPLYFLOW_FAKE_CHUNK_DELAY", float),
+    "chunk_words": ("APPLYFLOW_FAKE_CHUNK_WORDS", int),
+}
+
+
+def create_app():
+    """Build the app on the scripted model; run in each worker process."""
+    import main as service
+    from benchmarks.fake_llm import use_scripted_llm
+
+    options = {name: kind(os.environ[env]) for name, (env, kind) in OPTIONS.items() if env in os.environ}
+    use_scripted_llm(
+        (service.application_tracking_agent, service.resume_support_agent, service.insights_agent), **options
+    )
+    return service.app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--first-token-delay", type=float, default=0.0)
+    parser.add_argument("--chunk-delay", type=float, default=0.0)
+    parser.add_argument("--chunk-words", type=int, default=4)
+    args = parser.parse_args()
+
+    # Storage paths are read at import time, so set them before importing the app
+    data_dir = tempfile.mkdtemp(prefix="applyflow-load-")
+    os.environ.setdefault("APPLYFLOW_DB_PATH", os.path.join(data_dir, "applyflow.db"))
+    os.environ.setdefault("APPLYFLOW_SESSION_DB_PATH", os.path.join(data_dir, "sessions.db"))
+    os.environ.setdefault("APPLYFLOW_RESUME_DIR", os.path.join(data_dir, "resumes"))
+    os.environ.setdefault("APPLYFLOW_CACHE_DIR", os.path.join(data_dir, "cache"))
+    os.environ["APPLYFLOW_WORKERS"] = str(args.workers)
+    for name, (env, _) in OPTIONS.items():
+        os.environ[env] = str(getattr(args, name))
+
+    import uvicorn
+
+    uvicorn.run(
+        "benchmarks.serve_fake:create_app", factory=True, host=args.host, port=args.port,
+        workers=args.workers, log_level="warning",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Soak the session store: many sessions, a few turns each, old ones revisited.
+
+Sessions are created across the three agents and each gets --turns
+events shaped like ADK model and tool events. A share of turns
+(--revisit) go to a random earlier session, which has usually been
+evicted and is read back from disk. Process RSS is sampled as sessions
+accumulate; with a bounded hot set it should level off once the budget
+is full, while --memory-mb 0 (unbounded) grows with the session count.
+
+Usage (from applyflow_agents/):
+    python -m benchmarks.soak_sessions --sessions 50000 --memory-mb 8
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+from collections import deque
+
+from storage.sessions import SESSION_LOADS, SessionStore
+
+AGENTS = ("application_agent", "resume_agent", "insights_agent")
+USERS = 2000
+
+
+def rss_mb() -> float:
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def make_event(rng: random.Random, turn: int, invocation: str) -> dict:
+    author = "user" if turn % 2 == 0 else "model"
+    words = " ".join(rng.choice(("offer", "interview", "resume", "google", "applied", "status", "role"))
+                     for _ in range(rng.randint(20, 80)))
+    return {
+        "id": f"{invocation}-{turn}",
+        "invocationId": invocation,
+        "author": author,
+        "timestamp": time.time(),
+        "content": {"role": author, "parts": [{"text": words}]},
+        "actions": {"stateDelta": {"last_turn": turn}} if author == "model" else {},
+    }
+
+
+def session_key(index: int) -> tuple[str, str, str]:
+    """Agent, user and id of the index-th session; derived so the soak itself holds nothing per session."""
+    return AGENTS[index % len(AGENTS)], f"user_{index % USERS}", f"session_{index}"
+
+
+async def turn(store: SessionStore, index: int, rng: random.Random, timings: dict) -> None:
+    app_name, user_id, session_id = session_key(index)
+    from_memory = SESSION_LOADS.value(app_name, "memory")
+    start = time.perf_counter()
+    live = await store.get(app_name, user_id, session_id)
+    elapsed = (time.perf_counter() - start) * 1000
+    timings["memory" if SESSION_LOADS.value(app_name, "memory") > from_memory else "disk"].append(elapsed)
+    event = make_event(rng, len(live["events"]), session_id)
+    live["events"].append(event)
+    live["state"].update(event["actions"].get("stateDelta", {}))
+    start = time.perf_counter()
+    await store.append_event(
+        app_name, user_id, session_id, event, event["actions"].get("stateDelta"), event["timestamp"]
+    )
+    timings["append"].append((time.perf_counter() - start) * 1000)
+
+
+async def run(sessions: int, turns: int, revisit: float, memory_mb: float, samples: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    # 0 means no bound: everything stays in memory, as with ADK's in-memory service
+    budget = int(memory_mb * 1024 * 1024) if memory_mb > 0 else 1 << 62
+    # Recent timings only, so the soak's own bookkeeping stays flat too
+    timings = {kind: deque(maxlen=20_000) for kind in ("memory", "disk", "append")}
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SessionStore(os.path.join(tmp, "sessions.db"), memory=(budget, {}))
+        rss: list[tuple[int, float]] = []
+        every = max(1, sessions // samples)
+        start = time.perf_counter()
+        for index in range(sessions):
+            app_name, user_id, session_id = session_key(index)
+            await store.create(app_name, user_id, {"source": "soak"}, session_id)
+            for _ in range(turns):
+                target = rng.randrange(index + 1) if rng.random() < revisit else index
+                await turn(store, target, rng, timings)
+            if (index + 1) % every == 0:
+                gc.collect()
+                rss.append((index + 1, round(rss_mb(), 1)))
+        elapsed = time.perf_counter() - start
+        db_mb = sum(os.path.getsize(os.path.join(tmp, f)) for f in os.listdir(tmp)) / 2**20
+        hot = {app: store.hot_sessions(app) for app in AGENTS}
+        hot_mb = round(sum(store.hot_bytes(app) for app in AGENTS) / 2**20, 1)
+        store.close()
+
+    # Growth over the second half, after the hot set has filled
+    half = rss[len(rss) // 2:]
+    per_10k = (half[-1][1] - half[0][1]) / max(1, half[-1][0] - half[0][0]) * 10_000 if len(half) > 1 else 0.0
+
+    def p(values: deque, q: float) -> float | None:
+        return round(sorted(values)[int(len(values) * q) - 1], 3) if values else None
+
+    return {
+        "sessions": sessions,
+        "turns_per_session": turns,
+        "memory_mb_per_agent": memory_mb or None,
+        "elapsed_s": round(elapsed, 1),
+        "turns_per_s": round(sessions * turns / elapsed),
+        "rss_mb": rss,
+        "rss_growth_mb_per_10k_sessions": round(per_10k, 2),
+        "hot_sessions": hot,
+        "hot_encoded_mb": hot_mb,
+        "db_mb": round(db_mb, 1),
+        "loads": {source: sum(SESSION_LOADS.value(app, source) for app in AGENTS) for source in ("memory", "disk")},
+        "get_memory_p50_ms": round(statistics.median(timings["memory"]), 3) if timings["memory"] else None,
+        "get_disk_p50_ms": round(statistics.median(timings["disk"]), 3) if timings["disk"] else None,
+        "get_disk_p99_ms": p(timings["disk"], 0.99),
+        "append_p50_ms": round(statistics.median(timings["append"]), 3),
+        "append_p99_ms": p(timings["append"], 0.99),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=50_000)
+    parser.add_argument("--turns", type=int, default=4)
+    parser.add_argument("--revisit", type=float, default=0.1, help="share of turns sent to an earlier session")
+    parser.add_argument("--memory-mb", type=float, default=8.0, help="hot set budget per agent; 0 for unbounded")
+    parser.add_argument("--samples", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    result = asyncio.run(run(args.sessions, args.turns, args.revisit, args.memory_mb, args.samples, args.seed))
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
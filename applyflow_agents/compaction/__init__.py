@@ -0,0 +1 @@
+from .history import HistoryCompactor, enable_compaction
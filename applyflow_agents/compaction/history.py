@@ -0,0 +1,243 @@
+"""History Compaction - Cap the conversation history sent to the model each turn.
+
+After a turn finishes, a background task estimates how many tokens the
+session's uncompacted history adds to every request. Past the threshold,
+everything before the last few user turns is folded into a rolling summary
+kept in session state, along with the number of leading events it covers.
+Before each model call those events are dropped from the request and the
+summary is added to the system instruction instead, so recent turns, with
+their tool calls and results, still reach the model verbatim. A request
+whose contents cannot be lined up with the session's events is sent
+unchanged.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Mapping
+
+from observability.metrics import Counter, Histogram, registry
+from observability.tracing import add_callback
+
+COMPACTION_TOKENS = int(os.getenv("APPLYFLOW_COMPACTION_TOKENS", "6000"))
+KEEP_TURNS = int(os.getenv("APPLYFLOW_COMPACTION_KEEP_TURNS", "4"))
+COMPACTION_MODEL = os.getenv("APPLYFLOW_COMPACTION_MODEL", "gemini-2.5-flash")
+SUMMARY_WORDS = 400
+CHARS_PER_TOKEN = 4
+# Tool payloads are cut to this many characters in the summarizer's input
+TOOL_PAYLOAD_CHARS = 600
+
+SUMMARY_KEY = "conversation_summary"
+SUMMARY_EVENTS_KEY = "conversation_summary_events"
+
+SUMMARY_PROMPT = """Update the running summary of a conversation between a job seeker and an assistant.
+Keep facts the assistant may need later: applications, companies, roles, statuses, resume details,
+decisions, preferences and open requests. Drop small talk. Reply with the summary only, in at most
+{words} words.
+
+Current summary:
+{summary}
+
+New conversation:
+{transcript}"""
+
+COMPACTIONS = registry.register(Counter(
+    "applyflow_compactions_total", "History compactions by outcome.", ["agent", "outcome"]))
+COMPACTION_DURATION = registry.register(Histogram(
+    "applyflow_compaction_duration_seconds", "Background compaction wall time, including the summary call.",
+    ["agent"]))
+HISTORY_TOKENS = registry.register(Histogram(
+    "applyflow_history_tokens", "Estimated history tokens sent per model call, after compaction.", ["agent"],
+    buckets=(500, 1000, 2000, 4000, 8000, 16000, 32000, 64000, 128000)))
+HISTORY_TOKENS_SAVED = registry.register(Counter(
+    "applyflow_history_tokens_saved_total", "Estimated history tokens removed from model calls by compaction.",
+    ["agent"]))
+
+# summarize(previous summary or None, transcript lines) -> new summary
+Summarizer = Callable[[str | None, list[str]], Awaitable[str]]
+
+logger = logging.getLogger(__name__)
+
+
+def _payload(value: Any) -> str:
+    text = json.dumps(value, default=str) if not isinstance(value, str) else value
+    return text if len(text) <= TOOL_PAYLOAD_CHARS else text[:TOOL_PAYLOAD_CHARS] + "..."
+
+
+def part_text(part: Any, limit: bool = False) -> str:
+    if getattr(part, "text", None):
+        return part.text
+    call = getattr(part, "function_call", None)
+    if call is not None:
+        args = _payload(call.args or {}) if limit else json.dumps(call.args or {}, default=str)
+        return f"[called {call.name} {args}]"
+    response = getattr(part, "function_response", None)
+    if response is not None:
+        result = _payload(response.response or {}) if limit else json.dumps(response.response or {}, default=str)
+        return f"[{response.name} returned {result}]"
+    return ""
+
+
+def has_content(event: Any) -> bool:
+    """Whether the event becomes a message in the model request."""
+    return bool(not getattr(event, "partial", False) and event.content and event.content.parts)
+
+
+def content_tokens(content: Any) -> int:
+    return sum(len(part_text(part)) for part in content.parts or []) // CHARS_PER_TOKEN
+
+
+def history_tokens(events: list[Any]) -> int:
+    return sum(content_tokens(event.content) for event in events if has_content(event))
+
+
+def is_user_turn(event: Any) -> bool:
+    return event.author == "user" and has_content(event) and any(
+        getattr(part, "text", None) for part in event.content.parts
+    )
+
+
+def transcript(events: list[Any]) -> list[str]:
+    lines = []
+    for event in events:
+        if has_content(event):
+            text = " ".join(filter(None, (part_text(part, limit=True) for part in event.content.parts)))
+            if text:
+                lines.append(f"{event.author}: {text}")
+    return lines
+
+
+class GeminiSummarizer:
+    """Summarizes with a direct google-genai call, outside any agent session."""
+
+    def __init__(self, model: str = COMPACTION_MODEL, words: int = SUMMARY_WORDS):
+        self.model = model
+        self.words = words
+        self._client = None
+
+    async def __call__(self, summary: str | None, lines: list[str]) -> str:
+        if self._client is None:
+            from google import genai
+            self._client = genai.Client()
+        prompt = SUMMARY_PROMPT.format(words=self.words, summary=summary or "(none)", transcript="\n".join(lines))
+        response = await self._client.aio.models.generate_content(model=self.model, contents=prompt)
+        return (response.text or "").strip()
+
+
+class HistoryCompactor:
+    """Keeps a rolling summary of old events in session state and trims requests to match."""
+
+    def __init__(
+        self,
+        summarize: Summarizer | None = None,
+        threshold: int = COMPACTION_TOKENS,
+        keep_turns: int = KEEP_TURNS,
+    ):
+        self.summarize = summarize or GeminiSummarizer()
+        self.threshold = threshold
+        self.keep_turns = keep_turns
+        self._running: set[str] = set()
+        self._tasks: set[asyncio.Task] = set()
+
+    def plan(self, events: list[Any], state: Mapping[str, Any]) -> int | None:
+        """Index to compact up to, or None while the uncompacted history is under the threshold.
+
+        The cut always falls on a user turn, so a tool call is never
+        separated from its result.
+        """
+        covered = state.get(SUMMARY_EVENTS_KEY, 0)
+        if history_tokens(events[covered:]) <= self.threshold:
+            return None
+        turns = [i for i in range(covered, len(events)) if is_user_turn(events[i])]
+        if len(turns) <= self.keep_turns:
+            return None
+        return turns[-self.keep_turns] if self.keep_turns else len(events)
+
+    async def compact(self, events: list[Any], state: Mapping[str, Any]) -> dict[str, Any] | None:
+        """Summarize events up to the planned cut; returns the state delta to store."""
+        cut = self.plan(events, state)
+        if cut is None:
+            return None
+        covered = state.get(SUMMARY_EVENTS_KEY, 0)
+        summary = await self.summarize(state.get(SUMMARY_KEY), transcript(events[covered:cut]))
+        return {SUMMARY_KEY: summary, SUMMARY_EVENTS_KEY: cut}
+
+    def trim(self, events: list[Any], state: Mapping[str, Any], contents: list[Any]) -> list[Any] | None:
+        """Drop the summarized events' messages from ``contents``; None leaves the request as is."""
+        covered = state.get(SUMMARY_EVENTS_KEY, 0)
+        if not covered or not state.get(SUMMARY_KEY):
+            return None
+        dropped = sum(1 for event in events[:covered] if has_content(event))
+        # Only trim when every event maps to exactly one message, in order
+        if len(contents) != dropped + sum(1 for event in events[covered:] if has_content(event)):
+            return None
+        return contents[dropped:]
+
+    # ADK callbacks
+
+    def before_model(self, callback_context, llm_request) -> None:
+        agent = callback_context.agent_name
+        # The session (with this turn's events so far) is only reachable
+        # through the invocation context
+        session = callback_context._invocation_context.session
+        state = callback_context.state
+        before = sum(content_tokens(content) for content in llm_request.contents)
+        trimmed = self.trim(session.events, state, llm_request.contents)
+        if trimmed is not None:
+            llm_request.contents = trimmed
+            llm_request.append_instructions([f"Summary of the earlier conversation:\n{state[SUMMARY_KEY]}"])
+        after = sum(content_tokens(content) for content in llm_request.contents)
+        HISTORY_TOKENS.observe(agent, value=after)
+        if after < before:
+            HISTORY_TOKENS_SAVED.inc(agent, amount=before - after)
+        return None
+
+    def after_agent(self, callback_context) -> None:
+        # Runs before the run finishes, so the work is handed to a task
+        context = callback_context._invocation_context
+        session = context.session
+        if session.id in self._running:
+            return None
+        self._running.add(session.id)
+        task = asyncio.create_task(self._compact_session(
+            context.session_service, callback_context.agent_name, session.app_name, session.user_id, session.id
+        ))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return None
+
+    async def _compact_session(self, service, agent: str, app_name: str, user_id: str, session_id: str) -> None:
+        from google.adk.events import Event, EventActions
+
+        start = time.perf_counter()
+        try:
+            session = await service.get_session(app_name=app_name, user_id=user_id, session_id=session_id)
+            if session is None:
+                return
+            delta = await self.compact(session.events, session.state)
+            if delta is None:
+                return
+            await service.append_event(session, Event(
+                invocation_id=session.events[-1].invocation_id if session.events else "",
+                author=agent,
+                actions=EventActions(state_delta=delta),
+            ))
+            COMPACTIONS.inc(agent, "compacted")
+            COMPACTION_DURATION.observe(agent, value=time.perf_counter() - start)
+        except Exception:
+            logger.exception("History compaction failed for session %s", session_id)
+            COMPACTIONS.inc(agent, "failed")
+        finally:
+            self._running.discard(session_id)
+
+
+def enable_compaction(agent, compactor: HistoryCompactor) -> None:
+    """Attach compaction callbacks to an LlmAgent, keeping any it already has.
+
+    The request is trimmed before other before-model callbacks run, so
+    tracing records the size actually sent.
+    """
+    add_callback(agent, "before_model_callback", compactor.before_model, first=True)
+    add_callback(agent, "after_agent_callback", compactor.after_agent, first=False)
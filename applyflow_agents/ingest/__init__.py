@@ -0,0 +1,2 @@
+from .job_postings import JobPostingFetcher, get_job_posting_fetcher
+from .parsing import JobPosting, parse_job_posting
@@ -0,0 +1,228 @@
+"""Bulk Application Import - Stream-validate rows and write them in batches."""
+
+import csv
+import io
+import json
+import math
+import os
+import sqlite3
+from typing import Any, AsyncIterable, AsyncIterator, Iterable
+
+from storage.applications import STATUSES, ApplicationStore
+
+BATCH_SIZE = int(os.getenv("APPLYFLOW_IMPORT_BATCH_SIZE", "500"))
+# SQLite INTEGER range
+MAX_PAY = 2**63 - 1
+
+FIELD_ALIASES = {
+    "title": "job_title",
+    "position": "job_title",
+    "role": "job_title",
+    "employer": "company",
+    "salary": "pay",
+    "url": "job_url",
+    "link": "job_url",
+    "description": "job_description",
+    "note": "notes",
+}
+
+
+class InvalidRow(ValueError):
+    """A line that could not be parsed; reported as that row's error."""
+
+
+def _parse_pay(value: Any) -> int | None:
+    if value is None or value == "":
+        return None
+    if isinstance(value, int):
+        pay = value
+    else:
+        if isinstance(value, float):
+            amount = value
+        else:
+            raw = str(value).strip().lower().replace("$", "").replace(",", "").replace(" ", "")
+            amount = float(raw.rstrip("k")) * (1000 if raw.endswith("k") else 1)
+        # "inf", "nan" and JSON numbers like 1e400
+        if not math.isfinite(amount):
+            raise ValueError(f"pay is not a finite number: {value!r}")
+        pay = int(amount)
+    if abs(pay) > MAX_PAY:
+        raise ValueError(f"pay is out of range: {value!r}")
+    return pay
+
+
+def validate_row(raw: dict[str, Any]) -> dict[str, Any]:
+    """
+    Normalize one imported row into application fields.
+
+    Args:
+        raw: A row from CSV or JSON; keys are matched case-insensitively and
+            common aliases (title, employer, salary, url...) are accepted
+
+    Returns:
+        The application fields
+
+    Raises:
+        ValueError: If a required field is missing or a value is invalid
+    """
+    if not isinstance(raw, dict):
+        raise ValueError("Each row must be an object")
+    row = {}
+    for key, value in raw.items():
+        if key is None:
+            continue
+        key = key.strip().lower().replace(" ", "_")
+        key = FIELD_ALIASES.get(key, key)
+        row[key] = value.strip() if isinstance(value, str) else value
+
+    for field in ("job_title", "company"):
+        if not row.get(field):
+            raise ValueError(f"Missing required field: {field}")
+
+    try:
+        pay = _parse_pay(row.get("pay"))
+    except ValueError:
+        raise ValueError(f"Invalid pay: {row.get('pay')!r}") from None
+
+    status = (row.get("status") or "applied").lower()
+    if status not in STATUSES:
+        raise ValueError(f"Invalid status: {status!r}; expected one of {', '.join(STATUSES)}")
+
+    return {
+        "job_title": row["job_title"],
+        "company": row["company"],
+        "pay": pay,
+        "location": row.get("location") or None,
+        "job_url": row.get("job_url") or None,
+        "resume_id": row.get("resume_id") or None,
+        "status": status,
+        "notes": row.get("notes") or None,
+        "job_description": row.get("job_description") or None,
+    }
+
+
+def parse_csv(text: str) -> Iterable[dict[str, Any]]:
+    return csv.DictReader(io.StringIO(text))
+
+
+def parse_json(text: str) -> Iterable[dict[str, Any]]:
+    data = json.loads(text)
+    if isinstance(data, dict):
+        data = data.get("applications", [data])
+    return data
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Split a byte stream into decoded lines without buffering the whole body."""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8-sig").rstrip("\r")
+    if buffer:
+        yield buffer.decode("utf-8-sig").rstrip("\r")
+
+
+async def iter_csv_rows(lines: AsyncIterable[str]) -> AsyncIterator[dict[str, Any]]:
+    """Parse CSV one line at a time; quoted fields may not span lines."""
+    header = None
+    async for line in lines:
+        if not line.strip():
+            continue
+        try:
+            values = next(csv.reader([line]))
+        except csv.Error as e:
+            yield InvalidRow(f"Invalid CSV line: {e}")
+            continue
+        if header is None:
+            header = values
+            continue
+        yield dict(zip(header, values))
+
+
+async def iter_ndjson_rows(lines: AsyncIterable[str]) -> AsyncIterator[dict[str, Any]]:
+    async for line in lines:
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            yield InvalidRow(f"Invalid JSON: {e}")
+
+
+async def _aiter(rows: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]]) -> AsyncIterator[dict[str, Any]]:
+    if hasattr(rows, "__aiter__"):
+        async for row in rows:
+            yield row
+    else:
+        for row in rows:
+            yield row
+
+
+async def import_applications(
+    store: ApplicationStore,
+    user_id: str,
+    rows: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]],
+    batch_size: int = BATCH_SIZE,
+) -> dict[str, Any]:
+    """
+    Validate rows as they arrive and insert valid ones in batched transactions.
+
+    Args:
+        store: The application store
+        user_id: Owner of the imported applications
+        rows: Raw rows, sync or async
+        batch_size: Rows per insert transaction
+
+    Returns:
+        Counts plus a per-row result with the new id or the error. If the
+        input cannot be read to the end, the rows after the failure are
+        reported as one final error; rows before it stay imported.
+    """
+    results: list[dict[str, Any]] = []
+    batch: list[tuple[int, dict[str, Any]]] = []
+
+    async def flush():
+        try:
+            records = await store.add_many(user_id, [fields for _, fields in batch])
+        except sqlite3.Error as e:
+            # The batch rolled back as a whole; earlier batches stay committed
+            for index, _ in batch:
+                results[index] = {"row": index + 1, "status": "error", "error": f"Not saved: {e}"}
+        else:
+            for (index, _), record in zip(batch, records):
+                results[index] = {"row": index + 1, "status": "success", "id": record["id"]}
+        batch.clear()
+
+    index = 0
+    source = _aiter(rows)
+    while True:
+        try:
+            raw = await anext(source)
+        except StopAsyncIteration:
+            break
+        except (ValueError, csv.Error) as e:
+            # The body broke off mid-stream (bad encoding, a malformed JSON
+            # document); everything read so far is still imported below
+            results.append({"row": index + 1, "status": "error", "error": f"Unreadable input: {e}"})
+            break
+        results.append({})
+        try:
+            if isinstance(raw, InvalidRow):
+                raise raw
+            batch.append((index, validate_row(raw)))
+        except (ValueError, AttributeError, TypeError) as e:
+            results[index] = {"row": index + 1, "status": "error", "error": str(e)}
+        if len(batch) >= batch_size:
+            await flush()
+        index += 1
+    if batch:
+        await flush()
+
+    imported = sum(result["status"] == "success" for result in results)
+    return {
+        "imported": imported,
+        "failed": len(results) - imported,
+        "results": results,
+    }
@@ -0,0 +1,316 @@
+"""ATS Matching - Deterministic skill and keyword coverage of a resume against a job.
+
+Both texts are tokenized, normalized and stemmed the same way. Skills are
+found with a token-level Aho-Corasick automaton over a skills dictionary, so
+multi-word and aliased skills ("machine learning", "k8s") are matched in a
+single pass regardless of dictionary size. The result is a compact gap
+report the LLM can work from instead of the two full documents.
+"""
+
+import re
+import unicodedata
+from collections import Counter, deque
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Any, Iterable
+
+from ingest.resume_text import STOPWORDS
+
+# Canonical skill -> aliases; matching is case-insensitive and stemmed. Skills
+# and aliases that are also everyday words ("spring", "node", "containers")
+# only count with a qualifying word next to them
+SKILLS: dict[str, tuple[str, ...]] = {
+    # Languages
+    "python": (),
+    "java": (),
+    "javascript": ("js", "ecmascript"),
+    "typescript": (),
+    "golang": ("go lang",),
+    "rust": (),
+    "c++": ("cpp",),
+    "c#": ("csharp",),
+    "ruby": (),
+    "php": (),
+    "kotlin": (),
+    "swift": (),
+    "scala": (),
+    "sql": (),
+    "bash": ("shell scripting",),
+    "html": ("html5",),
+    "css": ("css3",),
+    # Frameworks and libraries
+    "react": ("react.js", "reactjs"),
+    "angular": ("angularjs",),
+    "vue": ("vue.js", "vuejs"),
+    "node.js": ("nodejs", "node js"),
+    "django": (),
+    "flask": (),
+    "fastapi": (),
+    "spring boot": ("spring framework", "spring mvc", "spring cloud"),
+    "rails": ("ruby on rails",),
+    ".net": ("dotnet", "asp.net"),
+    "pandas": (),
+    "numpy": (),
+    "pytorch": ("torch",),
+    "tensorflow": (),
+    "scikit-learn": ("sklearn",),
+    "spark": ("apache spark", "pyspark"),
+    "graphql": (),
+    # Data stores and messaging
+    "postgresql": ("postgres", "psql"),
+    "mysql": (),
+    "mongodb": ("mongo",),
+    "redis": (),
+    "elasticsearch": ("elastic search", "opensearch"),
+    "kafka": ("apache kafka",),
+    "rabbitmq": (),
+    "snowflake": (),
+    "bigquery": ("big query",),
+    "dynamodb": (),
+    # Cloud and infrastructure
+    "aws": ("amazon web services",),
+    "gcp": ("google cloud", "google cloud platform"),
+    "azure": ("microsoft azure",),
+    "docker": ("containerization",),
+    "kubernetes": ("k8s",),
+    "terraform": (),
+    "ansible": (),
+    "linux": ("unix",),
+    "ci/cd": ("continuous integration", "continuous delivery", "continuous deployment"),
+    "jenkins": (),
+    "github actions": (),
+    "git": (),
+    "prometheus": (),
+    "grafana": (),
+    "observability": (),
+    # Practices and domains
+    "rest apis": ("rest api", "restful"),
+    "microservices": ("microservice architecture",),
+    "distributed systems": (),
+    "machine learning": ("ml",),
+    "deep learning": (),
+    "natural language processing": ("nlp",),
+    "computer vision": (),
+    "data engineering": (),
+    "data analysis": ("data analytics",),
+    "etl": ("data pipelines",),
+    "statistics": (),
+    "system design": (),
+    "agile": ("scrum", "kanban"),
+    "testing": ("unit testing", "test automation", "tdd"),
+    "security": ("application security", "appsec"),
+    # Roles and soft skills
+    "leadership": ("team lead", "tech lead"),
+    "mentoring": ("mentorship",),
+    "communication": (),
+    "project management": (),
+    "product management": (),
+    "stakeholder management": (),
+    "figma": (),
+    "spreadsheets": ("microsoft excel", "google sheets"),
+    "tableau": (),
+    "power bi": ("powerbi",),
+}
+
+TOKEN = re.compile(r"\.?[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+KEYWORD_LIMIT = 15
+SKILL_WEIGHT = 0.7
+
+
+@lru_cache(maxsize=65536)
+def stem(token: str) -> str:
+    """Light suffix stripping so plurals and verb forms match ("services" / "service")."""
+    if len(token) <= 4 or not token.isalpha():
+        return token
+    for suffix, replacement in (("ies", "y"), ("ing", ""), ("ed", ""), ("es", "e"), ("s", "")):
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            if suffix == "s" and token.endswith("ss"):
+                return token
+            return token[: -len(suffix)] + replacement
+    return token
+
+
+def normalize_tokens(text: str) -> list[str]:
+    """Lowercase, unicode-normalize, tokenize and stem; stopwords are kept for phrase matching."""
+    if not text.isascii():
+        text = unicodedata.normalize("NFKC", text)
+    return [stem(token) for token in TOKEN.findall(text.lower())]
+
+
+class SkillMatcher:
+    """Token-level Aho-Corasick automaton over a skills dictionary."""
+
+    def __init__(self, skills: dict[str, Iterable[str]]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[str]] = [[]]
+        for canonical, aliases in skills.items():
+            for phrase in (canonical, *aliases):
+                self._add(normalize_tokens(phrase), canonical)
+        self._build()
+
+    def _add(self, tokens: list[str], canonical: str) -> None:
+        state = 0
+        for token in tokens:
+            if token not in self._goto[state]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][token] = len(self._goto) - 1
+            state = self._goto[state][token]
+        if canonical not in self._output[state]:
+            self._output[state].append(canonical)
+
+    def _build(self) -> None:
+        # Breadth-first so every failure target is finished before it is used
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(token, 0)
+                self._output[child] = self._output[child] + [
+                    skill for skill in self._output[self._fail[child]] if skill not in self._output[child]
+                ]
+
+    def find(self, tokens: Iterable[str]) -> Counter[str]:
+        """Count canonical skill mentions in a normalized token stream."""
+        counts: Counter[str] = Counter()
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for token in tokens:
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for skill in output[state]:
+                counts[skill] += 1
+        return counts
+
+
+@dataclass(frozen=True)
+class TextProfile:
+    """Normalized view of one document."""
+    terms: frozenset[str]
+    skills: Counter[str]
+    keywords: tuple[str, ...]
+    surface: dict[str, str]
+
+
+@dataclass
+class GapReport:
+    score: float
+    skill_coverage: float
+    keyword_coverage: float
+    matched_skills: list[str]
+    missing_skills: list[str]
+    matched_keywords: list[str]
+    missing_keywords: list[str]
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+_matcher: SkillMatcher | None = None
+
+
+def get_skill_matcher() -> SkillMatcher:
+    global _matcher
+    if _matcher is None:
+        _matcher = SkillMatcher(SKILLS)
+    return _matcher
+
+
+def _skill_tokens(skills: dict[str, Iterable[str]]) -> dict[str, frozenset[str]]:
+    return {
+        canonical: frozenset(token for phrase in (canonical, *aliases) for token in normalize_tokens(phrase))
+        for canonical, aliases in skills.items()
+    }
+
+
+# Words of every found skill are reported as the skill, not again as keywords
+SKILL_TOKENS = _skill_tokens(SKILLS)
+
+# Compared with stemmed tokens, so stemmed too ("during" -> "dur")
+STEMMED_STOPWORDS = frozenset(stem(word) for word in STOPWORDS)
+
+# Words common to job postings that say nothing about the role
+FILLER = frozenset(normalize_tokens("""
+experience years year plus strong ability abilities work working role team teams company candidate
+candidates ideal looking join responsibilities requirements required preferred qualifications
+knowledge understanding familiarity skills skill excellent good great new including across
+environment opportunity position job level senior junior
+"""))
+
+
+@lru_cache(maxsize=256)
+def profile_text(text: str, keyword_limit: int = KEYWORD_LIMIT) -> TextProfile:
+    """
+    Tokenize a document once and find its skills and top keywords.
+
+    Cached by text, so scoring one job against many resumes profiles the job
+    a single time and repeat requests for a resume skip tokenization.
+
+    Args:
+        text: The document text
+        keyword_limit: Number of non-skill keywords to keep, most frequent first
+
+    Returns:
+        The document's term set, skill counts and top keywords
+    """
+    text = unicodedata.normalize("NFKC", text)
+    surface: dict[str, str] = {}
+    tokens = []
+    for raw in TOKEN.findall(text.lower()):
+        token = stem(raw)
+        surface.setdefault(token, raw)
+        tokens.append(token)
+
+    skills = get_skill_matcher().find(tokens)
+    excluded = STEMMED_STOPWORDS | FILLER | frozenset().union(*(SKILL_TOKENS[skill] for skill in skills))
+    frequent = Counter(
+        token for token in tokens
+        if len(token) > 2 and token not in excluded and not token.isdigit()
+    )
+    return TextProfile(
+        terms=frozenset(tokens),
+        skills=skills,
+        keywords=tuple(token for token, _ in frequent.most_common(keyword_limit)),
+        surface=surface,
+    )
+
+
+def match(job: TextProfile, resume: TextProfile) -> GapReport:
+    """Score how well a resume covers a job's skills and keywords."""
+    job_skills = sorted(job.skills, key=lambda skill: (-job.skills[skill], skill))
+    matched_skills = [skill for skill in job_skills if skill in resume.skills]
+    matched_keywords = [keyword for keyword in job.keywords if keyword in resume.terms]
+
+    skill_coverage = len(matched_skills) / len(job_skills) if job_skills else 1.0
+    keyword_coverage = len(matched_keywords) / len(job.keywords) if job.keywords else 1.0
+    if job_skills:
+        score = SKILL_WEIGHT * skill_coverage + (1 - SKILL_WEIGHT) * keyword_coverage
+    else:
+        score = keyword_coverage
+    return GapReport(
+        score=round(score, 3),
+        skill_coverage=round(skill_coverage, 3),
+        keyword_coverage=round(keyword_coverage, 3),
+        matched_skills=matched_skills,
+        missing_skills=[skill for skill in job_skills if skill not in resume.skills],
+        matched_keywords=[job.surface[keyword] for keyword in matched_keywords],
+        missing_keywords=[job.surface[keyword] for keyword in job.keywords if keyword not in resume.terms],
+    )
+
+
+def score_resume(job_description: str, resume_text: str) -> GapReport:
+    return match(profile_text(job_description), profile_text(resume_text))
+
+
+def score_resumes(job_description: str, resumes: dict[str, str]) -> list[tuple[str, GapReport]]:
+    """Score one job description against many resumes, best match first."""
+    job = profile_text(job_description)
+    reports = [(resume_id, match(job, profile_text(text))) for resume_id, text in resumes.items()]
+    return sorted(reports, key=lambda item: -item[1].score)
@@ -0,0 +1,193 @@
+"""Job Posting Fetcher - Pooled async fetching with an on-disk ETag cache."""
+
+import asyncio
+import hashlib
+import ipaddress
+import json
+import logging
+import os
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from ingest.parsing import JobPosting, parse_job_posting
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.getenv("APPLYFLOW_CACHE_DIR", ".cache")
+MAX_CONNECTIONS = int(os.getenv("APPLYFLOW_FETCH_MAX_CONNECTIONS", "64"))
+PER_HOST_LIMIT = int(os.getenv("APPLYFLOW_FETCH_PER_HOST", "4"))
+FETCH_TIMEOUT = float(os.getenv("APPLYFLOW_FETCH_TIMEOUT", "10"))
+# Cached postings younger than this are served without revalidating
+CACHE_MAX_AGE = float(os.getenv("APPLYFLOW_FETCH_CACHE_MAX_AGE", "86400"))
+MAX_REDIRECTS = 5
+# Private, loopback and link-local addresses are refused unless this is set,
+# so a model-supplied URL cannot reach internal services
+ALLOW_PRIVATE = os.getenv("APPLYFLOW_FETCH_ALLOW_PRIVATE", "").lower() in ("1", "true", "yes")
+
+USER_AGENT = "ApplyFlow/0.1 (+job application tracker)"
+
+
+class UnsafeURL(ValueError):
+    """The URL is not http(s) or resolves to an address that may not be fetched."""
+
+
+class PostingCache:
+    """Parsed postings on disk, one JSON file per URL."""
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, url: str) -> Path:
+        return self.directory / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+    def get(self, url: str) -> dict[str, Any] | None:
+        try:
+            return json.loads(self._path(url).read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def put(self, url: str, posting: JobPosting, etag: str | None, last_modified: str | None) -> None:
+        self._write(url, {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time(),
+            "posting": posting.to_dict(),
+        })
+
+    def touch(self, url: str, entry: dict[str, Any]) -> None:
+        self._write(url, {**entry, "fetched_at": time.time()})
+
+    def _write(self, url: str, entry: dict[str, Any]) -> None:
+        # Write then rename so concurrent readers never see a partial file
+        path = self._path(url)
+        tmp = path.with_suffix(f".{os.getpid()}.{id(entry)}.tmp")
+        tmp.write_text(json.dumps(entry))
+        tmp.replace(path)
+
+
+class JobPostingFetcher:
+    """Fetches and parses job postings through a shared connection pool.
+
+    Concurrency is bounded globally by the pool size and per host by a
+    semaphore, so bulk imports do not hammer a single job board. Only http(s)
+    URLs whose host resolves to public addresses are fetched, and redirects
+    are followed by hand so every hop is checked the same way.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path = Path(CACHE_DIR) / "job_postings",
+        max_connections: int = MAX_CONNECTIONS,
+        per_host_limit: int = PER_HOST_LIMIT,
+        timeout: float = FETCH_TIMEOUT,
+        cache_max_age: float = CACHE_MAX_AGE,
+        allow_private: bool = ALLOW_PRIVATE,
+    ):
+        self.cache = PostingCache(cache_dir)
+        self.cache_max_age = cache_max_age
+        self.allow_private = allow_private
+        self.per_host_limit = per_host_limit
+        self._host_limits: defaultdict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.per_host_limit)
+        )
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=timeout,
+            follow_redirects=False,
+            headers={"User-Agent": USER_AGENT},
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def _check(self, url: httpx.URL) -> None:
+        if url.scheme not in ("http", "https") or not url.host:
+            raise UnsafeURL(f"Only http(s) URLs can be fetched: {url}")
+        if self.allow_private:
+            return
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(url.host, None)
+        except OSError as e:
+            raise httpx.ConnectError(f"Could not resolve {url.host}: {e}") from e
+        for *_, sockaddr in infos:
+            address = ipaddress.ip_address(sockaddr[0].split("%")[0])
+            if isinstance(address, ipaddress.IPv6Address) and address.ipv4_mapped:
+                address = address.ipv4_mapped
+            if not address.is_global:
+                raise UnsafeURL(f"{url.host} resolves to a non-public address")
+
+    async def _get(self, url: str, headers: dict[str, str]) -> httpx.Response:
+        target = httpx.URL(url)
+        for _ in range(MAX_REDIRECTS + 1):
+            await self._check(target)
+            async with self._host_limits[target.host]:
+                response = await self._client.get(target, headers=headers)
+            if not response.has_redirect_location:
+                return response
+            target = target.join(response.headers["Location"])
+        raise httpx.TooManyRedirects(f"More than {MAX_REDIRECTS} redirects for {url}", request=response.request)
+
+    async def fetch(self, url: str) -> JobPosting:
+        """
+        Fetch and parse one posting, using the cache when it is fresh or unchanged.
+
+        Args:
+            url: The job posting URL
+
+        Returns:
+            The parsed posting; empty when the page could not be parsed
+
+        Raises:
+            httpx.HTTPError: If the page could not be fetched
+            UnsafeURL: If the URL or a redirect points somewhere that may not be fetched
+        """
+        cached = await asyncio.to_thread(self.cache.get, url)
+        if cached and time.time() - cached["fetched_at"] < self.cache_max_age:
+            return JobPosting(**cached["posting"])
+
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = await self._get(url, headers)
+
+        if response.status_code == 304 and cached:
+            await asyncio.to_thread(self.cache.touch, url, cached)
+            return JobPosting(**cached["posting"])
+        response.raise_for_status()
+
+        # Parsing is CPU-bound; keep it off the event loop
+        try:
+            posting = await asyncio.to_thread(parse_job_posting, response.text)
+        except Exception as e:
+            # An empty or mangled page (lxml raises ParserError on an empty
+            # body) just means there is nothing to fill in; not cached
+            logger.warning("Could not parse job posting %s: %s", url, e)
+            return JobPosting()
+        await asyncio.to_thread(
+            self.cache.put, url, posting, response.headers.get("ETag"), response.headers.get("Last-Modified")
+        )
+        return posting
+
+    async def fetch_many(self, urls: list[str]) -> list[JobPosting | Exception]:
+        """Fetch many postings concurrently; failures are returned in place."""
+        return await asyncio.gather(*(self.fetch(url) for url in urls), return_exceptions=True)
+
+
+_fetcher: JobPostingFetcher | None = None
+
+
+def get_job_posting_fetcher() -> JobPostingFetcher:
+    """Return the process-wide fetcher, creating it on first use."""
+    global _fetcher
+    if _fetcher is None:
+        _fetcher = JobPostingFetcher()
+    return _fetcher
@@ -0,0 +1,235 @@
+"""Job Posting Parser - Extract structured fields from job posting HTML."""
+
+import importlib
+import json
+import math
+import re
+from dataclasses import asdict, dataclass
+from typing import Any, Callable
+
+PAY_RANGE = re.compile(
+    r"\$\s?(\d{2,3}(?:,\d{3})+|\d{2,3}(?:\.\d+)?\s?[kK])"
+    r"(?:\s*(?:-|–|—|to)\s*\$?\s?(\d{2,3}(?:,\d{3})+|\d{2,3}(?:\.\d+)?\s?[kK]))?"
+)
+
+
+@dataclass
+class JobPosting:
+    title: str | None = None
+    company: str | None = None
+    location: str | None = None
+    pay_min: int | None = None
+    pay_max: int | None = None
+
+    @property
+    def pay(self) -> int | None:
+        """Single pay figure for an application: the midpoint of the range."""
+        if self.pay_min is None:
+            return self.pay_max
+        if self.pay_max is None:
+            return self.pay_min
+        return (self.pay_min + self.pay_max) // 2
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class PageFields:
+    """Raw pieces of a page that the parser looks at."""
+    ld_json: list[str]
+    meta: dict[str, str]
+    title: str | None
+    h1: str | None
+    text: str
+
+
+def _extract_selectolax(html: str) -> PageFields:
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(html)
+    meta = {
+        (node.attributes.get("property") or node.attributes.get("name") or "").lower(): node.attributes.get("content") or ""
+        for node in tree.css("meta")
+    }
+    title = tree.css_first("title")
+    h1 = tree.css_first("h1")
+    ld_json = [node.text() for node in tree.css('script[type="application/ld+json"]')]
+    for node in tree.css("script, style"):
+        node.decompose()
+    body = tree.body
+    return PageFields(
+        ld_json=ld_json,
+        meta=meta,
+        title=title.text(strip=True) if title else None,
+        h1=h1.text(strip=True) if h1 else None,
+        text=body.text(separator=" ") if body else "",
+    )
+
+
+def _extract_lxml(html: str) -> PageFields:
+    import lxml.html
+
+    tree = lxml.html.fromstring(html)
+    meta = {
+        (node.get("property") or node.get("name") or "").lower(): node.get("content") or ""
+        for node in tree.iter("meta")
+    }
+    ld_json = [node.text or "" for node in tree.xpath('//script[@type="application/ld+json"]')]
+    title = tree.find(".//title")
+    h1 = tree.find(".//h1")
+    for node in tree.xpath("//script|//style"):
+        node.drop_tree()
+    return PageFields(
+        ld_json=ld_json,
+        meta=meta,
+        title=title.text_content().strip() if title is not None else None,
+        h1=h1.text_content().strip() if h1 is not None else None,
+        text=tree.text_content(),
+    )
+
+
+def _extract_bs4(html: str) -> PageFields:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    meta = {
+        (node.get("property") or node.get("name") or "").lower(): node.get("content") or ""
+        for node in soup.find_all("meta")
+    }
+    ld_json = [node.string or "" for node in soup.find_all("script", type="application/ld+json")]
+    title = soup.find("title")
+    h1 = soup.find("h1")
+    for node in soup(["script", "style"]):
+        node.decompose()
+    return PageFields(
+        ld_json=ld_json,
+        meta=meta,
+        title=title.get_text(strip=True) if title else None,
+        h1=h1.get_text(strip=True) if h1 else None,
+        text=soup.get_text(" "),
+    )
+
+
+def _select_extractor() -> Callable[[str], PageFields]:
+    """Use the fastest installed HTML parser."""
+    for module, extractor in (("selectolax.lexbor", _extract_selectolax), ("lxml.html", _extract_lxml)):
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            continue
+        return extractor
+    return _extract_bs4
+
+
+extract_fields = _select_extractor()
+
+
+def _to_pay(value: Any, factor: float = 1) -> int | None:
+    """A pay figure as an int, or None when the value is not a finite number."""
+    try:
+        amount = float(value) * factor
+    except (TypeError, ValueError):
+        return None
+    return int(amount) if math.isfinite(amount) else None
+
+
+def _parse_amount(raw: str) -> int | None:
+    raw = raw.replace(",", "").replace(" ", "")
+    if raw[-1] in "kK":
+        return _to_pay(raw[:-1], 1000)
+    return _to_pay(raw)
+
+
+def _find_job_posting(data: Any) -> dict[str, Any] | None:
+    """Find the first schema.org JobPosting object in decoded JSON-LD."""
+    if isinstance(data, list):
+        for item in data:
+            found = _find_job_posting(item)
+            if found:
+                return found
+    elif isinstance(data, dict):
+        kind = data.get("@type")
+        if kind == "JobPosting" or (isinstance(kind, list) and "JobPosting" in kind):
+            return data
+        if "@graph" in data:
+            return _find_job_posting(data["@graph"])
+    return None
+
+
+def _text(value: Any) -> str | None:
+    """A JSON-LD value as text; objects and lists sites put in text fields are ignored."""
+    return value.strip() or None if isinstance(value, str) else None
+
+
+def _apply_json_ld(posting: JobPosting, data: dict[str, Any]) -> None:
+    posting.title = _text(data.get("title")) or posting.title
+
+    organization = data.get("hiringOrganization")
+    if isinstance(organization, dict):
+        posting.company = _text(organization.get("name")) or posting.company
+    else:
+        posting.company = _text(organization) or posting.company
+
+    locations = data.get("jobLocation")
+    location = locations[0] if isinstance(locations, list) and locations else locations
+    if isinstance(location, dict):
+        address = location.get("address", {})
+        if isinstance(address, dict):
+            parts = [_text(address.get("addressLocality")), _text(address.get("addressRegion"))]
+            posting.location = ", ".join(part for part in parts if part) or posting.location
+    if data.get("jobLocationType") == "TELECOMMUTE" and not posting.location:
+        posting.location = "Remote"
+
+    salary = data.get("baseSalary")
+    if isinstance(salary, dict):
+        value = salary.get("value", {})
+        if isinstance(value, dict):
+            low, high = value.get("minValue"), value.get("maxValue")
+            if low is None and high is None:
+                low = high = value.get("value")
+        else:
+            low = high = value
+        unit = (value.get("unitText") if isinstance(value, dict) else None) or salary.get("unitText")
+        # Normalize hourly ranges to a yearly figure
+        factor = 2080 if str(unit).upper() == "HOUR" else 1
+        # Sites put text like "Competitive" here; anything not numeric is skipped
+        posting.pay_min = _to_pay(low, factor) if low is not None else posting.pay_min
+        posting.pay_max = _to_pay(high, factor) if high is not None else posting.pay_max
+
+
+def parse_job_posting(html: str) -> JobPosting:
+    """
+    Parse a job posting page.
+
+    Prefers schema.org JobPosting JSON-LD, then Open Graph / title tags, then a
+    salary pattern in the visible text.
+
+    Args:
+        html: The page HTML
+
+    Returns:
+        The fields that could be found; missing ones are None
+    """
+    fields = extract_fields(html)
+    posting = JobPosting()
+
+    for raw in fields.ld_json:
+        try:
+            data = _find_job_posting(json.loads(raw))
+        except json.JSONDecodeError:
+            continue
+        if data:
+            _apply_json_ld(posting, data)
+            break
+
+    posting.title = posting.title or fields.meta.get("og:title") or fields.h1 or fields.title
+    posting.company = posting.company or fields.meta.get("og:site_name")
+
+    if posting.pay_min is None and posting.pay_max is None:
+        match = PAY_RANGE.search(fields.text)
+        if match:
+            posting.pay_min = _parse_amount(match.group(1))
+            posting.pay_max = _parse_amount(match.group(2)) if match.group(2) else None
+
+    return posting
@@ -0,0 +1,294 @@
+"""Resume Text - Extract, normalize and index the text of uploaded resumes.
+
+Extraction runs in a process pool when a resume is uploaded. Results are
+cached by content hash, so identical files are parsed once and advice
+requests read the cached text instead of re-parsing the file.
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import re
+import sqlite3
+import unicodedata
+import zipfile
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any
+from xml.etree import ElementTree
+
+from storage.applications import WORKERS, ConnectionPool, utc_now
+from storage.resumes import ResumeStore, get_resume_store
+
+logger = logging.getLogger(__name__)
+
+# Split across server workers so N workers don't start N full pools
+EXTRACT_WORKERS = int(os.getenv("APPLYFLOW_EXTRACT_WORKERS", str(max(1, min(4, os.cpu_count() or 1) // WORKERS))))
+KEYWORD_LIMIT = 50
+# Content hashes whose extraction failed, remembered so they are not retried
+FAILURE_CACHE_SIZE = 1024
+
+SECTION_HEADINGS = {
+    "summary": ("summary", "profile", "objective", "about me", "professional summary"),
+    "experience": ("experience", "work experience", "professional experience", "employment", "work history"),
+    "education": ("education", "academic background"),
+    "skills": ("skills", "technical skills", "core competencies", "technologies"),
+    "projects": ("projects", "personal projects", "selected projects"),
+    "certifications": ("certifications", "certificates", "licenses"),
+    "awards": ("awards", "honors", "achievements"),
+}
+HEADING_LOOKUP = {alias: section for section, aliases in SECTION_HEADINGS.items() for alias in aliases}
+
+STOPWORDS = frozenset("""
+a about above after again all also am an and any are as at be been being below between both but by
+can could did do does doing down during each few for from further had has have having he her here
+hers him his how i if in into is it its itself just me more most my no nor not of off on once only
+or other our ours out over own same she should so some such than that the their theirs them then
+there these they this those through to too under until up very was we were what when where which
+while who whom why will with would you your yours within using used use including etc per via
+""".split())
+TOKEN = re.compile(r"[a-z][a-z0-9+#./-]*[a-z0-9+#]|[a-z]")
+
+WORD_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS resume_text (
+    sha256 TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    sections TEXT NOT NULL,
+    keywords TEXT NOT NULL,
+    extracted_at TEXT NOT NULL
+);
+"""
+
+
+# Extraction (runs in worker processes)
+
+def _read_pdf(path: Path) -> str:
+    from pypdf import PdfReader
+
+    return "\n".join(page.extract_text() or "" for page in PdfReader(path).pages)
+
+
+def _read_docx(path: Path) -> str:
+    with zipfile.ZipFile(path) as archive:
+        root = ElementTree.fromstring(archive.read("word/document.xml"))
+    paragraphs = []
+    for paragraph in root.iter(f"{WORD_NAMESPACE}p"):
+        paragraphs.append("".join(node.text or "" for node in paragraph.iter(f"{WORD_NAMESPACE}t")))
+    return "\n".join(paragraphs)
+
+
+def _read_text(path: Path) -> str:
+    return path.read_bytes().decode("utf-8", errors="replace")
+
+
+def read_resume(path: str | Path, content_type: str) -> str:
+    """Return the raw text of a PDF, DOCX or plain-text resume."""
+    path = Path(path)
+    if content_type == "application/pdf":
+        return _read_pdf(path)
+    if content_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
+        return _read_docx(path)
+    return _read_text(path)
+
+
+def normalize_text(text: str) -> str:
+    """Unify unicode forms, rejoin hyphenated line breaks and collapse whitespace."""
+    text = unicodedata.normalize("NFKC", text).replace("\u00ad", "")
+    text = re.sub(r"(\w)-\n(\w)", r"\1\2", text)
+    lines = (re.sub(r"[ \t]+", " ", line).strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def split_sections(text: str) -> dict[str, str]:
+    """Split normalized text on recognized headings; text before any heading is "header"."""
+    sections: dict[str, list[str]] = {"header": []}
+    current = "header"
+    for line in text.splitlines():
+        heading = HEADING_LOOKUP.get(line.lower().rstrip(":").strip())
+        if heading and len(line) < 40:
+            current = heading
+            sections.setdefault(current, [])
+            continue
+        sections[current].append(line)
+    return {name: "\n".join(lines) for name, lines in sections.items() if lines}
+
+
+def tokenize(text: str) -> list[str]:
+    return [token for token in TOKEN.findall(text.lower()) if token not in STOPWORDS]
+
+
+def keyword_index(text: str, limit: int = KEYWORD_LIMIT) -> dict[str, int]:
+    """Most frequent non-stopword terms with their counts."""
+    return dict(Counter(tokenize(text)).most_common(limit))
+
+
+def extract_text_fields(raw: str) -> dict[str, Any]:
+    """Normalize resume text and index its sections and keywords."""
+    text = normalize_text(raw)
+    return {
+        "text": text,
+        "sections": split_sections(text),
+        "keywords": keyword_index(text),
+    }
+
+
+def extract_resume(path: str | Path, content_type: str) -> dict[str, Any]:
+    """Read, normalize and index one resume file; safe to run in a worker process."""
+    return extract_text_fields(read_resume(path, content_type))
+
+
+# Cache
+
+class ExtractionError(Exception):
+    """A resume's content could not be read."""
+
+
+class ResumeTextIndex:
+    """Extracted resume text keyed by content hash.
+
+    Uploads schedule extraction on a process pool; concurrent requests for the
+    same content share one in-flight job. Results persist in SQLite next to
+    the resume index; content that fails to parse is remembered in memory
+    and raises ExtractionError without being parsed again. Both are dropped
+    when the last resume with that content is deleted.
+    """
+
+    def __init__(self, resumes: ResumeStore, workers: int = EXTRACT_WORKERS):
+        self.resumes = resumes
+        self.pool: ConnectionPool = resumes.pool
+        self.workers = workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending: dict[str, asyncio.Future] = {}
+        self._failed: OrderedDict[str, str] = OrderedDict()
+        with self.pool.connection() as conn:
+            conn.executescript(SCHEMA)
+        resumes.add_blob_listener(self._forget)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # Spawn rather than fork: the parent holds SQLite connections and threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+
+    def _load(self, sha256: str) -> dict[str, Any] | None:
+        with self.pool.connection() as conn:
+            row = conn.execute("SELECT * FROM resume_text WHERE sha256 = ?", (sha256,)).fetchone()
+        if row is None:
+            return None
+        return {
+            "text": row["text"],
+            "sections": json.loads(row["sections"]),
+            "keywords": json.loads(row["keywords"]),
+        }
+
+    def _save(self, sha256: str, extracted: dict[str, Any]) -> None:
+        # Skipped if the resume was deleted while it was being extracted
+        with self.pool.connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO resume_text (sha256, text, sections, keywords, extracted_at) "
+                "SELECT ?, ?, ?, ?, ? WHERE EXISTS (SELECT 1 FROM resumes WHERE sha256 = ?)",
+                (
+                    sha256,
+                    extracted["text"],
+                    json.dumps(extracted["sections"]),
+                    json.dumps(extracted["keywords"]),
+                    utc_now(),
+                    sha256,
+                ),
+            )
+
+    def _forget(self, conn: sqlite3.Connection, sha256: str) -> None:
+        """Drop a content hash's text; runs in the transaction deleting its last resume."""
+        conn.execute("DELETE FROM resume_text WHERE sha256 = ?", (sha256,))
+        self._failed.pop(sha256, None)
+
+    async def _extract(self, resume: dict[str, Any]) -> dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        try:
+            extracted = await loop.run_in_executor(
+                self._get_executor(),
+                extract_resume,
+                str(self.resumes.blob_path(resume["sha256"])),
+                resume["content_type"],
+            )
+        except Exception as e:
+            message = f"Could not read resume {resume['file_name']}: {e}"
+            # A broken pool or missing parser says nothing about the file;
+            # anything else will fail the same way again
+            if not isinstance(e, (BrokenProcessPool, ImportError)):
+                self._failed[resume["sha256"]] = message
+                while len(self._failed) > FAILURE_CACHE_SIZE:
+                    self._failed.popitem(last=False)
+            raise ExtractionError(message) from e
+        await asyncio.to_thread(self._save, resume["sha256"], extracted)
+        return extracted
+
+    def schedule(self, resume: dict[str, Any]) -> asyncio.Future:
+        """Start extracting a resume in the background if it is not cached or in flight."""
+        sha256 = resume["sha256"]
+        future = self._pending.get(sha256)
+        if future is None:
+            future = asyncio.ensure_future(self._get_or_extract(resume))
+            self._pending[sha256] = future
+            future.add_done_callback(lambda done: self._finished(sha256, done))
+        return future
+
+    def _finished(self, sha256: str, future: asyncio.Future) -> None:
+        self._pending.pop(sha256, None)
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning("Resume text extraction failed for %s: %s", sha256, future.exception())
+
+    def _check_failed(self, sha256: str) -> None:
+        message = self._failed.get(sha256)
+        if message is not None:
+            raise ExtractionError(message)
+
+    async def _get_or_extract(self, resume: dict[str, Any]) -> dict[str, Any]:
+        self._check_failed(resume["sha256"])
+        cached = await asyncio.to_thread(self._load, resume["sha256"])
+        return cached if cached is not None else await self._extract(resume)
+
+    async def get(self, resume: dict[str, Any]) -> dict[str, Any]:
+        """
+        Return a resume's extracted text, sections and keywords.
+
+        Args:
+            resume: The resume index record
+
+        Returns:
+            The cached extraction, waiting for or starting it if needed
+
+        Raises:
+            ExtractionError: The file could not be read
+        """
+        self._check_failed(resume["sha256"])
+        pending = self._pending.get(resume["sha256"])
+        if pending is not None:
+            return await asyncio.shield(pending)
+        cached = await asyncio.to_thread(self._load, resume["sha256"])
+        if cached is not None:
+            return cached
+        return await asyncio.shield(self.schedule(resume))
+
+
+_index: ResumeTextIndex | None = None
+
+
+def get_resume_text_index() -> ResumeTextIndex:
+    """Return the process-wide resume text index, creating it on first use."""
+    global _index
+    if _index is None:
+        _index = ResumeTextIndex(get_resume_store())
+    return _index
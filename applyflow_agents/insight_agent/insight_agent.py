@@ -2,7 +2,8 @@
 
 from google.adk.agents import LlmAgent
 from tools.analysis_tools import (get_application_stats, get_success_rate,
-                                  get_timeline_insights, get_pay_analysis, get_recommendations)
+                                  get_timeline_insights, get_pay_analysis, get_recommendations,
+                                  get_insights_dashboard)
 insights_agent = LlmAgent(
     name="InsightsAgent",
     model="gemini-2.5-flash",
@@ -16,6 +17,9 @@ Key capabilities:
 - Pay analysis (min, max, average, median, by location)
 - Personalized recommendations based on application history
 
+For overview questions such as "how's my job search going", call get_insights_dashboard once
+instead of calling the individual tools one after another.
+
 When providing insights:
 - Present data clearly and concisely
 - Highlight interesting patterns or trends
@@ -30,6 +34,7 @@ Help users understand their job search performance and optimize their strategy."
         get_timeline_insights,
         get_pay_analysis,
         get_recommendations,
+        get_insights_dashboard,
     ],
 )
 
@@ -1,66 +1,72 @@
-def get_application_stats() -> dict:
+from google.adk.tools.tool_context import ToolContext
+
+from storage.analytics import get_analytics_store, run_analytics
+
+
+async def get_application_stats(tool_context: ToolContext) -> dict:
     """Get overall statistics about job applications."""
     return {
         "status": "success",
-        "data": {
-            "total_applications": 0,
-            "by_status": {
-                "applied": 0,
-                "interviewing": 0,
-                "offer": 0,
-                "rejected": 0,
-                "ghosted": 0,
-            },
-            "average_pay": 0,
-            "top_locations": [],
-        },
+        "data": await run_analytics(
+            get_analytics_store().application_stats, tool_context.user_id
+        ),
     }
 
 
-def get_success_rate() -> dict:
+async def get_success_rate(tool_context: ToolContext) -> dict:
     """Calculate success rate metrics."""
     return {
         "status": "success",
-        "data": {
-            "interview_rate": 0.0,
-            "offer_rate": 0.0,
-            "rejection_rate": 0.0,
-        },
+        "data": await run_analytics(
+            get_analytics_store().success_rate, tool_context.user_id
+        ),
     }
 
 
-def get_timeline_insights(days: int = 30) -> dict:
+async def get_timeline_insights(tool_context: ToolContext, days: int = 30) -> dict:
     """Get insights about application activity over time."""
+    if days < 1:
+        return {
+            "status": "error",
+            "message": "days must be at least 1",
+        }
     return {
         "status": "success",
-        "data": {
-            "applications_over_time": [],
-            "most_active_period": "",
-            "average_per_week": 0,
-        },
+        "data": await run_analytics(
+            get_analytics_store().timeline, tool_context.user_id, days
+        ),
     }
 
 
-def get_pay_analysis() -> dict:
+async def get_pay_analysis(tool_context: ToolContext) -> dict:
     """Analyze salary data from applications."""
     return {
         "status": "success",
-        "data": {
-            "min_pay": 0,
-            "max_pay": 0,
-            "average_pay": 0,
-            "median_pay": 0,
-            "by_location": {},
-        },
+        "data": await run_analytics(
+            get_analytics_store().pay_analysis, tool_context.user_id
+        ),
     }
 
 
-def get_recommendations() -> dict:
+async def get_recommendations(tool_context: ToolContext) -> dict:
     """Get personalized recommendations based on application history."""
     return {
         "status": "success",
-        "recommendations": [
-            "Consider applying to more positions in high-success locations",
-            "Your interview rate is strong - keep up the momentum",
-        ],
+        "recommendations": await run_analytics(
+            get_analytics_store().recommendations, tool_context.user_id
+        ),
+    }
+
+
+async def get_insights_dashboard(tool_context: ToolContext, days: int = 30) -> dict:
+    """Get stats, success rates, timeline, pay analysis and recommendations in one call.
+    Prefer this over calling the individual tools when the user wants an overview."""
+    if days < 1:
+        return {
+            "status": "error",
+            "message": "days must be at least 1",
+        }
+    return {
+        "status": "success",
+        "data": await get_analytics_store().dashboard(tool_context.user_id, days),
     }
@@ -1,31 +1,78 @@
-from fastapi import FastAPI
+import json
+
+from fastapi import FastAPI, Header, HTTPException, Request
+from fastapi.responses import FileResponse, PlainTextResponse
 from ag_ui_adk import ADKAgent, add_adk_fastapi_endpoint
 from application_agent.application_agent import root_agent as application_tracking_agent
+from tools.application_tools import get_applications, update_application
 from resume_agent.resume_agent import root_agent as resume_support_agent
 from insight_agent.insight_agent import root_agent as insights_agent
 from fastapi.middleware.cors import CORSMiddleware
+from ingest.applications import import_applications, iter_csv_rows, iter_lines, iter_ndjson_rows, parse_json
+from compaction import HistoryCompactor, enable_compaction
+from observability import configure_tracing, instrument_agent, registry
+from routing import IntentRouter, ResponseCache
+from routing.fast_path import CachingAgent, FastPathAgent
+from routing.response_cache import application_and_resume_version, application_version
+from storage.applications import WORKERS, get_application_store
+from ingest.resume_text import get_resume_text_index
+from storage.resumes import ResumeTooLarge, get_resume_store
+from storage.session_service import get_session_service
+from storage.sessions import SESSION_TIMEOUT
+
+# Per-tool and per-model-call metrics and spans for every agent, and older
+# history folded into a summary once a conversation gets long
+configure_tracing()
+compactor = HistoryCompactor()
+for agent in (application_tracking_agent, resume_support_agent, insights_agent):
+    instrument_agent(agent)
+    enable_compaction(agent, compactor)
+
 
+def extract_user_id(input) -> str:
+    return input.state.get("headers", {}).get("user_id", "anonymous")
 
-# Create ADK agent instances for each specialized agent
+
+# Create ADK agent instances for each specialized agent; sessions are kept on
+# disk with a bounded hot set per agent (APPLYFLOW_SESSION_MEMORY_MB)
 applications_adk = ADKAgent(
     adk_agent=application_tracking_agent,
     app_name="application_agent",
-    user_id_extractor=lambda input: input.state.get(
-        "headers", {}).get("user_id", "anonymous"),
+    user_id_extractor=extract_user_id,
+    session_service=get_session_service(),
+    session_timeout_seconds=SESSION_TIMEOUT,
 )
 
 resumes_adk = ADKAgent(
     adk_agent=resume_support_agent,
     app_name="resume_agent",
-    user_id_extractor=lambda input: input.state.get(
-        "headers", {}).get("user_id", "anonymous"),
+    user_id_extractor=extract_user_id,
+    session_service=get_session_service(),
+    session_timeout_seconds=SESSION_TIMEOUT,
 )
 
 insights_adk = ADKAgent(
     adk_agent=insights_agent,
     app_name="insights_agent",
-    user_id_extractor=lambda input: input.state.get(
-        "headers", {}).get("user_id", "anonymous"),
+    user_id_extractor=extract_user_id,
+    session_service=get_session_service(),
+    session_timeout_seconds=SESSION_TIMEOUT,
+)
+
+# Simple status updates and listings skip the model entirely
+applications_fast_path = FastPathAgent(
+    applications_adk,
+    IntentRouter({"update_application": update_application, "get_applications": get_applications}),
+    user_id_extractor=extract_user_id,
+)
+
+# Repeated questions are answered from cache until the user's data changes
+response_cache = ResponseCache()
+resumes_cached = CachingAgent(
+    resumes_adk, response_cache, "resumes", application_and_resume_version, user_id_extractor=extract_user_id
+)
+insights_cached = CachingAgent(
+    insights_adk, response_cache, "insights", application_version, user_id_extractor=extract_user_id
 )
 
 app = FastAPI()
@@ -44,15 +91,15 @@ app.add_middleware(
 
 # Expose each agent at its own endpoint
 add_adk_fastapi_endpoint(
-    app, applications_adk, "/agents/applications", extract_headers=["x-user-id"]
+    app, applications_fast_path, "/agents/applications", extract_headers=["x-user-id"]
 )
 
 add_adk_fastapi_endpoint(
-    app, resumes_adk, "/agents/resumes", extract_headers=["x-user-id"]
+    app, resumes_cached, "/agents/resumes", extract_headers=["x-user-id"]
 )
 
 add_adk_fastapi_endpoint(
-    app, insights_adk, "/agents/insights", extract_headers=["x-user-id"]
+    app, insights_cached, "/agents/insights", extract_headers=["x-user-id"]
 )
 
 
@@ -67,10 +114,80 @@ async def get_status():
             "applications": "/agents/applications",
             "resumes": "/agents/resumes",
             "insights": "/agents/insights",
+            "bulk_import": "/applications/bulk",
+            "resume_files": "/resumes",
+            "metrics": "/metrics",
         },
     }
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Prometheus text exposition of tool and model call metrics"""
+    return registry.render()
+
+
+@app.post("/applications/bulk")
+async def bulk_import_applications(request: Request, x_user_id: str = Header(...)):
+    """Import many applications from a CSV, NDJSON or JSON body.
+
+    CSV and NDJSON bodies are validated line by line as they stream in; valid
+    rows are written in batched transactions. Returns a result for every row.
+    """
+    content_type = request.headers.get("content-type", "")
+    try:
+        if "csv" in content_type:
+            rows = iter_csv_rows(iter_lines(request.stream()))
+        elif "ndjson" in content_type:
+            rows = iter_ndjson_rows(iter_lines(request.stream()))
+        else:
+            rows = parse_json((await request.body()).decode())
+        return await import_applications(get_application_store(), x_user_id, rows)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid import body: {str(e)}")
+
+
+@app.post("/resumes")
+async def upload_resume_file(request: Request, file_name: str, x_user_id: str = Header(...)):
+    """Upload a resume file as the raw request body.
+
+    The body is streamed to disk in chunks and stored under its SHA-256, so
+    uploading the same file twice keeps a single copy. Bodies over
+    APPLYFLOW_RESUME_MAX_BYTES are rejected with 413.
+    """
+    store = get_resume_store()
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > store.max_bytes:
+        raise HTTPException(status_code=413, detail=f"Resume exceeds the {store.max_bytes} byte limit")
+    content_type = request.headers.get("content-type")
+    if content_type == "application/octet-stream":
+        content_type = None
+    try:
+        resume = await store.add(x_user_id, file_name, request.stream(), content_type)
+    except ResumeTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    get_resume_text_index().schedule(resume)
+    return resume
+
+
+@app.get("/resumes/{resume_id}")
+async def download_resume_file(resume_id: str, x_user_id: str = Header(...)):
+    """Download a resume file; served with sendfile where the server supports it"""
+    store = get_resume_store()
+    resume = await store.get(x_user_id, resume_id)
+    if resume is None:
+        raise HTTPException(status_code=404, detail=f"Resume {resume_id} not found")
+    return FileResponse(
+        store.blob_path(resume["sha256"]),
+        media_type=resume["content_type"],
+        filename=resume["file_name"],
+        # Blobs are immutable, so the content hash is a strong validator
+        headers={"ETag": f'"{resume["sha256"]}"'},
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="localhost", port=8000)
+    # Workers share sessions, application data and cache versions through
+    # SQLite, so any worker can serve any request
+    uvicorn.run("main:app", host="localhost", port=8000, workers=WORKERS)
@@ -0,0 +1,2 @@
+from .metrics import registry
+from .tracing import configure_tracing, instrument_agent
@@ -0,0 +1,264 @@
+"""Tracing - Per-tool and per-LLM-call instrumentation for ADK agents.
+
+Each tool call and model call gets an OpenTelemetry span plus Prometheus
+metrics for wall time, token usage and payload sizes. Spans go to whatever
+tracer provider is installed; configure_tracing() installs one that appends
+JSON spans to a local file.
+"""
+
+import json
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from opentelemetry import trace
+
+from observability.metrics import Counter, Histogram, registry
+
+TRACE_FILE = os.getenv("APPLYFLOW_TRACE_FILE")
+# Calls still open this long after their invocation started are closed as abandoned
+PENDING_TTL = float(os.getenv("APPLYFLOW_TRACE_PENDING_TTL", "900"))
+
+tracer = trace.get_tracer("applyflow.agents")
+
+TOOL_CALLS = registry.register(Counter(
+    "applyflow_tool_calls_total", "Tool calls by outcome.", ["agent", "tool", "status"]))
+TOOL_DURATION = registry.register(Histogram(
+    "applyflow_tool_duration_seconds", "Tool wall time.", ["agent", "tool"]))
+TOOL_PAYLOAD = registry.register(Counter(
+    "applyflow_tool_payload_bytes_total", "JSON size of tool arguments and responses.",
+    ["agent", "tool", "direction"]))
+LLM_CALLS = registry.register(Counter(
+    "applyflow_llm_calls_total", "Model calls by outcome.", ["agent", "model", "status"]))
+LLM_DURATION = registry.register(Histogram(
+    "applyflow_llm_duration_seconds", "Model call wall time, request to final chunk.", ["agent", "model"]))
+LLM_TOKENS = registry.register(Counter(
+    "applyflow_llm_tokens_total", "Tokens reported by the model.", ["agent", "model", "direction"]))
+LLM_PAYLOAD = registry.register(Counter(
+    "applyflow_llm_payload_bytes_total", "Text size of model requests and responses.",
+    ["agent", "model", "direction"]))
+
+
+@dataclass
+class _Call:
+    start: float
+    span: trace.Span
+    kind: str  # "tool" or "llm"
+    agent: str
+    name: str  # tool or model name
+
+
+# In-flight calls per invocation: invocation id -> (started, {call key: call}).
+# A call whose after/error callback never runs (the run was cancelled, or
+# another before-callback short-circuited it) is closed when its agent run
+# ends or, failing that, once the invocation is older than PENDING_TTL.
+_pending: OrderedDict[str, tuple[float, dict[tuple[str, ...], _Call]]] = OrderedDict()
+
+
+def configure_tracing(path: str | None = TRACE_FILE) -> None:
+    """Export spans as JSON lines to ``path``; does nothing when path is unset."""
+    if not path:
+        return
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+
+    exporter = ConsoleSpanExporter(
+        out=open(path, "a", buffering=1),
+        formatter=lambda span: span.to_json(indent=None) + "\n",
+    )
+    provider = TracerProvider(resource=Resource.create({"service.name": "applyflow-agents"}))
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+
+
+def _json_size(value: Any) -> int:
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _text_size(contents) -> int:
+    return sum(
+        len(part.text or "")
+        for content in contents or []
+        for part in content.parts or []
+    )
+
+
+def _start(invocation_id: str, key: tuple[str, ...], call: _Call) -> None:
+    _sweep(call.start - PENDING_TTL)
+    if invocation_id not in _pending:
+        _pending[invocation_id] = (call.start, {})
+    _pending[invocation_id][1][key] = call
+
+
+def _finish(
+    invocation_id: str, key: tuple[str, ...], error: BaseException | None = None
+) -> tuple[float, trace.Span | None, str]:
+    _, calls = _pending.get(invocation_id, (0.0, {}))
+    call = calls.pop(key, None)
+    if not calls:
+        _pending.pop(invocation_id, None)
+    if call is None:
+        return 0.0, None, ""
+    if error is not None:
+        call.span.record_exception(error)
+        call.span.set_status(trace.Status(trace.StatusCode.ERROR, str(error)))
+    return time.perf_counter() - call.start, call.span, call.name
+
+
+def _abandon(call: _Call, reason: str) -> None:
+    elapsed = time.perf_counter() - call.start
+    if call.kind == "tool":
+        TOOL_CALLS.inc(call.agent, call.name, "abandoned")
+        TOOL_DURATION.observe(call.agent, call.name, value=elapsed)
+    else:
+        LLM_CALLS.inc(call.agent, call.name, "abandoned")
+        LLM_DURATION.observe(call.agent, call.name, value=elapsed)
+    call.span.set_status(trace.Status(trace.StatusCode.ERROR, reason))
+    call.span.end()
+
+
+def _sweep(cutoff: float) -> None:
+    # Invocations are kept in start order, so only the oldest need checking
+    while _pending:
+        invocation_id, (started, calls) = next(iter(_pending.items()))
+        if started >= cutoff:
+            return
+        del _pending[invocation_id]
+        for call in calls.values():
+            _abandon(call, "no result before the trace timeout")
+
+
+# Tool callbacks
+
+def _tool_key(tool_context) -> tuple[str, ...]:
+    return ("tool", tool_context.agent_name, tool_context.function_call_id or "")
+
+
+def before_tool(tool, args: dict[str, Any], tool_context) -> None:
+    size = _json_size(args)
+    TOOL_PAYLOAD.inc(tool_context.agent_name, tool.name, "in", amount=size)
+    span = tracer.start_span(f"tool {tool.name}", attributes={
+        "applyflow.agent": tool_context.agent_name,
+        "applyflow.tool": tool.name,
+        "applyflow.args_bytes": size,
+    })
+    _start(tool_context.invocation_id, _tool_key(tool_context),
+           _Call(time.perf_counter(), span, "tool", tool_context.agent_name, tool.name))
+    return None
+
+
+def after_tool(tool, args: dict[str, Any], tool_context, tool_response: Any) -> None:
+    elapsed, span, _ = _finish(tool_context.invocation_id, _tool_key(tool_context))
+    size = _json_size(tool_response)
+    status = tool_response.get("status", "success") if isinstance(tool_response, dict) else "success"
+    TOOL_CALLS.inc(tool_context.agent_name, tool.name, str(status))
+    TOOL_DURATION.observe(tool_context.agent_name, tool.name, value=elapsed)
+    TOOL_PAYLOAD.inc(tool_context.agent_name, tool.name, "out", amount=size)
+    if span:
+        span.set_attribute("applyflow.response_bytes", size)
+        span.set_attribute("applyflow.status", str(status))
+        span.end()
+    return None
+
+
+def on_tool_error(tool, args: dict[str, Any], tool_context, error: Exception) -> None:
+    elapsed, span, _ = _finish(tool_context.invocation_id, _tool_key(tool_context), error)
+    TOOL_CALLS.inc(tool_context.agent_name, tool.name, "exception")
+    TOOL_DURATION.observe(tool_context.agent_name, tool.name, value=elapsed)
+    if span:
+        span.end()
+    return None
+
+
+# Model callbacks
+
+def _model_key(callback_context) -> tuple[str, ...]:
+    return ("llm", callback_context.agent_name)
+
+
+def before_model(callback_context, llm_request) -> None:
+    model = llm_request.model or ""
+    size = _text_size(llm_request.contents)
+    LLM_PAYLOAD.inc(callback_context.agent_name, model, "in", amount=size)
+    span = tracer.start_span(f"llm {model}", attributes={
+        "applyflow.agent": callback_context.agent_name,
+        "gen_ai.request.model": model,
+        "applyflow.request_bytes": size,
+    })
+    _start(callback_context.invocation_id, _model_key(callback_context),
+           _Call(time.perf_counter(), span, "llm", callback_context.agent_name, model))
+    return None
+
+
+def after_model(callback_context, llm_response) -> None:
+    # Streaming responses arrive as partial chunks; record once at the end
+    if getattr(llm_response, "partial", False):
+        return None
+    elapsed, span, model = _finish(callback_context.invocation_id, _model_key(callback_context))
+    agent = callback_context.agent_name
+
+    usage = llm_response.usage_metadata
+    input_tokens = (usage.prompt_token_count or 0) if usage else 0
+    output_tokens = (usage.candidates_token_count or 0) if usage else 0
+    size = _text_size([llm_response.content] if llm_response.content else [])
+
+    LLM_CALLS.inc(agent, model, "success")
+    LLM_DURATION.observe(agent, model, value=elapsed)
+    LLM_TOKENS.inc(agent, model, "input", amount=input_tokens)
+    LLM_TOKENS.inc(agent, model, "output", amount=output_tokens)
+    LLM_PAYLOAD.inc(agent, model, "out", amount=size)
+    if span:
+        span.set_attribute("gen_ai.usage.input_tokens", input_tokens)
+        span.set_attribute("gen_ai.usage.output_tokens", output_tokens)
+        span.set_attribute("applyflow.response_bytes", size)
+        span.end()
+    return None
+
+
+def on_model_error(callback_context, llm_request, error: Exception) -> None:
+    elapsed, span, _ = _finish(callback_context.invocation_id, _model_key(callback_context), error)
+    model = llm_request.model or ""
+    LLM_CALLS.inc(callback_context.agent_name, model, "exception")
+    LLM_DURATION.observe(callback_context.agent_name, model, value=elapsed)
+    if span:
+        span.end()
+    return None
+
+
+# Agent callbacks
+
+def after_agent(callback_context) -> None:
+    """Close this agent's calls that never got a result in the run that just ended."""
+    entry = _pending.get(callback_context.invocation_id)
+    if entry is None:
+        return None
+    calls = entry[1]
+    for key in [key for key, call in calls.items() if call.agent == callback_context.agent_name]:
+        _abandon(calls.pop(key), "no result before the agent run ended")
+    if not calls:
+        del _pending[callback_context.invocation_id]
+    return None
+
+
+def add_callback(agent, attribute: str, callback, first: bool) -> None:
+    existing = getattr(agent, attribute)
+    callbacks = [] if existing is None else list(existing) if isinstance(existing, list) else [existing]
+    # Before-callbacks go first so timing starts even if another callback short-circuits
+    setattr(agent, attribute, [callback, *callbacks] if first else [*callbacks, callback])
+
+
+def instrument_agent(agent) -> None:
+    """Attach tracing callbacks to an LlmAgent, keeping any it already has."""
+    add_callback(agent, "before_tool_callback", before_tool, first=True)
+    add_callback(agent, "after_tool_callback", after_tool, first=False)
+    add_callback(agent, "on_tool_error_callback", on_tool_error, first=False)
+    add_callback(agent, "before_model_callback", before_model, first=True)
+    add_callback(agent, "after_model_callback", after_model, first=False)
+    add_callback(agent, "on_model_error_callback", on_model_error, first=False)
+    add_callback(agent, "after_agent_callback", after_agent, first=False)
@@ -8,6 +8,7 @@ from tools.resume_tools import (
     get_resumes,
     delete_resume,
     tailor_resume,
+    rank_resumes,
 )
 from typing import Dict, List
 from pydantic import BaseModel
@@ -41,11 +42,13 @@ Key capabilities:
 - Upload and manage resume files
 - Generate tailored versions of resumes for specific job descriptions
 - Delete resumes
+- Rank the user's resumes against a job description
 
 When giving resume advice:
 - Be specific and actionable
 - Focus on highlighting relevant skills and experience
-- Suggest keyword optimization for ATS systems
+- Suggest keyword optimization for ATS systems, working from the match score, matched and
+  missing skills and keywords that get_resume_advice, tailor_resume and rank_resumes return
 - Recommend formatting improvements when appropriate
 - When given a task break it down into steps and report your progress using the step_progress tool after completing each step.
 
@@ -56,6 +59,7 @@ Always be encouraging and constructive in your feedback.""",
         get_resumes,
         delete_resume,
         tailor_resume,
+        rank_resumes,
         step_progress,
     ],
 )
@@ -1,43 +1,183 @@
-def get_resume_advice(job_description: str, current_resume: str | None = None) -> dict:
-    """Get advice on how to tailor a resume for a specific job."""
+import asyncio
+
+from google.adk.tools.tool_context import ToolContext
+
+from ingest.ats import score_resume, score_resumes
+from ingest.resume_text import SECTION_HEADINGS, ExtractionError, extract_text_fields, get_resume_text_index
+from storage.resumes import ResumeTooLarge, get_resume_store
+
+
+async def _resume_text(tool_context: ToolContext, resume_id: str | None, current_resume: str | None) -> dict | None:
+    """Extracted text for a stored resume (from the cache) or for pasted resume text."""
+    if resume_id:
+        resume = await get_resume_store().get(tool_context.user_id, resume_id)
+        return await get_resume_text_index().get(resume) if resume else None
+    if current_resume:
+        return await asyncio.to_thread(extract_text_fields, current_resume)
+    return None
+
+
+async def get_resume_advice(
+    tool_context: ToolContext,
+    job_description: str,
+    resume_id: str | None = None,
+    current_resume: str | None = None,
+) -> dict:
+    """Get advice on how to tailor a resume for a specific job. Pass the resume_id of an
+    uploaded resume, or the resume text as current_resume."""
+    try:
+        resume = await _resume_text(tool_context, resume_id, current_resume)
+    except ExtractionError as e:
+        return {
+            "status": "error",
+            "message": str(e),
+        }
+    if resume is None:
+        return {
+            "status": "error",
+            "message": "Resume not found; pass a resume_id from get_resumes or the resume text",
+        }
+
+    report = await asyncio.to_thread(score_resume, job_description, resume["text"])
+    advice = []
+    if report.missing_skills:
+        advice.append(
+            "Add these skills from the job description if you have them: "
+            + ", ".join(report.missing_skills[:10])
+        )
+    if report.missing_keywords:
+        advice.append(
+            "Work these job description terms into your resume where they are true for you: "
+            + ", ".join(report.missing_keywords[:10])
+        )
+    if report.matched_skills:
+        advice.append(
+            "Move experience using " + ", ".join(report.matched_skills[:5])
+            + " to the top of its section"
+        )
+    missing_sections = [section for section in ("summary", "skills", "experience") if section not in resume["sections"]]
+    if missing_sections:
+        advice.append("Add clearly headed sections for: " + ", ".join(missing_sections))
     return {
         "status": "success",
-        "message": "Generated resume advice",
-        "advice": f"Based on the job description, consider highlighting these key areas...",
+        "message": f"ATS match score {report.score:.0%}",
+        "advice": " ".join(f"{line}." for line in advice) or "Your resume already covers this job description well.",
+        "data": {**report.to_dict(), "sections": sorted(resume["sections"])},
     }
 
 
-def upload_resume(file_name: str, file_content: str) -> dict:
+async def upload_resume(tool_context: ToolContext, file_name: str, file_content: str) -> dict:
     """Upload a new resume."""
+    try:
+        # Chat uploads are pasted text whatever the file name says
+        resume = await get_resume_store().add_bytes(
+            tool_context.user_id, file_name, file_content.encode("utf-8"), content_type="text/plain"
+        )
+    except ResumeTooLarge as e:
+        return {
+            "status": "error",
+            "message": str(e),
+        }
+    # Extract in the background so later advice requests hit the cache
+    get_resume_text_index().schedule(resume)
     return {
         "status": "success",
         "message": f"Uploaded resume: {file_name}",
-        "resume_id": "res_new_123",
+        "resume_id": resume["id"],
         "file_name": file_name,
+        "data": resume,
     }
 
 
-def get_resumes() -> dict:
+async def get_resumes(tool_context: ToolContext) -> dict:
     """Get all uploaded resumes for the user."""
+    resumes = await get_resume_store().find(tool_context.user_id)
     return {
         "status": "success",
-        "message": "Retrieved resumes",
-        "data": [],  # Will be replaced with actual database query
+        "message": f"Retrieved {len(resumes)} resumes",
+        "data": resumes,
     }
 
 
-def delete_resume(resume_id: str) -> dict:
+async def delete_resume(tool_context: ToolContext, resume_id: str) -> dict:
     """Delete a resume."""
+    if not await get_resume_store().delete(tool_context.user_id, resume_id):
+        return {
+            "status": "error",
+            "message": f"Resume {resume_id} not found",
+        }
     return {
         "status": "success",
         "message": f"Deleted resume {resume_id}",
     }
 
 
-def tailor_resume(resume_id: str, job_description: str) -> dict:
-    """Generate a tailored version of a resume for a specific job."""
+async def tailor_resume(tool_context: ToolContext, resume_id: str, job_description: str) -> dict:
+    """Get a resume's sections and its keyword gap against a job description, to write a
+    tailored version from."""
+    try:
+        resume = await _resume_text(tool_context, resume_id, None)
+    except ExtractionError as e:
+        return {
+            "status": "error",
+            "message": str(e),
+        }
+    if resume is None:
+        return {
+            "status": "error",
+            "message": f"Resume {resume_id} not found",
+        }
+    report = await asyncio.to_thread(score_resume, job_description, resume["text"])
+    order = ["header", *SECTION_HEADINGS]
+    return {
+        "status": "success",
+        "message": "Loaded resume for tailoring",
+        "data": {
+            "resume_id": resume_id,
+            "sections": {name: resume["sections"][name] for name in order if name in resume["sections"]},
+            **report.to_dict(),
+        },
+    }
+
+
+async def rank_resumes(tool_context: ToolContext, job_description: str) -> dict:
+    """Score every uploaded resume against a job description and rank them, to pick the
+    best one to apply or tailor with."""
+    resumes = await get_resume_store().find(tool_context.user_id)
+    if not resumes:
+        return {
+            "status": "error",
+            "message": "No resumes uploaded yet",
+        }
+    index = get_resume_text_index()
+    texts = await asyncio.gather(*(index.get(resume) for resume in resumes), return_exceptions=True)
+    # Unreadable resumes are listed as skipped rather than failing the ranking
+    readable = {}
+    skipped = []
+    for resume, extracted in zip(resumes, texts):
+        if isinstance(extracted, BaseException):
+            if not isinstance(extracted, Exception):
+                raise extracted
+            skipped.append({"resume_id": resume["id"], "file_name": resume["file_name"], "error": str(extracted)})
+        else:
+            readable[resume["id"]] = extracted["text"]
+    if not readable:
+        return {
+            "status": "error",
+            "message": "None of the uploaded resumes could be read",
+            "skipped": skipped,
+        }
+    ranked = await asyncio.to_thread(score_resumes, job_description, readable)
+    names = {resume["id"]: resume["file_name"] for resume in resumes}
+    message = f"Ranked {len(ranked)} resumes"
+    if skipped:
+        message += f"; skipped {len(skipped)} that could not be read"
     return {
         "status": "success",
-        "message": "Generated tailored resume",
-        "tailored_resume_id": f"{resume_id}_tailored",
+        "message": message,
+        "data": [
+            {"resume_id": resume_id, "file_name": names[resume_id], **report.to_dict()}
+            for resume_id, report in ranked
+        ],
+        "skipped": skipped,
     }
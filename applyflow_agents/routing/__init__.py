@@ -0,0 +1,2 @@
+from .intents import Intent, IntentRouter, parse_intent
+from .response_cache import ResponseCache
@@ -0,0 +1,142 @@
+"""Fast Path - AG-UI agent wrappers that answer some runs without the model."""
+
+import time
+import uuid
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from ag_ui.core import (
+    EventType, RunAgentInput, RunFinishedEvent, RunStartedEvent, TextMessageContentEvent,
+    TextMessageEndEvent, TextMessageStartEvent)
+
+from routing.intents import IntentRouter
+from routing.response_cache import RESPONSE_CACHE_DURATION, RESPONSE_CACHE_REQUESTS, ResponseCache
+
+UserIdExtractor = Callable[[RunAgentInput], str]
+
+TEXT_EVENTS = (EventType.TEXT_MESSAGE_CONTENT, EventType.TEXT_MESSAGE_CHUNK)
+# Runs that call frontend tools or fail cannot be replayed as plain text
+UNCACHEABLE_EVENTS = (
+    EventType.TOOL_CALL_START,
+    EventType.TOOL_CALL_CHUNK,
+    EventType.RUN_ERROR,
+)
+
+
+def _last_user_text(input: RunAgentInput) -> str | None:
+    for message in reversed(input.messages):
+        if message.role == "user":
+            return message.content if isinstance(message.content, str) else None
+    return None
+
+
+def _opens_thread(input: RunAgentInput) -> bool:
+    """Whether the last user message is the thread's first, so no earlier turn can shape the answer."""
+    return sum(message.role == "user" for message in input.messages) == 1
+
+
+def _text_run(input: RunAgentInput, text: str) -> list[Any]:
+    """A complete AG-UI run consisting of one assistant text message."""
+    message_id = str(uuid.uuid4())
+    return [
+        RunStartedEvent(type=EventType.RUN_STARTED, thread_id=input.thread_id, run_id=input.run_id),
+        TextMessageStartEvent(type=EventType.TEXT_MESSAGE_START, message_id=message_id, role="assistant"),
+        TextMessageContentEvent(type=EventType.TEXT_MESSAGE_CONTENT, message_id=message_id, delta=text),
+        TextMessageEndEvent(type=EventType.TEXT_MESSAGE_END, message_id=message_id),
+        RunFinishedEvent(type=EventType.RUN_FINISHED, thread_id=input.thread_id, run_id=input.run_id),
+    ]
+
+
+class FastPathAgent:
+    """Wraps an ADKAgent: confident commands are answered by the router, the rest by the agent.
+
+    Fast-path replies are sent as a single text message in a complete run,
+    so AG-UI clients see the same event shape as a model reply. They are
+    not recorded in the ADK session, and the application summary in the
+    agent's prompt is rebuilt from the store version on its next turn.
+    """
+
+    def __init__(self, agent: Any, router: IntentRouter, user_id_extractor: UserIdExtractor):
+        self.agent = agent
+        self.router = router
+        self.user_id_extractor = user_id_extractor
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.agent, name)
+
+    async def run(self, input: RunAgentInput) -> AsyncIterator[Any]:
+        text = _last_user_text(input)
+        routed = await self.router.route(self.user_id_extractor(input), text) if text else None
+        if routed is None:
+            start = time.perf_counter()
+            async for event in self.agent.run(input):
+                yield event
+            self.router.observe_model_turn(time.perf_counter() - start)
+            return
+        for event in _text_run(input, routed.text):
+            yield event
+
+
+class CachingAgent:
+    """Wraps an ADKAgent with a response cache for standalone questions.
+
+    Only a thread's opening question is looked up or stored: the cache key
+    carries the question but not the conversation before it, so a later
+    turn could otherwise get an answer given in another thread's context.
+
+    ``versions`` returns the user's data version stamp; it is read before
+    the run, so an answer produced by a run that changed the data is stored
+    under the old stamp and never served.
+    """
+
+    def __init__(
+        self,
+        agent: Any,
+        cache: ResponseCache,
+        name: str,
+        versions: Callable[[str], Awaitable[tuple[int, ...]]],
+        user_id_extractor: UserIdExtractor,
+    ):
+        self.agent = agent
+        self.cache = cache
+        self.name = name
+        self.versions = versions
+        self.user_id_extractor = user_id_extractor
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.agent, name)
+
+    def _record(self, outcome: str, start: float) -> None:
+        RESPONSE_CACHE_REQUESTS.inc(self.name, outcome)
+        RESPONSE_CACHE_DURATION.observe(self.name, outcome, value=time.perf_counter() - start)
+
+    async def run(self, input: RunAgentInput) -> AsyncIterator[Any]:
+        start = time.perf_counter()
+        query = _last_user_text(input)
+        if not query or not _opens_thread(input) or not self.cache.cacheable(query):
+            async for event in self.agent.run(input):
+                yield event
+            self._record("bypass", start)
+            return
+
+        user_id = self.user_id_extractor(input)
+        versions = await self.versions(user_id)
+        cached = self.cache.get(self.name, user_id, versions, query)
+        if cached is not None:
+            for event in _text_run(input, cached):
+                yield event
+            self._record("hit", start)
+            return
+
+        # Message id -> text, in order; a run may say something before a tool call
+        messages: dict[Any, list[str]] = {}
+        cacheable = True
+        async for event in self.agent.run(input):
+            if event.type in TEXT_EVENTS and event.delta:
+                messages.setdefault(event.message_id, []).append(event.delta)
+            elif event.type in UNCACHEABLE_EVENTS:
+                cacheable = False
+            yield event
+        if cacheable and messages:
+            text = "\n\n".join("".join(parts) for parts in messages.values())
+            self.cache.put(self.name, user_id, versions, query, text)
+        self._record("miss", start)
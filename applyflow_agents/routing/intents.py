@@ -0,0 +1,207 @@
+"""Intent Router - Answer simple application commands without a model round trip.
+
+Short, single-clause commands like "mark app3 as rejected" or "show my
+interviewing applications" are parsed with fixed patterns and executed by
+calling the application tools directly. Anything that does not match a
+pattern, mentions more than one thing, or refers to an application that
+cannot be resolved to exactly one record falls back to the LLM, so a miss
+costs only the parse.
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from observability.metrics import Counter, Gauge, Histogram, registry
+from storage.applications import ApplicationStore, get_application_store
+
+LIST_LIMIT = 20
+
+# Words users say for each stored status
+STATUS_WORDS = {
+    "applied": "applied",
+    "interviewing": "interviewing",
+    "interview": "interviewing",
+    "interviews": "interviewing",
+    "offer": "offer",
+    "offers": "offer",
+    "offered": "offer",
+    "rejected": "rejected",
+    "rejection": "rejected",
+    "rejections": "rejected",
+    "ghosted": "ghosted",
+}
+
+_STATUS = "|".join(sorted(STATUS_WORDS, key=len, reverse=True))
+UPDATE_PATTERNS = [
+    re.compile(rf"^(?:mark|set|move|update|change|put) (?P<ref>.+?) (?:as|to|into) (?P<status>{_STATUS})(?: status)?$"),
+    re.compile(rf"^(?P<ref>.+?) (?:is|was|got|has been) (?:now )?(?P<status>{_STATUS})$"),
+    re.compile(rf"^i (?:got|was|have been) (?P<status>{_STATUS}) (?:by|from|at) (?P<ref>.+)$"),
+    re.compile(rf"^i got an? (?P<status>offer|interview) (?:from|at|with) (?P<ref>.+)$"),
+]
+LIST_PATTERNS = [
+    re.compile(rf"^(?:show|list|get|display|give)(?: me)?(?: all)?(?: of)? my(?: (?P<status>{_STATUS}))?(?: job)? applications$"),
+    re.compile(rf"^what are my(?: (?P<status>{_STATUS}))?(?: job)? applications$"),
+    re.compile(rf"^(?:show|list)(?: me)?(?: all)?(?: my)? applications(?: (?:that are|with status|in) (?P<status>{_STATUS}))?$"),
+    re.compile(rf"^which(?: of my)?(?: job)? applications are (?P<status>{_STATUS})$"),
+]
+# Multi-part or open-ended requests go to the model
+COMPOUND = re.compile(r"[?,;]|\b(?:and|also|then|but|or|if|why|how|should|could|would)\b")
+POLITE = re.compile(r"^(?:please|can you|could you|hey|hi|ok|okay)[, ]+|[, ]+(?:please|thanks|thank you)$")
+REFERENCE_NOISE = re.compile(r"^(?:the|my)\s+|\s+(?:application|app|job|role|position|one)$")
+APPLICATION_ID = re.compile(r"^[a-z0-9_-]*\d[a-z0-9_-]*$")
+
+FAST_PATH_REQUESTS = registry.register(Counter(
+    "applyflow_fast_path_requests_total", "Requests answered by the intent router or passed to the model.",
+    ["agent", "intent", "outcome"]))
+FAST_PATH_DURATION = registry.register(Histogram(
+    "applyflow_fast_path_duration_seconds", "Wall time of requests answered by the intent router.", ["agent"]))
+FAST_PATH_SAVED = registry.register(Counter(
+    "applyflow_fast_path_saved_seconds_total",
+    "Estimated latency saved: average model-handled turn time minus fast path time.", ["agent"]))
+MODEL_TURN_SECONDS = registry.register(Gauge(
+    "applyflow_model_turn_seconds", "Moving average wall time of turns handled by the model.", ["agent"]))
+
+
+@dataclass(frozen=True)
+class Intent:
+    name: str
+    args: dict[str, Any] = field(default_factory=dict)
+    reference: str | None = None
+
+
+@dataclass
+class Routed:
+    intent: Intent
+    text: str
+    result: dict[str, Any]
+
+
+def normalize_utterance(text: str) -> str:
+    text = " ".join(text.lower().split()).rstrip(".!")
+    while True:
+        stripped = POLITE.sub("", text).strip()
+        if stripped == text:
+            return text
+        text = stripped
+
+
+def parse_intent(text: str) -> Intent | None:
+    """Match an utterance against the command patterns; None means ask the model."""
+    text = normalize_utterance(text)
+    if not text or len(text) > 120 or COMPOUND.search(text):
+        return None
+    for pattern in UPDATE_PATTERNS:
+        found = pattern.match(text)
+        if found:
+            reference = REFERENCE_NOISE.sub("", found["ref"]).strip()
+            reference = REFERENCE_NOISE.sub("", reference).strip()
+            if not reference:
+                return None
+            return Intent("update_status", {"status": STATUS_WORDS[found["status"]]}, reference)
+    for pattern in LIST_PATTERNS:
+        found = pattern.match(text)
+        if found:
+            status = found.groupdict().get("status")
+            return Intent("list_applications", {"status": STATUS_WORDS[status] if status else None})
+    return None
+
+
+class ToolContextStub:
+    """The parts of an ADK ToolContext the application tools use."""
+
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+        self.state: dict[str, Any] = {}
+
+
+Tool = Callable[..., Awaitable[dict[str, Any]]]
+
+
+class IntentRouter:
+    """Runs parsed intents through the application tools.
+
+    ``tools`` maps "update_application" and "get_applications" to the tool
+    functions; they are called with a minimal tool context carrying the
+    user id.
+    """
+
+    def __init__(self, tools: dict[str, Tool], agent: str = "applications", store: ApplicationStore | None = None):
+        self.tools = tools
+        self.agent = agent
+        self._store = store
+
+    @property
+    def store(self) -> ApplicationStore:
+        return self._store or get_application_store()
+
+    async def resolve(self, user_id: str, reference: str) -> dict[str, Any] | None:
+        """Find the one application a reference names: an id, a company or "title at company"."""
+        if APPLICATION_ID.match(reference):
+            application = await self.store.get(user_id, reference)
+            if application is not None:
+                return application
+        title, _, company = reference.rpartition(" at ")
+        matches = [
+            app for app in await self.store.find(user_id)
+            if (app["company"] or "").lower() == (company if title else reference)
+            and (not title or (app["job_title"] or "").lower() == title)
+        ]
+        return matches[0] if len(matches) == 1 else None
+
+    async def _update_status(self, user_id: str, intent: Intent) -> Routed | None:
+        application = await self.resolve(user_id, intent.reference)
+        if application is None:
+            return None
+        status = intent.args["status"]
+        result = await self.tools["update_application"](
+            ToolContextStub(user_id), application_id=application["id"], status=status
+        )
+        if result.get("status") != "success":
+            return None
+        text = f"Marked {application['job_title']} at {application['company']} ({application['id']}) as {status}."
+        return Routed(intent, text, result)
+
+    async def _list_applications(self, user_id: str, intent: Intent) -> Routed:
+        status = intent.args["status"]
+        result = await self.tools["get_applications"](ToolContextStub(user_id), status=status, limit=LIST_LIMIT + 1)
+        applications = result.get("data", [])
+        label = f"{status} applications" if status else "applications"
+        if not applications:
+            return Routed(intent, f"You have no {label}.", result)
+        lines = [f"Your {label}, newest first:"]
+        lines.extend(
+            f"- {app['job_title']} at {app['company']} ({app['id']}) - {app['status']}"
+            for app in applications[:LIST_LIMIT]
+        )
+        if len(applications) > LIST_LIMIT:
+            total = await self.store.count(user_id, status=status)
+            lines.append(f"...and {total - LIST_LIMIT} more.")
+        result["data"] = applications[:LIST_LIMIT]
+        return Routed(intent, "\n".join(lines), result)
+
+    async def route(self, user_id: str, text: str) -> Routed | None:
+        """Answer ``text`` directly if it is a confident command, else return None."""
+        start = time.perf_counter()
+        intent = parse_intent(text)
+        routed = None
+        if intent is not None:
+            if intent.name == "update_status":
+                routed = await self._update_status(user_id, intent)
+            else:
+                routed = await self._list_applications(user_id, intent)
+        elapsed = time.perf_counter() - start
+
+        FAST_PATH_REQUESTS.inc(self.agent, intent.name if intent else "none", "hit" if routed else "fallback")
+        if routed is not None:
+            FAST_PATH_DURATION.observe(self.agent, value=elapsed)
+            model_turn = MODEL_TURN_SECONDS.value(self.agent)
+            if model_turn > elapsed:
+                FAST_PATH_SAVED.inc(self.agent, amount=model_turn - elapsed)
+        return routed
+
+    def observe_model_turn(self, seconds: float, weight: float = 0.1) -> None:
+        """Feed the wall time of a model-handled turn into the moving average."""
+        current = MODEL_TURN_SECONDS.value(self.agent)
+        MODEL_TURN_SECONDS.set(self.agent, value=seconds if not current else current + weight * (seconds - current))
@@ -0,0 +1,179 @@
+"""Response Cache - Reuse agent answers to repeated questions while the data is unchanged.
+
+Entries are keyed by agent, user, the normalized question and a version
+stamp of the user's data. A question matches an entry when its normalized
+form is identical or, for short questions, its hashed-trigram embedding
+is close enough, so "what's my offer rate?" and "what is my offer rate"
+share an answer. Long questions, such as ones carrying a job description,
+differ in the entities that matter while sharing most of their wording,
+so they only match exactly. Any
+write to the user's applications or resumes bumps their version in the
+store, which makes older entries unreachable; they are dropped on the next
+lookup. Entries also expire after a TTL and are evicted least recently used.
+"""
+
+import os
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+from ingest.ats import normalize_tokens, stem
+from ingest.resume_text import STOPWORDS
+from observability.metrics import Counter, Gauge, Histogram, registry
+from storage.applications import get_application_store
+from storage.resumes import get_resume_store
+from storage.search import HashingEmbedder
+
+CACHE_SIZE = int(os.getenv("APPLYFLOW_RESPONSE_CACHE_SIZE", "2048"))
+CACHE_TTL = float(os.getenv("APPLYFLOW_RESPONSE_CACHE_TTL", "600"))
+SIMILARITY = float(os.getenv("APPLYFLOW_RESPONSE_CACHE_SIMILARITY", "0.9"))
+PER_USER_LIMIT = 32
+# Longer normalized questions are only answered from an exact match
+FUZZY_MAX_TOKENS = 8
+EMBEDDING_DIM = 256
+
+# Follow-ups depend on the conversation, so they are never answered from cache
+CONTINUATION = re.compile(
+    r"^(?:and|also|what about|how about|then|same|ok|okay|yes|no|sure|thanks|thank you|it|that|those|these)\b"
+)
+# Questions only match when they share these exactly: "2023" vs "2024", "no" vs nothing
+GUARD = re.compile(r"\d+|\b(?:no|not|nor|never|without)\b")
+# Dropped before matching, except words that change what is being asked;
+# stemmed like the query tokens they are compared with
+QUERY_STOPWORDS = frozenset(stem(word) for word in STOPWORDS - {
+    "no", "not", "nor", "more", "most", "few", "only", "before", "after",
+    "above", "below", "under", "over", "same", "other"})
+
+RESPONSE_CACHE_REQUESTS = registry.register(Counter(
+    "applyflow_response_cache_requests_total", "Agent runs by response cache outcome.", ["agent", "outcome"]))
+RESPONSE_CACHE_DURATION = registry.register(Histogram(
+    "applyflow_response_cache_run_seconds", "Agent run wall time by response cache outcome.", ["agent", "outcome"]))
+RESPONSE_CACHE_ENTRIES = registry.register(Gauge(
+    "applyflow_response_cache_entries", "Cached agent responses."))
+
+
+@dataclass
+class CachedResponse:
+    text: str
+    vector: np.ndarray
+    guards: tuple[str, ...]
+    versions: tuple[int, ...]
+    created: float
+
+
+def normalize_query(text: str) -> str:
+    return " ".join(
+        token for token in normalize_tokens(text) if len(token) > 1 and token not in QUERY_STOPWORDS
+    )
+
+
+def _short(normalized: str) -> bool:
+    return normalized.count(" ") < FUZZY_MAX_TOKENS
+
+
+class ResponseCache:
+    """Per-user LRU of agent answers with TTL, version stamps and similarity lookup."""
+
+    def __init__(
+        self,
+        max_entries: int = CACHE_SIZE,
+        ttl: float = CACHE_TTL,
+        threshold: float = SIMILARITY,
+        per_user: int = PER_USER_LIMIT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.threshold = threshold
+        self.per_user = per_user
+        self.clock = clock
+        self.embed = HashingEmbedder(EMBEDDING_DIM)
+        # (agent, user) -> normalized query -> entry, both least recently used first
+        self._users: OrderedDict[tuple[str, str], OrderedDict[str, CachedResponse]] = OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def cacheable(self, query: str) -> bool:
+        if self.max_entries <= 0:
+            return False
+        text = " ".join(query.lower().split())
+        return len(text) < 2000 and not CONTINUATION.match(text) and bool(normalize_query(text))
+
+    def _prune(self, key: tuple[str, str], versions: tuple[int, ...]) -> OrderedDict[str, CachedResponse] | None:
+        entries = self._users.get(key)
+        if entries is None:
+            return None
+        now = self.clock()
+        for query in [q for q, e in entries.items() if e.versions != versions or now - e.created > self.ttl]:
+            del entries[query]
+            self._size -= 1
+        RESPONSE_CACHE_ENTRIES.set(value=self._size)
+        if not entries:
+            del self._users[key]
+            return None
+        return entries
+
+    def get(self, agent: str, user_id: str, versions: tuple[int, ...], query: str) -> str | None:
+        """Return a cached answer to ``query`` or a question close enough to it."""
+        key = (agent, user_id)
+        entries = self._prune(key, versions)
+        if entries is None:
+            return None
+        normalized = normalize_query(query)
+        entry = entries.get(normalized)
+        if entry is None and _short(normalized):
+            guards = tuple(GUARD.findall(normalized))
+            candidates = [(q, e) for q, e in entries.items() if e.guards == guards and _short(q)]
+            if candidates:
+                vector = self.embed([normalized])[0]
+                scores = np.stack([e.vector for _, e in candidates]) @ vector
+                best = int(np.argmax(scores))
+                if scores[best] >= self.threshold:
+                    normalized, entry = candidates[best]
+        if entry is None:
+            return None
+        entries.move_to_end(normalized)
+        self._users.move_to_end(key)
+        return entry.text
+
+    def put(self, agent: str, user_id: str, versions: tuple[int, ...], query: str, text: str) -> None:
+        key = (agent, user_id)
+        entries = self._prune(key, versions)
+        if entries is None:
+            entries = self._users[key] = OrderedDict()
+        normalized = normalize_query(query)
+        if normalized not in entries:
+            self._size += 1
+        entries[normalized] = CachedResponse(
+            text=text,
+            vector=self.embed([normalized])[0],
+            guards=tuple(GUARD.findall(normalized)),
+            versions=versions,
+            created=self.clock(),
+        )
+        entries.move_to_end(normalized)
+        self._users.move_to_end(key)
+        if len(entries) > self.per_user:
+            entries.popitem(last=False)
+            self._size -= 1
+        while self._size > self.max_entries:
+            oldest_key, oldest = next(iter(self._users.items()))
+            oldest.popitem(last=False)
+            self._size -= 1
+            if not oldest:
+                del self._users[oldest_key]
+        RESPONSE_CACHE_ENTRIES.set(value=self._size)
+
+
+async def application_version(user_id: str) -> tuple[int, ...]:
+    return (await get_application_store().version(user_id),)
+
+
+async def application_and_resume_version(user_id: str) -> tuple[int, ...]:
+    return (await get_application_store().version(user_id), await get_resume_store().version(user_id))
@@ -0,0 +1,3 @@
+from .applications import ApplicationStore, get_application_store
+from .resumes import ResumeStore, get_resume_store
+from .sessions import SessionStore
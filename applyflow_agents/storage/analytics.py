@@ -0,0 +1,122 @@
+"""Analytics Store - Per-user columnar application data for the insight tools."""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, TypeVar
+
+from storage.applications import ApplicationStore, Change, get_application_store
+from storage.columnar import ApplicationColumns, ApplicationSnapshot
+from storage.derived import UserCache
+
+# Users whose columns are kept in memory
+SNAPSHOT_CACHE_SIZE = int(os.getenv("APPLYFLOW_SNAPSHOT_CACHE_SIZE", "64"))
+# NumPy releases the GIL for the heavy kernels, so threads run aggregations in parallel
+ANALYTICS_WORKERS = int(os.getenv("APPLYFLOW_ANALYTICS_WORKERS", str(min(8, os.cpu_count() or 1))))
+
+T = TypeVar("T")
+
+
+class AnalyticsStore(UserCache[ApplicationColumns]):
+    """Per-user analytics kept in sync with an ApplicationStore.
+
+    Each user's applications are held as ApplicationColumns, built with one
+    scan on first access and then patched from the store's change
+    notifications. Stats and success rate read its running totals; exact
+    pay and timeline statistics run over its snapshot, which is copied from
+    the columns once per write rather than reloaded from the database.
+    """
+
+    def __init__(self, store: ApplicationStore, cache_size: int = SNAPSHOT_CACHE_SIZE):
+        super().__init__(store, cache_size)
+
+    def build(self, rows: Iterable[dict[str, Any]]) -> ApplicationColumns:
+        return ApplicationColumns.from_rows(rows)
+
+    def apply(self, columns: ApplicationColumns, changes: list[Change]) -> None:
+        columns.apply(changes)
+
+    def snapshot(self, user_id: str) -> ApplicationSnapshot:
+        """Return a frozen columnar snapshot of a user's applications."""
+        columns = self.get(user_id)
+        with self._lock:
+            return columns.snapshot()
+
+    def application_stats(self, user_id: str, top_n: int = 5) -> dict[str, Any]:
+        columns = self.get(user_id)
+        with self._lock:
+            return columns.totals.application_stats(columns.locations, top_n)
+
+    def success_rate(self, user_id: str) -> dict[str, Any]:
+        columns = self.get(user_id)
+        with self._lock:
+            return columns.totals.success_rate()
+
+    def timeline(self, user_id: str, days: int = 30) -> dict[str, Any]:
+        return self.snapshot(user_id).timeline(days)
+
+    def pay_analysis(self, user_id: str) -> dict[str, Any]:
+        return self.snapshot(user_id).pay_analysis()
+
+    def recommendations(self, user_id: str) -> list[str]:
+        return self.snapshot(user_id).recommendations()
+
+    async def dashboard(self, user_id: str, days: int = 30) -> dict[str, Any]:
+        """
+        Compute every insight at once over a single snapshot.
+
+        The sections run concurrently on the analytics pool and all see the
+        same data, so the numbers agree with each other even if a write lands
+        mid-way.
+
+        Args:
+            user_id: Owner of the applications
+            days: Timeline window in days
+
+        Returns:
+            stats, success_rate, timeline, pay_analysis and recommendations
+        """
+        snapshot = await run_analytics(self.snapshot, user_id)
+        stats, success_rate, timeline, pay_analysis, recommendations = await asyncio.gather(
+            run_analytics(snapshot.application_stats),
+            run_analytics(snapshot.success_rate),
+            run_analytics(snapshot.timeline, days),
+            run_analytics(snapshot.pay_analysis),
+            run_analytics(snapshot.recommendations),
+        )
+        return {
+            "stats": stats,
+            "success_rate": success_rate,
+            "timeline": timeline,
+            "pay_analysis": pay_analysis,
+            "recommendations": recommendations,
+        }
+
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def get_analytics_executor() -> ThreadPoolExecutor:
+    """Return the pool analytics run on, kept apart from the default to_thread pool."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=ANALYTICS_WORKERS, thread_name_prefix="analytics")
+    return _executor
+
+
+async def run_analytics(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run an aggregation on the analytics pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_analytics_executor(), functools.partial(fn, *args, **kwargs))
+
+
+_analytics: AnalyticsStore | None = None
+
+
+def get_analytics_store() -> AnalyticsStore:
+    """Return the process-wide analytics store attached to the application store."""
+    global _analytics
+    if _analytics is None:
+        _analytics = AnalyticsStore(get_application_store())
+    return _analytics
@@ -0,0 +1,368 @@
+"""Application Store - SQLite-backed persistence for job applications."""
+
+import asyncio
+import os
+import queue
+import sqlite3
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable, Iterator
+
+DB_PATH = os.getenv("APPLYFLOW_DB_PATH", "applyflow.db")
+POOL_SIZE = int(os.getenv("APPLYFLOW_DB_POOL_SIZE", "8"))
+# Server processes sharing the database; with more than one, in-process
+# caches check the data versions for writes made by the other workers
+WORKERS = int(os.getenv("APPLYFLOW_WORKERS", "1"))
+
+STATUSES = ("applied", "interviewing", "offer", "rejected", "ghosted")
+
+APPLICATION_FIELDS = (
+    "job_title",
+    "company",
+    "pay",
+    "location",
+    "job_url",
+    "resume_id",
+    "status",
+    "notes",
+    "job_description",
+)
+COLUMNS = ("id", "user_id", *APPLICATION_FIELDS, "created_at", "updated_at")
+
+# (before, after) per changed row; before is None for inserts and after is
+# None for deletes
+Change = tuple[dict[str, Any] | None, dict[str, Any] | None]
+# Called as listener(user_id, changes, version) once a write has committed,
+# with the user's applications data version that write produced
+ChangeListener = Callable[[str, list[Change], int], None]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS applications (
+    id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    job_title TEXT NOT NULL,
+    company TEXT NOT NULL,
+    pay INTEGER,
+    location TEXT,
+    job_url TEXT,
+    resume_id TEXT,
+    status TEXT NOT NULL DEFAULT 'applied',
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    notes TEXT,
+    job_description TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_applications_user_status
+    ON applications (user_id, status);
+CREATE INDEX IF NOT EXISTS idx_applications_user_created
+    ON applications (user_id, created_at);
+"""
+
+# Per-user counters bumped in the same transaction as every write, so caches
+# derived from a user's data can tell when it changed (in any process)
+VERSIONS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS data_versions (
+    user_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    PRIMARY KEY (user_id, kind)
+);
+"""
+
+# Columns added after the first release; older databases gain them on startup
+MIGRATIONS = (
+    ("notes", "ALTER TABLE applications ADD COLUMN notes TEXT"),
+    ("job_description", "ALTER TABLE applications ADD COLUMN job_description TEXT"),
+)
+
+
+def utc_now() -> str:
+    """Return the current time as an ISO-8601 UTC string."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+def bump_version(conn: sqlite3.Connection, user_id: str, kind: str) -> int:
+    return conn.execute(
+        "INSERT INTO data_versions (user_id, kind, version) VALUES (?, ?, 1) "
+        "ON CONFLICT (user_id, kind) DO UPDATE SET version = version + 1 RETURNING version",
+        (user_id, kind),
+    ).fetchone()[0]
+
+
+def read_version(conn: sqlite3.Connection, user_id: str, kind: str) -> int:
+    row = conn.execute(
+        "SELECT version FROM data_versions WHERE user_id = ? AND kind = ?", (user_id, kind)
+    ).fetchone()
+    return row[0] if row else 0
+
+
+class ConnectionPool:
+    """A fixed-size pool of SQLite connections shared across worker threads."""
+
+    def __init__(self, path: str, size: int = POOL_SIZE):
+        self.path = path
+        self._pool: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue(maxsize=size)
+        for _ in range(size):
+            self._pool.put(self._connect())
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        # Set first: other worker processes may be initializing the same file
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        with self.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    @contextmanager
+    def snapshot(self) -> Iterator[sqlite3.Connection]:
+        """A read transaction: queries see one consistent state and writers are not blocked."""
+        with self.connection() as conn:
+            conn.execute("BEGIN")
+            try:
+                yield conn
+            finally:
+                conn.execute("ROLLBACK")
+
+    def close(self) -> None:
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+
+
+class ApplicationStore:
+    """Async CRUD over the applications table.
+
+    Queries run on a thread via ``asyncio.to_thread`` so tool calls never block
+    the event loop. Bulk paths execute in a single transaction. Derived
+    indexes register change listeners to stay in sync with writes.
+    """
+
+    def __init__(self, path: str = DB_PATH, pool_size: int = POOL_SIZE, shared: bool = WORKERS > 1):
+        self.pool = ConnectionPool(path, pool_size)
+        # Whether other processes write this database too
+        self.shared = shared
+        self.listeners: list[ChangeListener] = []
+        with self.pool.connection() as conn:
+            conn.executescript(SCHEMA + VERSIONS_SCHEMA)
+            existing = {row["name"] for row in conn.execute("PRAGMA table_info(applications)")}
+            for column, statement in MIGRATIONS:
+                if column not in existing:
+                    try:
+                        conn.execute(statement)
+                    except sqlite3.OperationalError as e:
+                        # Another worker migrated first
+                        if "duplicate column" not in str(e):
+                            raise
+
+    def close(self) -> None:
+        self.pool.close()
+
+    def add_listener(self, listener: ChangeListener) -> None:
+        self.listeners.append(listener)
+
+    def _notify(self, user_id: str, changes: list[Change], version: int) -> None:
+        # Only after COMMIT, so a rolled back write never reaches a listener
+        for listener in self.listeners:
+            listener(user_id, changes, version)
+
+    # Sync implementations
+
+    def _insert_many(self, user_id: str, rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        now = utc_now()
+        records = []
+        for row in rows:
+            record = {field: row.get(field) for field in APPLICATION_FIELDS}
+            record["status"] = record["status"] or "applied"
+            record["id"] = row.get("id") or f"app_{uuid.uuid4().hex[:12]}"
+            record["user_id"] = user_id
+            record["created_at"] = row.get("created_at") or now
+            record["updated_at"] = row.get("updated_at") or record["created_at"]
+            records.append(record)
+
+        placeholders = ", ".join(f":{column}" for column in COLUMNS)
+        with self.pool.transaction() as conn:
+            conn.executemany(
+                f"INSERT INTO applications ({', '.join(COLUMNS)}) VALUES ({placeholders})",
+                records,
+            )
+            if records:
+                version = bump_version(conn, user_id, "applications")
+        if records:
+            self._notify(user_id, [(None, record) for record in records], version)
+        return records
+
+    def _update_many(self, user_id: str, updates: Iterable[dict[str, Any]]) -> list[dict[str, Any] | None]:
+        now = utc_now()
+        results: list[dict[str, Any] | None] = []
+        changed: list[Change] = []
+        with self.pool.transaction() as conn:
+            for update in updates:
+                changes = {
+                    field: update[field]
+                    for field in APPLICATION_FIELDS
+                    if update.get(field) is not None
+                }
+                assignments = ", ".join(f"{field} = :{field}" for field in changes)
+                assignments = f"{assignments}, updated_at = :updated_at" if assignments else "updated_at = :updated_at"
+                before = conn.execute(
+                    "SELECT * FROM applications WHERE id = ? AND user_id = ?",
+                    (update["id"], user_id),
+                ).fetchone()
+                if before is None:
+                    results.append(None)
+                    continue
+                after = dict(conn.execute(
+                    f"UPDATE applications SET {assignments} WHERE id = :id AND user_id = :user_id RETURNING *",
+                    {**changes, "updated_at": now, "id": update["id"], "user_id": user_id},
+                ).fetchone())
+                changed.append((dict(before), after))
+                results.append(after)
+            if changed:
+                version = bump_version(conn, user_id, "applications")
+        if changed:
+            self._notify(user_id, changed, version)
+        return results
+
+    def _delete(self, user_id: str, application_id: str) -> bool:
+        with self.pool.transaction() as conn:
+            row = conn.execute(
+                "DELETE FROM applications WHERE id = ? AND user_id = ? RETURNING *",
+                (application_id, user_id),
+            ).fetchone()
+            if row is not None:
+                version = bump_version(conn, user_id, "applications")
+        if row is not None:
+            self._notify(user_id, [(dict(row), None)], version)
+        return row is not None
+
+    def _get(self, user_id: str, application_id: str) -> dict[str, Any] | None:
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                "SELECT * FROM applications WHERE id = ? AND user_id = ?",
+                (application_id, user_id),
+            ).fetchone()
+        return dict(row) if row else None
+
+    def _get_many(self, user_id: str, application_ids: list[str]) -> list[dict[str, Any]]:
+        if not application_ids:
+            return []
+        placeholders = ", ".join("?" * len(application_ids))
+        with self.pool.connection() as conn:
+            # Unary + keeps the planner on the primary key instead of scanning a user index
+            rows = conn.execute(
+                f"SELECT * FROM applications WHERE id IN ({placeholders}) AND +user_id = ?",
+                (*application_ids, user_id),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def _list(self, user_id: str, status: str | None, limit: int | None, offset: int) -> list[dict[str, Any]]:
+        query = "SELECT * FROM applications WHERE user_id = ?"
+        params: list[Any] = [user_id]
+        if status:
+            query += " AND status = ?"
+            params.append(status)
+        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
+        params.extend([limit if limit is not None else -1, offset])
+        with self.pool.connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def _scan(self, conn: sqlite3.Connection, user_id: str) -> Iterator[dict[str, Any]]:
+        """Stream every application for a user on an already-open connection."""
+        for row in conn.execute("SELECT * FROM applications WHERE user_id = ?", (user_id,)):
+            yield dict(row)
+
+    def _count(self, user_id: str, status: str | None) -> int:
+        query = "SELECT COUNT(*) FROM applications WHERE user_id = ?"
+        params: list[Any] = [user_id]
+        if status:
+            query += " AND status = ?"
+            params.append(status)
+        with self.pool.connection() as conn:
+            return conn.execute(query, params).fetchone()[0]
+
+    def _version(self, user_id: str) -> int:
+        with self.pool.connection() as conn:
+            return read_version(conn, user_id, "applications")
+
+    def _status_counts(self, user_id: str) -> dict[str, int]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) FROM applications WHERE user_id = ? GROUP BY status",
+                (user_id,),
+            ).fetchall()
+        return {status: count for status, count in rows}
+
+    # Async API
+
+    async def add(self, user_id: str, **fields: Any) -> dict[str, Any]:
+        records = await asyncio.to_thread(self._insert_many, user_id, [fields])
+        return records[0]
+
+    async def add_many(self, user_id: str, rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        return await asyncio.to_thread(self._insert_many, user_id, list(rows))
+
+    async def update(self, user_id: str, application_id: str, **fields: Any) -> dict[str, Any] | None:
+        results = await asyncio.to_thread(
+            self._update_many, user_id, [{**fields, "id": application_id}]
+        )
+        return results[0]
+
+    async def update_many(self, user_id: str, updates: Iterable[dict[str, Any]]) -> list[dict[str, Any] | None]:
+        return await asyncio.to_thread(self._update_many, user_id, list(updates))
+
+    async def delete(self, user_id: str, application_id: str) -> bool:
+        return await asyncio.to_thread(self._delete, user_id, application_id)
+
+    async def get(self, user_id: str, application_id: str) -> dict[str, Any] | None:
+        return await asyncio.to_thread(self._get, user_id, application_id)
+
+    async def find(
+        self,
+        user_id: str,
+        status: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        return await asyncio.to_thread(self._list, user_id, status, limit, offset)
+
+    async def count(self, user_id: str, status: str | None = None) -> int:
+        return await asyncio.to_thread(self._count, user_id, status)
+
+    async def status_counts(self, user_id: str) -> dict[str, int]:
+        return await asyncio.to_thread(self._status_counts, user_id)
+
+    async def version(self, user_id: str) -> int:
+        """A counter that changes whenever the user's applications do."""
+        return await asyncio.to_thread(self._version, user_id)
+
+
+_store: ApplicationStore | None = None
+
+
+def get_application_store() -> ApplicationStore:
+    """Return the process-wide application store, creating it on first use."""
+    global _store
+    if _store is None:
+        _store = ApplicationStore()
+    return _store
@@ -0,0 +1,350 @@
+"""Columnar Snapshot - NumPy arrays over one user's applications for exact analytics.
+
+ApplicationColumns holds a user's applications as typed arrays that are
+patched in place on every write, along with running status, location and
+pay totals. Stats and rates read the totals; exact pay and timeline
+analytics run over an ApplicationSnapshot, a frozen copy taken after the
+latest write.
+"""
+
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+import numpy as np
+
+from storage.applications import STATUSES
+
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+UNKNOWN_STATUS = len(STATUSES)
+# 1970-01-01 was a Thursday; shifting by 3 days makes weeks start on Monday
+EPOCH_WEEKDAY_OFFSET = 3
+INITIAL_CAPACITY = 1024
+
+
+def _day(created_at: str) -> int:
+    return int(np.datetime64(created_at[:10], "D").astype(np.int64))
+
+
+@dataclass
+class Totals:
+    """Running counts behind the stats and success rate insights."""
+    status: np.ndarray  # int64 count per status code, unknown last
+    location: np.ndarray  # int64 count per location code
+    pay_count: int = 0
+    pay_total: float = 0.0
+
+    def copy(self) -> "Totals":
+        return replace(self, status=self.status.copy(), location=self.location.copy())
+
+    @property
+    def total(self) -> int:
+        return int(self.status.sum())
+
+    def application_stats(self, locations: tuple[str, ...] | list[str], top_n: int = 5) -> dict[str, Any]:
+        # Ties are broken by name so the order does not depend on insertion order
+        top = sorted(
+            ((locations[code], int(count)) for code, count in enumerate(self.location) if count),
+            key=lambda item: (-item[1], item[0]),
+        )[:top_n]
+        return {
+            "total_applications": self.total,
+            "by_status": {status: int(self.status[code]) for code, status in enumerate(STATUSES)},
+            "average_pay": round(self.pay_total / self.pay_count) if self.pay_count else 0,
+            "top_locations": [{"location": location, "count": count} for location, count in top],
+        }
+
+    def success_rate(self) -> dict[str, Any]:
+        total = self.total
+        if not total:
+            return {"interview_rate": 0.0, "offer_rate": 0.0, "rejection_rate": 0.0}
+        counts = self.status
+        return {
+            # Offers imply an interview happened
+            "interview_rate": round(float(counts[STATUS_CODES["interviewing"]] + counts[STATUS_CODES["offer"]]) / total, 4),
+            "offer_rate": round(float(counts[STATUS_CODES["offer"]]) / total, 4),
+            "rejection_rate": round(float(counts[STATUS_CODES["rejected"]]) / total, 4),
+        }
+
+
+@dataclass(frozen=True)
+class ApplicationSnapshot:
+    """Typed, column-oriented view of a user's applications.
+
+    pay is NaN where unknown, location is -1 where unknown, and created_day
+    is days since the Unix epoch.
+    """
+    pay: np.ndarray  # float64
+    status: np.ndarray  # int8 codes into STATUSES
+    location: np.ndarray  # int32 codes into locations
+    created_day: np.ndarray  # int64
+    locations: tuple[str, ...]
+    totals: Totals
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict[str, Any]]) -> "ApplicationSnapshot":
+        return ApplicationColumns.from_rows(rows).snapshot()
+
+    def status_counts(self) -> np.ndarray:
+        return self.totals.status[:UNKNOWN_STATUS]
+
+    def application_stats(self, top_n: int = 5) -> dict[str, Any]:
+        return self.totals.application_stats(self.locations, top_n)
+
+    def success_rate(self) -> dict[str, Any]:
+        return self.totals.success_rate()
+
+    def pay_analysis(self, percentiles: tuple[int, ...] = (25, 50, 75, 90)) -> dict[str, Any]:
+        known = ~np.isnan(self.pay)
+        pay = self.pay[known]
+        if not len(pay):
+            return {
+                "min_pay": 0, "max_pay": 0, "average_pay": 0, "median_pay": 0,
+                "percentiles": {}, "by_location": {},
+            }
+        values = np.percentile(pay, percentiles)
+        return {
+            "min_pay": int(pay.min()),
+            "max_pay": int(pay.max()),
+            "average_pay": round(float(pay.mean())),
+            "median_pay": round(float(np.median(pay))),
+            "percentiles": {f"p{p}": round(float(v)) for p, v in zip(percentiles, values)},
+            "by_location": self._pay_by_location(pay, self.location[known]),
+        }
+
+    def _pay_by_location(self, pay: np.ndarray, location: np.ndarray) -> dict[str, Any]:
+        has_location = location >= 0
+        pay, location = pay[has_location], location[has_location]
+        if not len(pay):
+            return {}
+
+        # Sort by (location, pay) so each location is a contiguous, ordered run
+        order = np.lexsort((pay, location))
+        pay, location = pay[order], location[order]
+        starts = np.flatnonzero(np.r_[True, location[1:] != location[:-1]])
+        counts = np.diff(np.r_[starts, len(pay)])
+        sums = np.add.reduceat(pay, starts)
+        medians = (pay[starts + (counts - 1) // 2] + pay[starts + counts // 2]) / 2
+
+        return {
+            self.locations[code]: {
+                "count": int(count),
+                "average_pay": round(float(total / count)),
+                "median_pay": round(float(median)),
+                "min_pay": int(pay[start]),
+                "max_pay": int(pay[start + count - 1]),
+            }
+            for code, start, count, total, median in zip(
+                location[starts], starts, counts, sums, medians
+            )
+        }
+
+    def timeline(self, days: int = 30, today: int | None = None) -> dict[str, Any]:
+        if today is None:
+            today = (datetime.now(timezone.utc).date() - datetime(1970, 1, 1).date()).days
+        first_day = today - days + 1
+        window = self.created_day[(self.created_day >= first_day) & (self.created_day <= today)]
+
+        per_day = np.bincount(window - first_day, minlength=days)
+        weeks = (window + EPOCH_WEEKDAY_OFFSET) // 7
+        week_ids, week_counts = np.unique(weeks, return_counts=True)
+        week_starts = week_ids * 7 - EPOCH_WEEKDAY_OFFSET
+
+        busiest = int(np.argmax(week_counts)) if len(week_counts) else None
+        return {
+            "applications_over_time": [
+                {"week_start": _day_to_iso(start), "count": int(count)}
+                for start, count in zip(week_starts, week_counts)
+            ],
+            "by_day": {
+                _day_to_iso(first_day + offset): int(per_day[offset])
+                for offset in np.flatnonzero(per_day)
+            },
+            "most_active_period": (
+                f"Week of {_day_to_iso(week_starts[busiest])}" if busiest is not None else ""
+            ),
+            "average_per_week": round(len(window) / max(1, -(-days // 7)), 2),
+        }
+
+    def recommendations(self, today: int | None = None, min_sample: int = 3) -> list[str]:
+        if not len(self):
+            return ["Start tracking your applications to get personalized recommendations"]
+        if today is None:
+            today = (datetime.now(timezone.utc).date() - datetime(1970, 1, 1).date()).days
+
+        recommendations = []
+        counts = self.status_counts()
+        total = len(self)
+        interviewed = np.isin(self.status, [STATUS_CODES["interviewing"], STATUS_CODES["offer"]])
+
+        has_location = self.location >= 0
+        if has_location.any():
+            per_location = np.bincount(self.location[has_location], minlength=len(self.locations))
+            hits = np.bincount(
+                self.location[has_location], weights=interviewed[has_location], minlength=len(self.locations)
+            )
+            rates = np.where(per_location >= min_sample, hits / np.maximum(per_location, 1), -1)
+            best = int(np.argmax(rates))
+            if rates[best] > interviewed.mean():
+                recommendations.append(
+                    f"{self.locations[best]} has your best interview rate "
+                    f"({rates[best]:.0%}); consider applying to more positions there"
+                )
+
+        recent = np.count_nonzero(self.created_day > today - 14)
+        previous = np.count_nonzero((self.created_day > today - 28) & (self.created_day <= today - 14))
+        if recent < previous:
+            recommendations.append(
+                f"You applied to {recent} jobs in the last two weeks, down from {previous}; "
+                "try to keep a steady pace"
+            )
+
+        if counts[STATUS_CODES["ghosted"]] / total > 0.3:
+            recommendations.append(
+                "Over 30% of your applications were ghosted; follow up a week after applying"
+            )
+        if counts[STATUS_CODES["rejected"]] / total > 0.5:
+            recommendations.append(
+                "Most applications end in rejection; tailor your resume to each job description"
+            )
+        if interviewed.mean() >= 0.2:
+            recommendations.append("Your interview rate is strong - keep up the momentum")
+        return recommendations
+
+
+def _day_to_iso(day: int) -> str:
+    return str(np.datetime64(int(day), "D"))
+
+
+class ApplicationColumns:
+    """One user's applications as arrays that are patched on every write.
+
+    Each application owns a row slot: inserts append, updates overwrite the
+    slot and deletes move the last row into the freed one, so the live rows
+    are always the first ``len`` entries. Location codes are never reused.
+    """
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        self.ids: list[str] = []
+        self.slots: dict[str, int] = {}
+        self.pay = np.empty(capacity, dtype=np.float64)
+        self.status = np.empty(capacity, dtype=np.int8)
+        self.location = np.empty(capacity, dtype=np.int32)
+        self.created_day = np.empty(capacity, dtype=np.int64)
+        self.location_codes: dict[str, int] = {}
+        self.locations: list[str] = []
+        self.totals = Totals(
+            status=np.zeros(UNKNOWN_STATUS + 1, dtype=np.int64), location=np.zeros(0, dtype=np.int64)
+        )
+        self._snapshot: ApplicationSnapshot | None = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict[str, Any]]) -> "ApplicationColumns":
+        columns = cls(capacity=0)
+        pay, status, location, created = [], [], [], []
+        for row in rows:
+            columns.slots[row["id"]] = len(columns.ids)
+            columns.ids.append(row["id"])
+            pay.append(row["pay"] if row.get("pay") is not None else np.nan)
+            status.append(STATUS_CODES.get(row["status"], UNKNOWN_STATUS))
+            location.append(columns._location_code(row.get("location")))
+            created.append(row["created_at"][:10])
+        columns.pay = np.array(pay, dtype=np.float64)
+        columns.status = np.array(status, dtype=np.int8)
+        columns.location = np.array(location, dtype=np.int32)
+        columns.created_day = np.array(created, dtype="datetime64[D]").astype(np.int64)
+
+        known = ~np.isnan(columns.pay)
+        columns.totals.status = np.bincount(columns.status, minlength=UNKNOWN_STATUS + 1).astype(np.int64)
+        columns.totals.location = np.bincount(
+            columns.location[columns.location >= 0], minlength=len(columns.locations)
+        ).astype(np.int64)
+        columns.totals.pay_count = int(known.sum())
+        columns.totals.pay_total = float(columns.pay[known].sum())
+        return columns
+
+    def _location_code(self, location: str | None) -> int:
+        if not location:
+            return -1
+        code = self.location_codes.get(location)
+        if code is None:
+            code = self.location_codes[location] = len(self.locations)
+            self.locations.append(location)
+            self.totals.location = np.append(self.totals.location, 0)
+        return code
+
+    def _reserve(self, needed: int) -> None:
+        if needed > len(self.status):
+            capacity = max(needed, len(self.status) * 2, INITIAL_CAPACITY)
+            self.pay = np.resize(self.pay, capacity)
+            self.status = np.resize(self.status, capacity)
+            self.location = np.resize(self.location, capacity)
+            self.created_day = np.resize(self.created_day, capacity)
+
+    def _count(self, slot: int, sign: int) -> None:
+        self.totals.status[self.status[slot]] += sign
+        if self.location[slot] >= 0:
+            self.totals.location[self.location[slot]] += sign
+        if not np.isnan(self.pay[slot]):
+            self.totals.pay_count += sign
+            self.totals.pay_total += sign * float(self.pay[slot])
+
+    def _write(self, slot: int, row: dict[str, Any]) -> None:
+        self.pay[slot] = row["pay"] if row.get("pay") is not None else np.nan
+        self.status[slot] = STATUS_CODES.get(row["status"], UNKNOWN_STATUS)
+        self.location[slot] = self._location_code(row.get("location"))
+        self.created_day[slot] = _day(row["created_at"])
+        self._count(slot, 1)
+
+    def upsert(self, row: dict[str, Any]) -> None:
+        slot = self.slots.get(row["id"])
+        if slot is None:
+            slot = len(self.ids)
+            self._reserve(slot + 1)
+            self.slots[row["id"]] = slot
+            self.ids.append(row["id"])
+        else:
+            self._count(slot, -1)
+        self._write(slot, row)
+        self._snapshot = None
+
+    def remove(self, application_id: str) -> None:
+        slot = self.slots.pop(application_id, None)
+        if slot is None:
+            return
+        self._count(slot, -1)
+        last = len(self.ids) - 1
+        if slot != last:
+            for column in (self.pay, self.status, self.location, self.created_day):
+                column[slot] = column[last]
+            self.ids[slot] = self.ids[last]
+            self.slots[self.ids[slot]] = slot
+        self.ids.pop()
+        self._snapshot = None
+
+    def apply(self, changes: Iterable[tuple[dict[str, Any] | None, dict[str, Any] | None]]) -> None:
+        for before, after in changes:
+            if after is None:
+                self.remove(before["id"])
+            else:
+                self.upsert(after)
+
+    def snapshot(self) -> ApplicationSnapshot:
+        """A frozen copy of the live rows; reused until the next write."""
+        if self._snapshot is None:
+            n = len(self.ids)
+            self._snapshot = ApplicationSnapshot(
+                pay=self.pay[:n].copy(),
+                status=self.status[:n].copy(),
+                location=self.location[:n].copy(),
+                created_day=self.created_day[:n].copy(),
+                locations=tuple(self.locations),
+                totals=self.totals.copy(),
+            )
+        return self._snapshot
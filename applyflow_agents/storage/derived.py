@@ -0,0 +1,124 @@
+"""Derived Caches - Per-user in-memory structures kept in sync with an ApplicationStore.
+
+A user's structure is built on first use from a read snapshot, so the scan
+never holds the database write lock, then patched from the store's change
+notifications, which arrive after each write commits together with the data
+version it produced. Writes that commit while a structure is loading are
+replayed onto it in version order. A structure that misses a write is
+dropped and rebuilt on next use, and the least recently used users are
+evicted past ``cache_size``.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Generic, Iterable, TypeVar
+
+from storage.applications import ApplicationStore, Change, read_version
+
+T = TypeVar("T")
+
+
+class UserCache(Generic[T]):
+    """Base for per-user structures derived from a user's applications.
+
+    Subclasses implement ``build`` and ``apply``; both run under ``_lock``
+    except the initial ``build``, which runs on a private structure. Hold
+    ``_lock`` while reading a structure returned by ``get``.
+    """
+
+    def __init__(self, store: ApplicationStore, cache_size: int):
+        self.store = store
+        self.cache_size = cache_size
+        # user -> (data version the structure reflects, structure)
+        self._entries: OrderedDict[str, tuple[int, T]] = OrderedDict()
+        # Change batches collected for loads in flight, one list per load
+        self._loading: dict[str, list[list[tuple[int, list[Change]]]]] = {}
+        self._lock = threading.Lock()
+        store.add_listener(self._on_change)
+
+    def build(self, rows: Iterable[dict[str, Any]]) -> T:
+        raise NotImplementedError
+
+    def apply(self, entry: T, changes: list[Change]) -> None:
+        raise NotImplementedError
+
+    def _on_change(self, user_id: str, changes: list[Change], version: int) -> None:
+        with self._lock:
+            for pending in self._loading.get(user_id, ()):
+                pending.append((version, changes))
+            cached = self._entries.get(user_id)
+            if cached is None or version <= cached[0]:
+                return
+            if version != cached[0] + 1:
+                # A notification arrived out of order; rebuild on next use
+                del self._entries[user_id]
+                return
+            self.apply(cached[1], changes)
+            self._entries[user_id] = (version, cached[1])
+
+    def _load(self, user_id: str) -> T:
+        pending: list[tuple[int, list[Change]]] = []
+        with self._lock:
+            self._loading.setdefault(user_id, []).append(pending)
+        try:
+            with self.store.pool.snapshot() as conn:
+                version = read_version(conn, user_id, "applications")
+                entry = self.build(self.store._scan(conn, user_id))
+        except BaseException:
+            with self._lock:
+                self._stop_loading(user_id, pending)
+            raise
+
+        with self._lock:
+            self._stop_loading(user_id, pending)
+            # Writes that committed after the snapshot was taken
+            for change_version, changes in sorted(pending, key=lambda item: item[0]):
+                if change_version <= version:
+                    continue
+                if change_version != version + 1:
+                    # One is still on its way; serve this build without caching it
+                    return entry
+                self.apply(entry, changes)
+                version = change_version
+            cached = self._entries.get(user_id)
+            if cached is not None and cached[0] >= version:
+                self._entries.move_to_end(user_id)
+                return cached[1]
+            self._entries[user_id] = (version, entry)
+            while len(self._entries) > self.cache_size:
+                self._entries.popitem(last=False)
+            return entry
+
+    def _stop_loading(self, user_id: str, pending: list) -> None:
+        # By identity: another load's list may compare equal
+        loads = [other for other in self._loading[user_id] if other is not pending]
+        if loads:
+            self._loading[user_id] = loads
+        else:
+            del self._loading[user_id]
+
+    def _sync(self, user_id: str) -> None:
+        """Drop a user's structure if the store holds writes it has not seen.
+
+        Catches writes by other worker processes, which send no
+        notifications here. This process's own writes advance the
+        structure's version as they are applied, so they cost no reload;
+        single-process stores skip the check.
+        """
+        if not self.store.shared:
+            return
+        version = self.store._version(user_id)
+        with self._lock:
+            cached = self._entries.get(user_id)
+            if cached is not None and cached[0] < version:
+                del self._entries[user_id]
+
+    def get(self, user_id: str) -> T:
+        """Return a user's structure, loading it on first use."""
+        self._sync(user_id)
+        with self._lock:
+            cached = self._entries.get(user_id)
+            if cached is not None:
+                self._entries.move_to_end(user_id)
+                return cached[1]
+        return self._load(user_id)
@@ -0,0 +1,236 @@
+"""Resume Store - Content-addressed resume files with a SQLite index."""
+
+import asyncio
+import hashlib
+import mimetypes
+import os
+import sqlite3
+import uuid
+from pathlib import Path
+from typing import Any, AsyncIterable, BinaryIO, Callable, Iterable
+
+from storage.applications import (
+    DB_PATH, POOL_SIZE, VERSIONS_SCHEMA, ConnectionPool, bump_version, read_version, utc_now)
+
+RESUME_DIR = os.getenv("APPLYFLOW_RESUME_DIR", "resumes")
+CHUNK_SIZE = 1024 * 1024
+MAX_RESUME_BYTES = int(os.getenv("APPLYFLOW_RESUME_MAX_BYTES", str(10 * 1024 * 1024)))
+
+# Called with the open transaction and the sha256 when the last resume with
+# that content is deleted, to drop whatever else is kept about it
+BlobListener = Callable[[sqlite3.Connection, str], None]
+
+RESUME_COLUMNS = ("id", "user_id", "file_name", "content_type", "sha256", "size", "created_at")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS resumes (
+    id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    file_name TEXT NOT NULL,
+    content_type TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_resumes_user_created
+    ON resumes (user_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_resumes_sha256
+    ON resumes (sha256);
+"""
+
+
+class ResumeTooLarge(ValueError):
+    """An upload exceeded the store's size limit."""
+
+
+def _write_chunk(out: BinaryIO, digest: "hashlib._Hash", chunk: bytes) -> None:
+    digest.update(chunk)
+    out.write(chunk)
+
+
+def _write_chunks(out: BinaryIO, digest: "hashlib._Hash", chunks: Iterable[bytes], max_bytes: int) -> None:
+    for chunk in chunks:
+        _check_size(out.tell() + len(chunk), max_bytes)
+        _write_chunk(out, digest, chunk)
+
+
+def _check_size(size: int, max_bytes: int) -> None:
+    if size > max_bytes:
+        raise ResumeTooLarge(f"Resume exceeds the {max_bytes} byte limit")
+
+
+class ResumeStore:
+    """Resume files stored once per distinct content.
+
+    Uploads stream to a temporary file while being hashed, then move to
+    ``blobs/<aa>/<sha256>``; identical uploads share one blob. The index maps
+    each user's resumes to blobs, and a blob is removed with its last
+    reference, together with anything blob listeners derived from it.
+    """
+
+    def __init__(
+        self,
+        path: str = DB_PATH,
+        directory: str | Path = RESUME_DIR,
+        pool_size: int = POOL_SIZE,
+        max_bytes: int = MAX_RESUME_BYTES,
+    ):
+        self.max_bytes = max_bytes
+        self.pool = ConnectionPool(path, pool_size)
+        self.directory = Path(directory)
+        self.blobs = self.directory / "blobs"
+        self.tmp = self.directory / "tmp"
+        self.blobs.mkdir(parents=True, exist_ok=True)
+        self.tmp.mkdir(parents=True, exist_ok=True)
+        self.blob_listeners: list[BlobListener] = []
+        with self.pool.connection() as conn:
+            conn.executescript(SCHEMA + VERSIONS_SCHEMA)
+
+    def close(self) -> None:
+        self.pool.close()
+
+    def blob_path(self, sha256: str) -> Path:
+        return self.blobs / sha256[:2] / sha256
+
+    def add_blob_listener(self, listener: BlobListener) -> None:
+        self.blob_listeners.append(listener)
+
+    # Sync implementations
+
+    def _commit(self, user_id: str, file_name: str, content_type: str | None, tmp: Path, sha256: str, size: int) -> dict[str, Any]:
+        record = {
+            "id": f"res_{uuid.uuid4().hex[:12]}",
+            "user_id": user_id,
+            "file_name": file_name,
+            "content_type": content_type or mimetypes.guess_type(file_name)[0] or "application/octet-stream",
+            "sha256": sha256,
+            "size": size,
+            "created_at": utc_now(),
+        }
+        blob = self.blob_path(sha256)
+        # Serialized with deletes so a blob cannot be removed between the
+        # existence check and the new reference being recorded
+        with self.pool.transaction() as conn:
+            deduplicated = blob.exists()
+            if deduplicated:
+                tmp.unlink()
+            else:
+                blob.parent.mkdir(exist_ok=True)
+                tmp.replace(blob)
+            conn.execute(
+                f"INSERT INTO resumes ({', '.join(RESUME_COLUMNS)}) "
+                f"VALUES ({', '.join(f':{column}' for column in RESUME_COLUMNS)})",
+                record,
+            )
+            bump_version(conn, user_id, "resumes")
+        return {**record, "deduplicated": deduplicated}
+
+    def _delete(self, user_id: str, resume_id: str) -> bool:
+        with self.pool.transaction() as conn:
+            row = conn.execute(
+                "DELETE FROM resumes WHERE id = ? AND user_id = ? RETURNING sha256",
+                (resume_id, user_id),
+            ).fetchone()
+            if row is None:
+                return False
+            bump_version(conn, user_id, "resumes")
+        # The blob goes only once the delete has committed; checked again under
+        # the write lock so an upload cannot start sharing it in between
+        with self.pool.transaction() as conn:
+            remaining = conn.execute(
+                "SELECT 1 FROM resumes WHERE sha256 = ? LIMIT 1", (row["sha256"],)
+            ).fetchone()
+            if remaining is None:
+                for listener in self.blob_listeners:
+                    listener(conn, row["sha256"])
+                self.blob_path(row["sha256"]).unlink(missing_ok=True)
+        return True
+
+    def _get(self, user_id: str, resume_id: str) -> dict[str, Any] | None:
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                "SELECT * FROM resumes WHERE id = ? AND user_id = ?", (resume_id, user_id)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def _list(self, user_id: str) -> list[dict[str, Any]]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                "SELECT * FROM resumes WHERE user_id = ? ORDER BY created_at DESC", (user_id,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def _version(self, user_id: str) -> int:
+        with self.pool.connection() as conn:
+            return read_version(conn, user_id, "resumes")
+
+    # Async API
+
+    async def add(
+        self,
+        user_id: str,
+        file_name: str,
+        chunks: AsyncIterable[bytes] | Iterable[bytes],
+        content_type: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Stream a resume to disk and index it.
+
+        Only one chunk is held in memory at a time; the SHA-256 is computed
+        while writing. Uploads larger than ``max_bytes`` raise ResumeTooLarge
+        and leave nothing behind.
+
+        Args:
+            user_id: Owner of the resume
+            file_name: Original file name, also used to guess the content type
+            chunks: The file content, sync or async
+            content_type: MIME type, guessed from file_name when omitted
+
+        Returns:
+            The index record plus whether the content was already stored
+        """
+        digest = hashlib.sha256()
+        tmp = self.tmp / f"{uuid.uuid4().hex}.part"
+        try:
+            with open(tmp, "wb") as out:
+                if hasattr(chunks, "__aiter__"):
+                    async for chunk in chunks:
+                        _check_size(out.tell() + len(chunk), self.max_bytes)
+                        await asyncio.to_thread(_write_chunk, out, digest, chunk)
+                else:
+                    await asyncio.to_thread(_write_chunks, out, digest, chunks, self.max_bytes)
+                size = out.tell()
+            return await asyncio.to_thread(
+                self._commit, user_id, file_name, content_type, tmp, digest.hexdigest(), size
+            )
+        finally:
+            tmp.unlink(missing_ok=True)
+
+    async def add_bytes(self, user_id: str, file_name: str, content: bytes, content_type: str | None = None) -> dict[str, Any]:
+        view = memoryview(content)
+        chunks = (view[i:i + CHUNK_SIZE] for i in range(0, len(view), CHUNK_SIZE))
+        return await self.add(user_id, file_name, chunks, content_type)
+
+    async def delete(self, user_id: str, resume_id: str) -> bool:
+        return await asyncio.to_thread(self._delete, user_id, resume_id)
+
+    async def get(self, user_id: str, resume_id: str) -> dict[str, Any] | None:
+        return await asyncio.to_thread(self._get, user_id, resume_id)
+
+    async def find(self, user_id: str) -> list[dict[str, Any]]:
+        return await asyncio.to_thread(self._list, user_id)
+
+    async def version(self, user_id: str) -> int:
+        """A counter that changes whenever the user's resumes do."""
+        return await asyncio.to_thread(self._version, user_id)
+
+
+_store: ResumeStore | None = None
+
+
+def get_resume_store() -> ResumeStore:
+    """Return the process-wide resume store, creating it on first use."""
+    global _store
+    if _store is None:
+        _store = ResumeStore()
+    return _store
@@ -0,0 +1,397 @@
+"""Application Search - Per-user inverted index with optional embeddings.
+
+Keyword queries are scored against an inverted index over job title,
+company, location, notes and job description; status, location, company
+and date filters become boolean masks over NumPy columns. When embeddings
+are enabled, each application also gets a vector in a NumPy matrix and
+cosine similarity is blended into the score, so near-miss wording still
+matches. Indexes load on first search and then follow the store's change
+notifications; see storage.derived.
+"""
+
+import math
+import os
+import zlib
+from collections import defaultdict
+from typing import Any, Callable, Iterable
+
+import numpy as np
+
+from ingest.ats import normalize_tokens
+from storage.applications import ApplicationStore, Change, get_application_store
+from storage.columnar import STATUS_CODES, UNKNOWN_STATUS
+from storage.derived import UserCache
+
+# Field -> weight of a term match in that field
+SEARCH_FIELDS = {
+    "job_title": 3.0,
+    "company": 2.0,
+    "location": 2.0,
+    "notes": 1.0,
+    "job_description": 1.0,
+}
+FILTER_FIELDS = ("company", "location")
+# Short fields that describe the role; descriptions are left out to keep embedding cheap
+EMBEDDING_FIELDS = ("job_title", "company", "location", "notes")
+
+# 0 disables embeddings
+EMBEDDING_DIM = int(os.getenv("APPLYFLOW_SEARCH_EMBEDDING_DIM", "0"))
+SEMANTIC_WEIGHT = 0.5
+MIN_SIMILARITY = 0.35
+INITIAL_CAPACITY = 1024
+# Users whose indexes are kept in memory
+SEARCH_CACHE_SIZE = int(os.getenv("APPLYFLOW_SEARCH_CACHE_SIZE", "64"))
+
+Embedder = Callable[[list[str]], np.ndarray]
+
+
+class HashingEmbedder:
+    """Local, dependency-free text vectors from hashed character trigrams.
+
+    Captures spelling-level similarity ("back-end" / "backend", typos), not
+    meaning; swap in a model-backed embedder for that.
+    """
+
+    def __init__(self, dim: int):
+        self.dim = dim
+
+    def __call__(self, texts: list[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            padded = f" {' '.join(normalize_tokens(text))} "
+            for i in range(len(padded) - 2):
+                bucket = zlib.crc32(padded[i:i + 3].encode())
+                vectors[row, bucket % self.dim] += 1.0 if bucket & 0x80000000 else -1.0
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+
+class Postings:
+    """Slots containing one term, as arrays ready for vectorized scoring.
+
+    A slot keeps its position for life, so re-indexing an application
+    overwrites its entry instead of adding a duplicate; removal zeroes the
+    strength and the array is compacted once most entries are dead.
+    """
+
+    def __init__(self):
+        self.slots = np.empty(4, dtype=np.int64)
+        self.strengths = np.empty(4, dtype=np.float32)
+        self.size = 0
+        self.count = 0
+        self.positions: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _reserve(self, needed: int) -> None:
+        if needed > len(self.slots):
+            capacity = max(needed, len(self.slots) * 2)
+            self.slots = np.resize(self.slots, capacity)
+            self.strengths = np.resize(self.strengths, capacity)
+
+    def extend(self, slots: list[int], strengths: list[float]) -> None:
+        """Append slots that are new to this term, in bulk."""
+        start, end = self.size, self.size + len(slots)
+        self._reserve(end)
+        self.slots[start:end] = slots
+        self.strengths[start:end] = strengths
+        self.positions.update(zip(slots, range(start, end)))
+        self.size = end
+        self.count += len(slots)
+
+    def set(self, slot: int, strength: float) -> None:
+        position = self.positions.get(slot)
+        if position is None:
+            self._reserve(self.size + 1)
+            position = self.positions[slot] = self.size
+            self.slots[position] = slot
+            self.strengths[position] = 0
+            self.size += 1
+        if not self.strengths[position]:
+            self.count += 1
+        self.strengths[position] = strength
+
+    def discard(self, slot: int) -> None:
+        position = self.positions.get(slot)
+        if position is None or not self.strengths[position]:
+            return
+        self.strengths[position] = 0
+        self.count -= 1
+        if self.count * 2 < self.size and self.size > 64:
+            self._compact()
+
+    def _compact(self) -> None:
+        live = np.flatnonzero(self.strengths[:self.size])
+        self.slots = self.slots[live].copy()
+        self.strengths = self.strengths[live].copy()
+        self.size = len(live)
+        self.positions = {int(slot): position for position, slot in enumerate(self.slots)}
+
+    def arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        return self.slots[:self.size], self.strengths[:self.size]
+
+
+def _day(value: str) -> int:
+    try:
+        return int(np.datetime64(value[:10], "D").astype(np.int64))
+    except ValueError:
+        raise ValueError(f"Invalid date {value!r}; expected YYYY-MM-DD") from None
+
+
+class UserIndex:
+    """Search structures for one user's applications.
+
+    Each application owns a slot in the column arrays; deleted slots are
+    masked out rather than reused.
+    """
+
+    def __init__(self, embedder: Embedder | None = None):
+        self.embedder = embedder
+        self.ids: list[str | None] = []
+        self.slots: dict[str, int] = {}
+        # term -> slots with their field-weighted match strength
+        self.postings: defaultdict[str, Postings] = defaultdict(Postings)
+        self.field_postings: defaultdict[tuple[str, str], Postings] = defaultdict(Postings)
+        self._slot_keys: dict[int, tuple[tuple[str, ...], tuple[tuple[str, str], ...]]] = {}
+        self.alive = np.zeros(INITIAL_CAPACITY, dtype=bool)
+        self.status = np.full(INITIAL_CAPACITY, UNKNOWN_STATUS, dtype=np.int8)
+        self.created_day = np.zeros(INITIAL_CAPACITY, dtype=np.int64)
+        self.vectors = (
+            np.zeros((INITIAL_CAPACITY, embedder([""]).shape[1]), dtype=np.float32) if embedder else None
+        )
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def _grow(self, needed: int) -> None:
+        capacity = len(self.alive)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        self.alive = np.resize(self.alive, capacity)
+        self.alive[len(self.ids):] = False
+        self.status = np.resize(self.status, capacity)
+        self.created_day = np.resize(self.created_day, capacity)
+        if self.vectors is not None:
+            vectors = np.zeros((capacity, self.vectors.shape[1]), dtype=np.float32)
+            vectors[:len(self.ids)] = self.vectors[:len(self.ids)]
+            self.vectors = vectors
+
+    def _terms(self, application: dict[str, Any]) -> tuple[dict[str, float], list[tuple[str, str]]]:
+        strengths: dict[str, float] = defaultdict(float)
+        field_keys = []
+        for field, weight in SEARCH_FIELDS.items():
+            value = application.get(field)
+            if not value:
+                continue
+            tokens = set(normalize_tokens(value))
+            for token in tokens:
+                strengths[token] += weight
+            if field in FILTER_FIELDS:
+                field_keys.extend((field, token) for token in tokens)
+        return strengths, field_keys
+
+    def _set_columns(self, slot: int, application: dict[str, Any], strengths: dict[str, float], field_keys: list[tuple[str, str]]) -> None:
+        self._slot_keys[slot] = (tuple(strengths), tuple(field_keys))
+        self.alive[slot] = True
+        self.status[slot] = STATUS_CODES.get(application["status"], UNKNOWN_STATUS)
+        self.created_day[slot] = _day(application["created_at"])
+
+    def _index(self, slot: int, application: dict[str, Any]) -> None:
+        strengths, field_keys = self._terms(application)
+        for token, strength in strengths.items():
+            self.postings[token].set(slot, strength)
+        for key in field_keys:
+            self.field_postings[key].set(slot, 1.0)
+        self._set_columns(slot, application, strengths, field_keys)
+
+    def _unindex(self, slot: int) -> None:
+        terms, field_keys = self._slot_keys.pop(slot)
+        for term in terms:
+            self.postings[term].discard(slot)
+        for key in field_keys:
+            self.field_postings[key].discard(slot)
+        self.alive[slot] = False
+
+    def _embed(self, slots: list[int], applications: list[dict[str, Any]]) -> None:
+        if self.vectors is None or not slots:
+            return
+        texts = [" ".join(app.get(field) or "" for field in EMBEDDING_FIELDS) for app in applications]
+        self.vectors[slots] = self.embedder(texts)
+
+    def add_many(self, applications: list[dict[str, Any]]) -> None:
+        self._grow(len(self.ids) + len(applications))
+        # Gather postings per term first; appending arrays in bulk is far
+        # cheaper than one element write per (application, term)
+        term_slots: defaultdict[str, tuple[list[int], list[float]]] = defaultdict(lambda: ([], []))
+        field_slots: defaultdict[tuple[str, str], list[int]] = defaultdict(list)
+        slots = []
+        for application in applications:
+            slot = len(self.ids)
+            self.ids.append(application["id"])
+            self.slots[application["id"]] = slot
+            strengths, field_keys = self._terms(application)
+            for token, strength in strengths.items():
+                entry = term_slots[token]
+                entry[0].append(slot)
+                entry[1].append(strength)
+            for key in field_keys:
+                field_slots[key].append(slot)
+            self._set_columns(slot, application, strengths, field_keys)
+            slots.append(slot)
+        for token, (new_slots, strengths) in term_slots.items():
+            self.postings[token].extend(new_slots, strengths)
+        for key, new_slots in field_slots.items():
+            self.field_postings[key].extend(new_slots, [1.0] * len(new_slots))
+        self._embed(slots, applications)
+
+    def update(self, application: dict[str, Any]) -> None:
+        slot = self.slots.get(application["id"])
+        if slot is None:
+            self.add_many([application])
+            return
+        self._unindex(slot)
+        self._index(slot, application)
+        self._embed([slot], [application])
+
+    def remove(self, application_id: str) -> None:
+        slot = self.slots.pop(application_id, None)
+        if slot is not None:
+            self._unindex(slot)
+            self.ids[slot] = None
+
+    def search(
+        self,
+        query: str = "",
+        status: str | None = None,
+        location: str | None = None,
+        company: str | None = None,
+        since_day: int | None = None,
+        until_day: int | None = None,
+        limit: int = 20,
+    ) -> list[tuple[str, float]]:
+        """Return (application id, score) pairs, best first; newest first without a query."""
+        n = len(self.ids)
+        if limit <= 0 or n == 0:
+            return []
+        mask = self.alive[:n].copy()
+        if status:
+            mask &= self.status[:n] == STATUS_CODES.get(status, UNKNOWN_STATUS)
+        if since_day is not None:
+            mask &= self.created_day[:n] >= since_day
+        if until_day is not None:
+            mask &= self.created_day[:n] <= until_day
+        for field, value in (("location", location), ("company", company)):
+            for token in normalize_tokens(value or ""):
+                postings = self.field_postings.get((field, token))
+                if not postings:
+                    return []
+                slots, strengths = postings.arrays()
+                field_mask = np.zeros(n, dtype=bool)
+                field_mask[slots[strengths > 0]] = True
+                mask &= field_mask
+
+        terms = set(normalize_tokens(query))
+        if terms:
+            scores = np.zeros(n, dtype=np.float32)
+            for term in terms:
+                postings = self.postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + len(self.slots) / len(postings))
+                slots, strengths = postings.arrays()
+                scores[slots] += idf * strengths
+            matched = scores > 0
+            if self.vectors is not None:
+                similarity = self.vectors[:n] @ self.embedder([query])[0]
+                scores = scores / max(float(scores.max()), 1e-9) + SEMANTIC_WEIGHT * np.clip(similarity, 0, None)
+                matched |= similarity >= MIN_SIMILARITY
+            mask &= matched
+        else:
+            scores = self.created_day[:n].astype(np.float32)
+
+        candidates = np.flatnonzero(mask)
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        # Best score first, newest first among ties
+        order = np.lexsort((-self.created_day[candidates], -scores[candidates]))
+        return [(self.ids[slot], round(float(scores[slot]), 4) if terms else 0.0) for slot in candidates[order]]
+
+
+class ApplicationSearchIndex(UserCache[UserIndex]):
+    """Search indexes for every user, kept in sync with an ApplicationStore."""
+
+    def __init__(self, store: ApplicationStore, embedding_dim: int = EMBEDDING_DIM, cache_size: int = SEARCH_CACHE_SIZE):
+        super().__init__(store, cache_size)
+        self.embedder = HashingEmbedder(embedding_dim) if embedding_dim else None
+
+    def build(self, rows: Iterable[dict[str, Any]]) -> UserIndex:
+        index = UserIndex(self.embedder)
+        index.add_many(list(rows))
+        return index
+
+    def apply(self, index: UserIndex, changes: list[Change]) -> None:
+        for before, after in changes:
+            if after is None:
+                index.remove(before["id"])
+            else:
+                index.update(after)
+
+    def search_ids(
+        self,
+        user_id: str,
+        query: str = "",
+        status: str | None = None,
+        location: str | None = None,
+        company: str | None = None,
+        applied_after: str | None = None,
+        applied_before: str | None = None,
+        limit: int = 20,
+    ) -> list[tuple[str, float]]:
+        since_day = _day(applied_after) if applied_after else None
+        until_day = _day(applied_before) if applied_before else None
+        index = self.get(user_id)
+        with self._lock:
+            return index.search(
+                query,
+                status=status,
+                location=location,
+                company=company,
+                since_day=since_day,
+                until_day=until_day,
+                limit=limit,
+            )
+
+    def search(self, user_id: str, query: str = "", limit: int = 20, **filters: Any) -> list[dict[str, Any]]:
+        """
+        Search a user's applications.
+
+        Args:
+            user_id: Owner of the applications
+            query: Free-text keywords; when empty, matches are listed newest first
+            limit: Maximum number of results
+            **filters: status, location, company, applied_after and
+                applied_before (ISO dates, inclusive)
+
+        Returns:
+            Matching applications, best first, each with its score
+
+        Raises:
+            ValueError: A date filter is not an ISO date
+        """
+        hits = self.search_ids(user_id, query, limit=limit, **filters)
+        rows = {row["id"]: row for row in self.store._get_many(user_id, [app_id for app_id, _ in hits])}
+        return [{**rows[app_id], "score": score} for app_id, score in hits if app_id in rows]
+
+
+_search: ApplicationSearchIndex | None = None
+
+
+def get_search_index() -> ApplicationSearchIndex:
+    """Return the process-wide search index attached to the application store."""
+    global _search
+    if _search is None:
+        _search = ApplicationSearchIndex(get_application_store())
+    return _search
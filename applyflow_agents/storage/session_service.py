@@ -0,0 +1,89 @@
+"""Session Service - ADK session service over the spill-to-disk session store."""
+
+from typing import Any
+
+from google.adk.events import Event
+from google.adk.sessions import BaseSessionService, Session
+from google.adk.sessions.base_session_service import GetSessionConfig, ListSessionsResponse
+
+from storage.sessions import SessionStore
+
+
+def session_from_dict(session: dict[str, Any]) -> Session:
+    return Session(
+        id=session["id"],
+        app_name=session["app_name"],
+        user_id=session["user_id"],
+        state=session["state"],
+        events=[Event.model_validate(event) for event in session["events"]],
+        last_update_time=session["last_update_time"],
+    )
+
+
+class SpillingSessionService(BaseSessionService):
+    """Drop-in replacement for ADK's in-memory session service.
+
+    Sessions are returned as copies, as the in-memory service does, and
+    appended events are applied to the stored session and written to disk.
+    State is kept per session; ``app:`` and ``user:`` keys are not shared
+    across sessions.
+    """
+
+    def __init__(self, store: SessionStore):
+        self.store = store
+
+    @staticmethod
+    def _copy(session: Session, config: GetSessionConfig | None = None) -> Session:
+        copy = session.model_copy(deep=True)
+        if config is not None:
+            if config.after_timestamp:
+                copy.events = [e for e in copy.events if e.timestamp >= config.after_timestamp]
+            if config.num_recent_events:
+                copy.events = copy.events[-config.num_recent_events:]
+        return copy
+
+    async def create_session(
+        self, *, app_name: str, user_id: str, state: dict[str, Any] | None = None,
+        session_id: str | None = None,
+    ) -> Session:
+        return self._copy(await self.store.create(app_name, user_id, state, session_id))
+
+    async def get_session(
+        self, *, app_name: str, user_id: str, session_id: str, config: GetSessionConfig | None = None,
+    ) -> Session | None:
+        session = await self.store.get(app_name, user_id, session_id)
+        return None if session is None else self._copy(session, config)
+
+    async def list_sessions(self, *, app_name: str, user_id: str | None = None) -> ListSessionsResponse:
+        return ListSessionsResponse(sessions=await self.store.find(app_name, user_id))
+
+    async def delete_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        await self.store.delete(app_name, user_id, session_id)
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        # The base class skips partial events and applies the state delta
+        # to the caller's copy
+        event = await super().append_event(session, event)
+        if event.partial:
+            return event
+        stored = await self.store.get(session.app_name, session.user_id, session.id)
+        if stored is None:
+            raise ValueError(f"Session {session.id} not found")
+        await super().append_event(stored, event)
+        session.last_update_time = stored.last_update_time = event.timestamp
+        await self.store.append_event(
+            session.app_name, session.user_id, session.id,
+            event.model_dump(mode="json", exclude_none=True), event.actions.state_delta, event.timestamp,
+        )
+        return event
+
+
+_service: SpillingSessionService | None = None
+
+
+def get_session_service() -> SpillingSessionService:
+    """Return the process-wide session service, creating it on first use."""
+    global _service
+    if _service is None:
+        _service = SpillingSessionService(SessionStore(decode=session_from_dict))
+    return _service
@@ -0,0 +1,324 @@
+"""Session Store - Agent sessions in SQLite with a bounded in-memory hot set.
+
+Every session and event is written through to a WAL-mode SQLite file, so
+sessions survive restarts and evicting one from memory costs nothing. Each
+agent (ADK app name) keeps its recently used sessions decoded in an LRU
+bounded by a memory budget; a session that was evicted is read back from
+disk the next time it is used. Budgets count the encoded JSON size of the
+sessions, which tracks but understates their in-memory size.
+
+With several worker processes any of them may serve a session's next
+turn, so each session row carries a version bumped by every append, and a
+hot session is checked against it before use.
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from observability.metrics import Counter, Gauge, registry
+from storage.applications import POOL_SIZE, WORKERS, ConnectionPool
+
+SESSION_DB_PATH = os.getenv("APPLYFLOW_SESSION_DB_PATH", "sessions.db")
+# Hot set budget in MB: one number for every agent, optionally followed by
+# per-agent overrides, e.g. "32,resume_agent=64"
+SESSION_MEMORY_MB = os.getenv("APPLYFLOW_SESSION_MEMORY_MB", "32")
+# Idle sessions are deleted, from disk too, after this many seconds
+SESSION_TIMEOUT = int(os.getenv("APPLYFLOW_SESSION_TIMEOUT", str(30 * 24 * 3600)))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    state TEXT NOT NULL,
+    last_update_time REAL NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_app_user
+    ON sessions (app_name, user_id);
+CREATE TABLE IF NOT EXISTS session_events (
+    session_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    event TEXT NOT NULL,
+    PRIMARY KEY (session_id, seq)
+);
+"""
+
+SESSION_LOADS = registry.register(Counter(
+    "applyflow_session_loads_total", "Session reads by where they were found.", ["agent", "source"]))
+SESSION_EVICTIONS = registry.register(Counter(
+    "applyflow_session_evictions_total", "Sessions dropped from the in-memory hot set.", ["agent"]))
+SESSION_HOT = registry.register(Gauge(
+    "applyflow_session_hot_sessions", "Sessions held in memory.", ["agent"]))
+SESSION_HOT_BYTES = registry.register(Gauge(
+    "applyflow_session_hot_bytes", "Encoded size of the sessions held in memory.", ["agent"]))
+
+# Turns a stored session dict (id, app_name, user_id, state, events,
+# last_update_time) into the object handed to callers
+Decoder = Callable[[dict[str, Any]], Any]
+
+
+def parse_memory_budgets(value: str) -> tuple[int, dict[str, int]]:
+    """Parse "32,resume_agent=64" into a default and per-agent budgets in bytes."""
+    default, budgets = 0, {}
+    for part in filter(None, (p.strip() for p in value.split(","))):
+        name, _, megabytes = part.rpartition("=")
+        size = int(float(megabytes) * 1024 * 1024)
+        if name:
+            budgets[name.strip()] = size
+        else:
+            default = size
+    return default, budgets
+
+
+@dataclass
+class HotSession:
+    user_id: str
+    value: Any
+    size: int
+    version: int
+
+
+class SessionStore:
+    """Write-through session storage with a per-agent LRU of decoded sessions.
+
+    Hot sessions are the live decoded objects; callers that hand sessions
+    out should copy them, and must report appended events through
+    ``append_event`` so the disk copy and the size accounting stay current.
+    """
+
+    def __init__(
+        self,
+        path: str = SESSION_DB_PATH,
+        memory: str | tuple[int, dict[str, int]] = SESSION_MEMORY_MB,
+        decode: Decoder = dict,
+        pool_size: int = POOL_SIZE,
+        shared: bool = WORKERS > 1,
+    ):
+        self.pool = ConnectionPool(path, pool_size)
+        # Whether other processes write this database too
+        self.shared = shared
+        self.default_budget, self.budgets = parse_memory_budgets(memory) if isinstance(memory, str) else memory
+        self.decode = decode
+        self._hot: dict[str, OrderedDict[str, HotSession]] = {}
+        self._hot_bytes: dict[str, int] = {}
+        with self.pool.connection() as conn:
+            conn.executescript(SCHEMA)
+            existing = {row["name"] for row in conn.execute("PRAGMA table_info(sessions)")}
+            if "version" not in existing:
+                try:
+                    conn.execute("ALTER TABLE sessions ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+                except sqlite3.OperationalError as e:
+                    # Another worker migrated first
+                    if "duplicate column" not in str(e):
+                        raise
+
+    def close(self) -> None:
+        self.pool.close()
+
+    def budget(self, app_name: str) -> int:
+        return self.budgets.get(app_name, self.default_budget)
+
+    def hot_sessions(self, app_name: str) -> int:
+        return len(self._hot.get(app_name, ()))
+
+    def hot_bytes(self, app_name: str) -> int:
+        return self._hot_bytes.get(app_name, 0)
+
+    # Hot set
+
+    def _cached(self, app_name: str, user_id: str, session_id: str) -> HotSession | None:
+        entry = self._hot.get(app_name, {}).get(session_id)
+        if entry is None or entry.user_id != user_id:
+            return None
+        self._hot[app_name].move_to_end(session_id)
+        return entry
+
+    def _admit(self, app_name: str, user_id: str, session_id: str, value: Any, size: int, version: int) -> Any:
+        hot = self._hot.setdefault(app_name, OrderedDict())
+        previous = hot.pop(session_id, None)
+        total = self._hot_bytes.get(app_name, 0) - (previous.size if previous else 0) + size
+        hot[session_id] = HotSession(user_id, value, size, version)
+        # The session just used always stays, even if it alone exceeds the budget
+        budget = self.budget(app_name)
+        while total > budget and len(hot) > 1:
+            _, evicted = hot.popitem(last=False)
+            total -= evicted.size
+            SESSION_EVICTIONS.inc(app_name)
+        self._hot_bytes[app_name] = total
+        SESSION_HOT.set(app_name, value=len(hot))
+        SESSION_HOT_BYTES.set(app_name, value=total)
+        return value
+
+    def _forget(self, app_name: str, session_id: str) -> None:
+        entry = self._hot.get(app_name, {}).pop(session_id, None)
+        if entry is not None:
+            self._hot_bytes[app_name] -= entry.size
+            SESSION_HOT.set(app_name, value=len(self._hot[app_name]))
+            SESSION_HOT_BYTES.set(app_name, value=self._hot_bytes[app_name])
+
+    # Sync API (runs on a worker thread)
+
+    def _insert(self, session: dict[str, Any]) -> None:
+        with self.pool.connection() as conn:
+            conn.execute(
+                "INSERT INTO sessions (id, app_name, user_id, state, last_update_time) VALUES (?, ?, ?, ?, ?)",
+                (session["id"], session["app_name"], session["user_id"],
+                 json.dumps(session["state"]), session["last_update_time"]),
+            )
+
+    def _load(self, app_name: str, user_id: str, session_id: str) -> tuple[dict[str, Any], int, int] | None:
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                "SELECT * FROM sessions WHERE id = ? AND app_name = ? AND user_id = ?",
+                (session_id, app_name, user_id),
+            ).fetchone()
+            if row is None:
+                return None
+            events = [
+                event for (event,) in conn.execute(
+                    "SELECT event FROM session_events WHERE session_id = ? ORDER BY seq", (session_id,)
+                )
+            ]
+        size = len(row["state"]) + sum(len(event) for event in events)
+        session = {
+            "id": row["id"],
+            "app_name": row["app_name"],
+            "user_id": row["user_id"],
+            "state": json.loads(row["state"]),
+            "events": [json.loads(event) for event in events],
+            "last_update_time": row["last_update_time"],
+        }
+        return session, size, row["version"]
+
+    def _version(self, session_id: str) -> int | None:
+        with self.pool.connection() as conn:
+            row = conn.execute("SELECT version FROM sessions WHERE id = ?", (session_id,)).fetchone()
+        return None if row is None else row[0]
+
+    def _find(self, app_name: str, user_id: str | None) -> list[dict[str, Any]]:
+        query = "SELECT * FROM sessions WHERE app_name = ?"
+        params: tuple[str, ...] = (app_name,)
+        if user_id is not None:
+            query += " AND user_id = ?"
+            params += (user_id,)
+        with self.pool.connection() as conn:
+            rows = conn.execute(query + " ORDER BY last_update_time DESC", params).fetchall()
+        return [
+            {
+                "id": row["id"],
+                "app_name": row["app_name"],
+                "user_id": row["user_id"],
+                "state": json.loads(row["state"]),
+                "events": [],
+                "last_update_time": row["last_update_time"],
+            }
+            for row in rows
+        ]
+
+    def _delete(self, app_name: str, user_id: str, session_id: str) -> bool:
+        with self.pool.transaction() as conn:
+            deleted = conn.execute(
+                "DELETE FROM sessions WHERE id = ? AND app_name = ? AND user_id = ?",
+                (session_id, app_name, user_id),
+            ).rowcount
+            if deleted:
+                conn.execute("DELETE FROM session_events WHERE session_id = ?", (session_id,))
+        return bool(deleted)
+
+    def _append(self, session_id: str, event: str, state_delta: dict[str, Any], last_update_time: float) -> int:
+        # The delta is merged into the stored state rather than overwriting
+        # it, so appends from different workers don't lose each other's keys
+        with self.pool.transaction() as conn:
+            row = conn.execute("SELECT state, version FROM sessions WHERE id = ?", (session_id,)).fetchone()
+            if row is None:
+                raise KeyError(f"Session {session_id} not found")
+            state = row["state"]
+            if state_delta:
+                state = json.dumps({**json.loads(state), **state_delta})
+            conn.execute(
+                "INSERT INTO session_events (session_id, seq, event) VALUES "
+                "(?, (SELECT COALESCE(MAX(seq) + 1, 0) FROM session_events WHERE session_id = ?), ?)",
+                (session_id, session_id, event),
+            )
+            conn.execute(
+                "UPDATE sessions SET state = ?, last_update_time = ?, version = version + 1 WHERE id = ?",
+                (state, last_update_time, session_id),
+            )
+        return row["version"] + 1
+
+    # Async API
+
+    async def create(
+        self, app_name: str, user_id: str, state: dict[str, Any] | None = None, session_id: str | None = None,
+    ) -> Any:
+        session = {
+            "id": session_id or uuid.uuid4().hex,
+            "app_name": app_name,
+            "user_id": user_id,
+            "state": dict(state or {}),
+            "events": [],
+            "last_update_time": time.time(),
+        }
+        await asyncio.to_thread(self._insert, session)
+        size = len(json.dumps(session["state"]))
+        return self._admit(app_name, user_id, session["id"], self.decode(session), size, 0)
+
+    async def get(self, app_name: str, user_id: str, session_id: str) -> Any | None:
+        """Return the live session, reading it back from disk if it was evicted."""
+        entry = self._cached(app_name, user_id, session_id)
+        if entry is not None and self.shared:
+            if await asyncio.to_thread(self._version, session_id) != entry.version:
+                self._forget(app_name, session_id)
+                entry = None
+        if entry is not None:
+            SESSION_LOADS.inc(app_name, "memory")
+            return entry.value
+        loaded = await asyncio.to_thread(self._load, app_name, user_id, session_id)
+        if loaded is None:
+            SESSION_LOADS.inc(app_name, "missing")
+            return None
+        SESSION_LOADS.inc(app_name, "disk")
+        # Another request may have loaded it while this one was reading
+        entry = self._cached(app_name, user_id, session_id)
+        if entry is not None:
+            return entry.value
+        session, size, version = loaded
+        return self._admit(app_name, user_id, session_id, self.decode(session), size, version)
+
+    async def find(self, app_name: str, user_id: str | None = None) -> list[Any]:
+        """Sessions without their events, most recently updated first."""
+        return [self.decode(session) for session in await asyncio.to_thread(self._find, app_name, user_id)]
+
+    async def delete(self, app_name: str, user_id: str, session_id: str) -> bool:
+        self._forget(app_name, session_id)
+        return await asyncio.to_thread(self._delete, app_name, user_id, session_id)
+
+    async def append_event(
+        self,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        event: dict[str, Any],
+        state_delta: dict[str, Any] | None,
+        last_update_time: float,
+    ) -> None:
+        """Persist an event the caller has already applied to the live session."""
+        encoded = json.dumps(event)
+        version = await asyncio.to_thread(self._append, session_id, encoded, state_delta, last_update_time)
+        entry = self._cached(app_name, user_id, session_id)
+        if entry is None:
+            return
+        if version == entry.version + 1:
+            self._admit(app_name, user_id, session_id, entry.value, entry.size + len(encoded), version)
+        else:
+            # Another append landed first; the live session may be missing it
+            self._forget(app_name, session_id)
+
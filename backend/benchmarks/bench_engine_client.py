@@ -0,0 +1,94 @@
+"""Bursts of chat turns against a slow, flaky local engine, with and without the client.
+
+Each user creates a session and sends messages concurrently. The "direct"
+mode calls the engine as the routers used to; "client" goes through
+ResilientEngineClient. The "outage" scenario fails every call to show the
+circuit breaker shedding load instead of hammering the engine.
+
+Usage (from backend/):
+    python -m benchmarks.bench_engine_client --users 50 --messages 10 --failure-rate 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from services.engine_client import ResilientEngineClient
+from services.local_engine import LocalAgentEngine
+
+
+async def burst(engine, users: int, messages: int) -> dict:
+    latencies, outcomes = [], {"ok": 0, "failed": 0}
+
+    async def turn(user_id: str, session_id: str, i: int) -> None:
+        start = time.perf_counter()
+        try:
+            async for _ in engine.async_stream_query(session_id=session_id, user_id=user_id, message=f"hi {i}"):
+                pass
+            outcomes["ok"] += 1
+        except Exception:
+            outcomes["failed"] += 1
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    async def user(n: int) -> None:
+        user_id = f"user_{n}"
+        try:
+            session = await engine.async_create_session(user_id=user_id)
+        except Exception:
+            outcomes["failed"] += messages
+            return
+        await asyncio.gather(*(turn(user_id, session["id"], i) for i in range(messages)))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(user(n) for n in range(users)))
+    latencies.sort()
+    return {
+        "wall_seconds": round(time.perf_counter() - start, 3),
+        "success_rate": round(outcomes["ok"] / (users * messages), 3),
+        "p50_ms": round(statistics.median(latencies), 1) if latencies else None,
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1], 1) if latencies else None,
+    }
+
+
+async def run(mode: str, args: argparse.Namespace, failure_rate: float) -> dict:
+    local = LocalAgentEngine(latency=args.latency, failure_rate=failure_rate, seed=7)
+    engine = local
+    if mode == "client":
+        engine = ResilientEngineClient(
+            local,
+            max_concurrency=args.max_concurrency,
+            max_concurrency_per_user=args.per_user,
+            max_queue=args.users * (args.messages + 1),
+            call_timeout=args.timeout,
+            retry_base=args.latency,
+            breaker_failure_threshold=args.breaker_threshold,
+        )
+    result = await burst(engine, args.users, args.messages)
+    result.update(mode=mode, failure_rate=failure_rate, peak_engine_concurrency=local.peak_in_flight)
+    if mode == "client":
+        result["client"] = engine.stats()
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--messages", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--failure-rate", type=float, default=0.2)
+    parser.add_argument("--max-concurrency", type=int, default=32)
+    parser.add_argument("--per-user", type=int, default=4)
+    parser.add_argument("--timeout", type=float, default=5.0)
+    parser.add_argument("--breaker-threshold", type=int, default=20)
+    args = parser.parse_args()
+
+    for failure_rate, scenario in ((args.failure_rate, "flaky"), (1.0, "outage")):
+        for mode in ("direct", "client"):
+            result = asyncio.run(run(mode, args, failure_rate))
+            print(json.dumps({"scenario": scenario, **result}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Compare buffered vs stream-and-discard final text extraction under load.
+
+Runs each mode in a fresh subprocess so peak RSS is measured independently.
+
+Usage (from backend/):
+    python -m benchmarks.bench_send_message --concurrency 100 --events 2000
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+from services.streaming import collect_final_text, extract_text
+
+
+async def fake_stream(events: int, payload_bytes: int):
+    """Simulate a tool-heavy turn: large tool responses, then a final text."""
+    payload = "x" * payload_bytes
+    for i in range(events - 1):
+        yield {"content": {"parts": [{"function_response": {"id": i, "response": payload + str(i)}}]}}
+        if i % 50 == 0:
+            await asyncio.sleep(0)
+    yield {"content": {"parts": [{"text": "final answer"}]}}
+
+
+async def buffered(stream) -> str:
+    """The previous implementation: collect everything, then scan backwards."""
+    messages = [message async for message in stream]
+    for message in reversed(messages):
+        text = extract_text(message)
+        if text:
+            return text
+    return ""
+
+
+async def streaming(stream) -> str:
+    return (await collect_final_text(stream)).text
+
+
+async def run(mode: str, concurrency: int, events: int, payload_bytes: int) -> dict:
+    handler = buffered if mode == "buffered" else streaming
+    latencies = []
+
+    async def turn():
+        start = time.perf_counter()
+        assert await handler(fake_stream(events, payload_bytes)) == "final answer"
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(turn() for _ in range(concurrency)))
+    return {
+        "mode": mode,
+        "concurrency": concurrency,
+        "events_per_turn": events,
+        "wall_seconds": round(time.perf_counter() - start, 3),
+        "p50_ms": round(statistics.median(latencies), 2),
+        "max_ms": round(max(latencies), 2),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mode", choices=["buffered", "streaming"])
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--payload-bytes", type=int, default=2048)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(asyncio.run(run(args.mode, args.concurrency, args.events, args.payload_bytes))))
+        return
+
+    for mode in ("buffered", "streaming"):
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_send_message", "--mode", mode,
+             "--concurrency", str(args.concurrency), "--events", str(args.events),
+             "--payload-bytes", str(args.payload_bytes)],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
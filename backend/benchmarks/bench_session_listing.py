@@ -0,0 +1,72 @@
+"""Payload size and latency of GET /chat/sessions for users with many sessions.
+
+Drives the route function directly against the local stand-in engine.
+
+Usage (from backend/):
+    AGENT_ENGINE_BACKEND=local python -m benchmarks.bench_session_listing --sessions 1000 5000
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from routers.chat import get_sessions
+from services.local_engine import LocalAgentEngine
+from services.session_cache import session_cache
+
+USER_ID = "bench_user"
+
+SCENARIOS = {
+    "full_uncached": dict(cursor=None, limit=None, include_events=True, fields=None, cached=False),
+    "summaries_uncached": dict(cursor=None, limit=None, include_events=False, fields=None, cached=False),
+    "summaries_cached": dict(cursor=None, limit=None, include_events=False, fields=None, cached=True),
+    "sidebar_page": dict(cursor=None, limit=50, include_events=False, fields=None, cached=True),
+    "sidebar_ids_only": dict(cursor=None, limit=50, include_events=False, fields="session_id,timestamp", cached=True),
+}
+
+
+async def seed(sessions: int, events_per_session: int) -> LocalAgentEngine:
+    engine = LocalAgentEngine()
+    for i in range(sessions):
+        session = await engine.async_create_session(user_id=USER_ID)
+        for turn in range(events_per_session // 2):
+            async for _ in engine.async_stream_query(session["id"], USER_ID, f"message {i}-{turn}"):
+                pass
+    return engine
+
+
+async def run(sessions: int, events_per_session: int, iterations: int) -> dict:
+    engine = await seed(sessions, events_per_session)
+    results = {}
+    for name, scenario in SCENARIOS.items():
+        params = {k: v for k, v in scenario.items() if k != "cached"}
+        latencies, size = [], 0
+        for _ in range(iterations):
+            if not scenario["cached"]:
+                session_cache.clear()
+            start = time.perf_counter()
+            page = await get_sessions(USER_ID, adk_app=engine, **params)
+            size = len(page.model_dump_json())
+            latencies.append((time.perf_counter() - start) * 1000)
+        results[name] = {
+            "p50_ms": round(statistics.median(latencies), 2),
+            "payload_kb": round(size / 1024, 1),
+        }
+    return {"sessions": sessions, "events_per_session": events_per_session, "scenarios": results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--events", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    for sessions in args.sessions:
+        print(json.dumps(asyncio.run(run(sessions, args.events, args.iterations))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Microbenchmark SSE frame encoding: previous json.dumps + str path vs bytes frames.
+
+Usage (from backend/):
+    python -m benchmarks.bench_sse --events 200000
+"""
+
+import argparse
+import json
+import time
+
+from sse_starlette.sse import ensure_bytes
+
+from services.sse import encode_frame, get_serializer
+
+
+def make_event(i: int) -> dict:
+    return {
+        "id": f"evt-{i}",
+        "author": "ApplicationTracking",
+        "partial": True,
+        "timestamp": 1730000000.0 + i,
+        "content": {"role": "model", "parts": [{"text": f"token{i} "}]},
+    }
+
+
+def legacy(event: dict) -> bytes:
+    # What EventSourceResponse did with the previous f"{json.dumps(event)}\n\n" strings
+    return ensure_bytes(f"{json.dumps(event)}\n\n", "\r\n")
+
+
+def measure(name: str, encode, events: list[dict]) -> dict:
+    start = time.perf_counter()
+    total = sum(len(encode(event)) for event in events)
+    elapsed = time.perf_counter() - start
+    return {
+        "encoder": name,
+        "events_per_sec": round(len(events) / elapsed),
+        "mb_per_sec": round(total / elapsed / 1e6, 1),
+        "bytes_per_event": round(total / len(events), 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=200_000)
+    args = parser.parse_args()
+
+    events = [make_event(i) for i in range(args.events)]
+    encoders = {"legacy": legacy}
+    for name in ("json", "orjson"):
+        try:
+            serialize = get_serializer(name)
+        except ImportError:
+            continue
+        encoders[name] = lambda event, serialize=serialize: encode_frame(serialize(event))
+
+    for name, encode in encoders.items():
+        print(json.dumps(measure(name, encode, events)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Measure worker start-up: time until /health answers and until /ready succeeds.
+
+Uses the local stand-in engine by default so it runs offline.
+
+Usage (from backend/):
+    python -m benchmarks.bench_startup --runs 5 --backend local
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+
+def wait_for(url: str, deadline: float) -> float:
+    while time.perf_counter() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    return time.perf_counter()
+        except (urllib.error.URLError, ConnectionError):
+            pass
+        time.sleep(0.01)
+    raise TimeoutError(url)
+
+
+def run_once(backend: str, port: int, timeout: float) -> dict:
+    env = {**os.environ, "AGENT_ENGINE_BACKEND": backend}
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        env=env,
+    )
+    try:
+        deadline = start + timeout
+        health = wait_for(f"http://127.0.0.1:{port}/health", deadline)
+        ready = wait_for(f"http://127.0.0.1:{port}/ready", deadline)
+    finally:
+        server.terminate()
+        server.wait()
+    return {"health_ms": (health - start) * 1000, "ready_ms": (ready - start) * 1000}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--backend", default="local", choices=["local", "vertex"])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    runs = [run_once(args.backend, args.port, args.timeout) for _ in range(args.runs)]
+    print(json.dumps({
+        "backend": args.backend,
+        "runs": args.runs,
+        **{
+            key: round(statistics.median(run[key] for run in runs), 1)
+            for key in ("health_ms", "ready_ms")
+        },
+    }))
+
+
+if __name__ == "__main__":
+    main()
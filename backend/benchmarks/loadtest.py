@@ -0,0 +1,342 @@
+"""Load test the chat API and the agents service against offline stand-ins.
+
+Each scenario sends ``--requests`` requests from ``--concurrency`` workers,
+each worker acting as its own user, and reports throughput, latency
+percentiles, time to first token for streams and server memory per
+connection. Results are printed as JSON and written to ``--output``, tagged
+with the git commit, so runs can be compared across revisions.
+
+The server is started as a subprocess on the offline stand-ins: the backend
+on the local engine and its scripted model, the agents service on
+``benchmarks.serve_fake``. Pass ``--url`` to test a server that is already
+running instead, or ``--in-process`` to call the backend app through
+httpx's ASGI transport without a server (ASGI responses are buffered, so
+time to first token then equals the full latency).
+
+Usage (from backend/):
+    python -m benchmarks.loadtest --service backend --concurrency 50 --requests 2000
+    python -m benchmarks.loadtest --service agents --concurrency 20 --requests 500 --output agents.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+AGENTS_DIR = BACKEND_DIR.parent / "applyflow_agents"
+
+BACKEND_SCENARIOS = ("create_session", "send_message", "stream_message")
+AGENT_ENDPOINTS = {
+    "agents_applications": "/agents/applications",
+    "agents_resumes": "/agents/resumes",
+    "agents_insights": "/agents/insights",
+}
+AG_UI_TEXT_EVENTS = ("TEXT_MESSAGE_CONTENT", "TEXT_MESSAGE_CHUNK")
+
+
+@dataclass
+class Sample:
+    latencies: list[float] = field(default_factory=list)
+    ttfts: list[float] = field(default_factory=list)
+    errors: int = 0
+
+
+def percentile(values: list[float], q: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 2)
+
+
+def rss_kb(pid: int) -> int:
+    """RSS of a process and its children, so multi-worker servers are counted whole."""
+    total = 0
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    total = int(line.split()[1])
+                    break
+        with open(f"/proc/{pid}/task/{pid}/children") as children:
+            total += sum(rss_kb(int(child)) for child in children.read().split())
+    except FileNotFoundError:
+        pass
+    return total
+
+
+class MemorySampler:
+    """Tracks the peak RSS of a process while a scenario runs."""
+
+    def __init__(self, pid: int | None, interval: float = 0.02):
+        self.pid = pid
+        self.interval = interval
+        self.baseline = self.peak = 0
+        self._task: asyncio.Task | None = None
+
+    async def _sample(self) -> None:
+        while True:
+            self.peak = max(self.peak, rss_kb(self.pid))
+            await asyncio.sleep(self.interval)
+
+    def __enter__(self) -> "MemorySampler":
+        if self.pid is not None and os.path.exists(f"/proc/{self.pid}/status"):
+            self.baseline = self.peak = rss_kb(self.pid)
+            self._task = asyncio.ensure_future(self._sample())
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+
+async def read_stream(response: httpx.Response, is_token: Callable[[dict], bool]) -> float | None:
+    """Consume an SSE response; return the time its first token arrived."""
+    first = None
+    async for line in response.aiter_lines():
+        if first is None and line.startswith("data:"):
+            payload = line[5:].strip()
+            try:
+                event = json.loads(payload)
+            except ValueError:
+                continue
+            if is_token(event):
+                first = time.perf_counter()
+    return first
+
+
+async def run_scenario(
+    name: str,
+    requests: int,
+    concurrency: int,
+    pid: int | None,
+    call: Callable[[int], Awaitable[float | None]],
+) -> dict[str, Any]:
+    """Run ``call(worker)`` ``requests`` times across ``concurrency`` workers."""
+    sample = Sample()
+    remaining = iter(range(requests))
+
+    async def worker(n: int) -> None:
+        for _ in remaining:
+            start = time.perf_counter()
+            try:
+                first = await call(n)
+            except (httpx.HTTPError, AssertionError):
+                sample.errors += 1
+                continue
+            end = time.perf_counter()
+            sample.latencies.append((end - start) * 1000)
+            if first is not None:
+                sample.ttfts.append((first - start) * 1000)
+
+    with MemorySampler(pid) as memory:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(n) for n in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    result = {
+        "requests": requests,
+        "errors": sample.errors,
+        "rps": round(len(sample.latencies) / elapsed, 1),
+        "p50_ms": percentile(sample.latencies, 0.50),
+        "p95_ms": percentile(sample.latencies, 0.95),
+        "p99_ms": percentile(sample.latencies, 0.99),
+    }
+    if sample.ttfts:
+        result["ttft_p50_ms"] = percentile(sample.ttfts, 0.50)
+        result["ttft_p95_ms"] = percentile(sample.ttfts, 0.95)
+    if memory.baseline:
+        result["peak_rss_mb"] = round(memory.peak / 1024, 1)
+        result["memory_per_connection_kb"] = round((memory.peak - memory.baseline) / concurrency, 1)
+    print(f"{name}: {result}", file=sys.stderr)
+    return result
+
+
+async def backend_scenarios(client: httpx.AsyncClient, args: argparse.Namespace, pid: int | None) -> dict:
+    users = [f"load_{uuid.uuid4().hex[:8]}_{n}" for n in range(args.concurrency)]
+    sessions = {}
+
+    async def create_session(n: int) -> None:
+        response = await client.post("/chat/sessions", json={"user_id": users[n]})
+        assert response.status_code == 200, response.text
+        sessions[n] = response.json()["session_id"]
+
+    async def send_message(n: int) -> None:
+        response = await client.post("/chat/messages", json={
+            "user_id": users[n], "session_id": sessions[n], "message": args.message,
+        })
+        assert response.status_code == 200, response.text
+
+    async def stream_message(n: int) -> float | None:
+        body = {"user_id": users[n], "session_id": sessions[n], "message": args.message}
+        async with client.stream("POST", "/chat/messages/stream", json=body) as response:
+            assert response.status_code == 200
+            return await read_stream(response, lambda event: "content" in event)
+
+    calls = {"create_session": create_session, "send_message": send_message, "stream_message": stream_message}
+    # Every worker needs a session before messages are sent
+    await asyncio.gather(*(create_session(n) for n in range(args.concurrency)))
+    return {
+        name: await run_scenario(name, args.requests, args.concurrency, pid, calls[name])
+        for name in args.scenarios or BACKEND_SCENARIOS
+    }
+
+
+async def agent_scenarios(client: httpx.AsyncClient, args: argparse.Namespace, pid: int | None) -> dict:
+    users = [f"load_{uuid.uuid4().hex[:8]}_{n}" for n in range(args.concurrency)]
+    # One conversation thread per worker and endpoint, so history grows as with real use
+    threads = {(path, n): uuid.uuid4().hex for path in AGENT_ENDPOINTS.values() for n in range(args.concurrency)}
+
+    def run_input(path: str, n: int) -> dict[str, Any]:
+        return {
+            "threadId": threads[path, n],
+            "runId": uuid.uuid4().hex,
+            "state": {},
+            "messages": [{"id": uuid.uuid4().hex, "role": "user", "content": args.message}],
+            "tools": [],
+            "context": [],
+            "forwardedProps": {},
+        }
+
+    def agent_call(path: str) -> Callable[[int], Awaitable[float | None]]:
+        async def call(n: int) -> float | None:
+            async with client.stream(
+                "POST", path, json=run_input(path, n),
+                headers={"x-user-id": users[n], "accept": "text/event-stream"},
+            ) as response:
+                assert response.status_code == 200
+                return await read_stream(response, lambda event: event.get("type") in AG_UI_TEXT_EVENTS)
+        return call
+
+    return {
+        name: await run_scenario(name, args.requests, args.concurrency, pid, agent_call(path))
+        for name, path in AGENT_ENDPOINTS.items()
+        if not args.scenarios or name in args.scenarios
+    }
+
+
+def start_server(args: argparse.Namespace, work_dir: str) -> subprocess.Popen:
+    if args.service == "backend":
+        script = os.path.join(work_dir, "script.json")
+        with open(script, "w") as f:
+            json.dump({"stream_chunk_words": args.chunk_words}, f)
+        env = {
+            **os.environ,
+            "AGENT_ENGINE_BACKEND": "local",
+            "LOCAL_ENGINE_SCRIPT": script,
+            "LOCAL_ENGINE_REPLY_DELAY": str(args.first_token_delay),
+            "LOCAL_SESSION_STORE": args.session_store,
+            "LOCAL_SESSION_DB": os.path.join(work_dir, "sessions.db"),
+        }
+        command = [sys.executable, "-m", "uvicorn", "main:app", "--port", str(args.port), "--log-level", "warning"]
+        cwd = BACKEND_DIR
+    else:
+        env = dict(os.environ)
+        command = [
+            sys.executable, "-m", "benchmarks.serve_fake", "--port", str(args.port), "--workers", str(args.workers),
+            "--first-token-delay", str(args.first_token_delay), "--chunk-words", str(args.chunk_words),
+        ]
+        cwd = AGENTS_DIR
+    return subprocess.Popen(command, cwd=cwd, env=env)
+
+
+async def wait_ready(client: httpx.AsyncClient, path: str, timeout: float) -> None:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            if (await client.get(path)).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.05)
+    raise TimeoutError(f"Server not ready at {path}")
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    scenarios = backend_scenarios if args.service == "backend" else agent_scenarios
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    timeout = httpx.Timeout(args.timeout)
+
+    if args.in_process:
+        if args.service != "backend":
+            raise SystemExit("--in-process is only supported for the backend service")
+        os.environ.setdefault("AGENT_ENGINE_BACKEND", "local")
+        sys.path.insert(0, str(BACKEND_DIR))
+        from main import app
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=timeout) as client:
+            return await scenarios(client, args, os.getpid())
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        server = None if args.url else start_server(args, work_dir)
+        base_url = args.url or f"http://127.0.0.1:{args.port}"
+        try:
+            async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout) as client:
+                await wait_ready(client, "/ready" if args.service == "backend" else "/", args.startup_timeout)
+                return await scenarios(client, args, server.pid if server else None)
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--service", choices=["backend", "agents"], default="backend")
+    parser.add_argument("--scenarios", nargs="+", help="Subset of scenarios to run (default: all)")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=500, help="Requests per scenario")
+    parser.add_argument("--message", default="Show my interviewing applications")
+    parser.add_argument("--first-token-delay", type=float, default=0.0, help="Simulated model latency in seconds")
+    parser.add_argument("--chunk-words", type=int, default=4, help="Words per streamed chunk")
+    parser.add_argument("--session-store", choices=["memory", "sqlite"], default="memory")
+    parser.add_argument("--workers", type=int, default=1, help="Agents service worker processes")
+    parser.add_argument("--url", help="Test an already running server")
+    parser.add_argument("--in-process", action="store_true", help="Call the backend app without a server")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--startup-timeout", type=float, default=60.0)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    started = time.time()
+    report = {
+        "service": args.service,
+        "commit": git_commit(),
+        "started_at": started,
+        "config": {
+            key: getattr(args, key)
+            for key in ("concurrency", "requests", "first_token_delay", "chunk_words", "session_store", "workers",
+                        "in_process")
+        },
+        "scenarios": asyncio.run(run(args)),
+    }
+    report["wall_seconds"] = round(time.time() - started, 2)
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,27 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from routers import chat
+from services.agent_engine import engine_handle
 from settings import settings
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm the agent engine in the background so the worker can serve
+    # /health while the connection is being established
+    warm_up = asyncio.create_task(engine_handle.warm_up())
+    yield
+    warm_up.cancel()
+
+
 app = FastAPI(
     title=settings.app_title,
     description=settings.app_description,
-    version=settings.app_version
+    version=settings.app_version,
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -34,3 +49,19 @@ def hello(name: str = "World"):
 def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
+
+
+@app.get("/ready")
+def readiness_check():
+    """Readiness endpoint; succeeds once the agent engine handle is warm."""
+    if not engine_handle.ready:
+        raise HTTPException(status_code=503, detail="Agent engine not ready")
+    return {"status": "ready"}
+
+
+@app.get("/engine/stats")
+async def engine_stats():
+    """Agent engine client queue depth, in-flight calls, retries and circuit state."""
+    if not engine_handle.ready:
+        raise HTTPException(status_code=503, detail="Agent engine not ready")
+    return (await engine_handle.get()).stats()
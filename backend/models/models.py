@@ -1,5 +1,5 @@
 # Request/Response Models
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Any
 
 
@@ -17,11 +17,14 @@ class SendMessageRequest(BaseModel):
     session_id: str
     user_id: str
     message: str
+    max_events: int | None = Field(default=None, gt=0)
+    timeout: float | None = Field(default=None, gt=0)
 
 
 class SendMessageResponse(BaseModel):
     response: str
     session_id: str
+    truncated: bool = False
 
 
 class Session(BaseModel):
@@ -31,3 +34,8 @@ class Session(BaseModel):
     events: list
     state: dict[str, Any]
     timestamp: float
+
+
+class SessionPage(BaseModel):
+    sessions: list[dict[str, Any]]
+    next_cursor: str | None = None
@@ -1,7 +1,7 @@
-import json
+from contextlib import aclosing
+
 from sse_starlette.sse import EventSourceResponse
-from fastapi import APIRouter, HTTPException
-import vertexai
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 
 from settings import settings
 from models.models import (
@@ -10,32 +10,37 @@ from models.models import (
     SendMessageRequest,
     SendMessageResponse,
     Session,
+    SessionPage,
 )
+from services.agent_engine import get_agent_engine
+from services.engine_client import EngineUnavailable
+from services.session_cache import SessionListing, session_cache
+from services.session_sync import etag_matches, events_since, session_etag
+from services.sse import coalesce_text_deltas, encode_frame, get_serializer
+from services.streaming import collect_final_text
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
-# Initialize Vertex AI
-vertexai.init(
-    project=settings.vertex_project_id,
-    location=settings.vertex_location,
-    staging_bucket=settings.staging_bucket,
-)
+serialize = get_serializer(settings.sse_serializer)
+DONE_FRAME = encode_frame(serialize({"type": "done", "status": "completed"}))
 
-client = vertexai.Client(
-    project=settings.vertex_project_id,
-    location=settings.vertex_location,
-)
 
-adk_app = client.agent_engines.get(
-    name=f"projects/{settings.vertex_project_id}/locations/{settings.vertex_location}/reasoningEngines/{settings.vertex_resource_id}"
-)
+def engine_error(e: Exception, action: str) -> HTTPException:
+    """503 with Retry-After when the engine client sheds load, 500 otherwise."""
+    if isinstance(e, EngineUnavailable):
+        return HTTPException(
+            status_code=503,
+            detail=f"{action}: {str(e)}",
+            headers={"Retry-After": str(max(1, round(e.retry_after)))},
+        )
+    return HTTPException(status_code=500, detail=f"{action}: {str(e)}")
 
 
 # API Endpoints
 
 
 @router.post("/sessions", response_model=CreateSessionResponse)
-async def create_session(request: CreateSessionRequest):
+async def create_session(request: CreateSessionRequest, adk_app=Depends(get_agent_engine)):
     """
     Create a new chat session for a user.
 
@@ -47,141 +52,194 @@ async def create_session(request: CreateSessionRequest):
     """
     try:
         session = await adk_app.async_create_session(user_id=request.user_id)
+        session_cache.invalidate(request.user_id)
         return CreateSessionResponse(
             session_id=session["id"],
             user_id=session["userId"],
             app_name=session["appName"]
         )
     except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to create session: {str(e)}")
+        raise engine_error(e, "Failed to create session")
 
 
 @router.post("/messages", response_model=SendMessageResponse)
-async def send_message(request: SendMessageRequest):
+async def send_message(request: SendMessageRequest, adk_app=Depends(get_agent_engine)):
     """
     Send a message to the agent and return the final response.
-    This endpoint collects all streamed messages and returns only the final text response.
+    Events are discarded as they stream in; only the latest text part is kept.
 
     Args:
-        request: Contains session_id, user_id, and message
+        request: Contains session_id, user_id, message and an optional
+            max_events/timeout budget
 
     Returns:
         Agent's final response
     """
     try:
-        # Collect all streamed messages
-        messages = []
-        async for message in adk_app.async_stream_query(
-            session_id=request.session_id,
-            user_id=request.user_id,
-            message=request.message
-        ):
-            messages.append(message)
-
-        # Extract the final text response from the last message
-        final_response = ""
-        for message in reversed(messages):
-            content = message.get('content', {})
-            parts = content.get('parts', [])
-            for part in parts:
-                if 'text' in part:
-                    final_response = part['text']
-                    break
-            if final_response:
-                break
+        result = await collect_final_text(
+            adk_app.async_stream_query(
+                session_id=request.session_id,
+                user_id=request.user_id,
+                message=request.message
+            ),
+            max_events=request.max_events if request.max_events is not None else settings.chat_max_events,
+            timeout=request.timeout if request.timeout is not None else settings.chat_timeout_seconds,
+        )
+        session_cache.invalidate(request.user_id)
 
         return SendMessageResponse(
-            response=final_response,
-            session_id=request.session_id
+            response=result.text,
+            session_id=request.session_id,
+            truncated=result.truncated
         )
     except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to send message: {str(e)}")
+        raise engine_error(e, "Failed to send message")
 
 
 @router.post("/messages/stream")
-async def send_message_stream(request: SendMessageRequest):
+async def send_message_stream(request: SendMessageRequest, adk_app=Depends(get_agent_engine)):
     """
     Send a message to the agent and stream the response in real-time.
     This endpoint streams messages as Server-Sent Events (SSE) as they're generated.
 
+    The first event is fetched before the response starts, so a call the
+    engine client sheds or that fails up front gets a 503 with Retry-After
+    (or a 500) instead of an SSE error frame.
+
     Args:
         request: Contains session_id, user_id, and message
 
     Returns:
-        Streaming response with messages as newline-delimited JSON
+        Streaming response with one JSON event per SSE data frame
     """
+    events = adk_app.async_stream_query(
+        session_id=request.session_id,
+        user_id=request.user_id,
+        message=request.message
+    )
+    try:
+        first = await anext(events)
+    except StopAsyncIteration:
+        first = None
+    except Exception as e:
+        session_cache.invalidate(request.user_id)
+        raise engine_error(e, "Failed to send message")
+
+    async def remaining_events():
+        async with aclosing(events):
+            if first is None:
+                return
+            yield first
+            async for event in events:
+                yield event
+
     async def generate_stream():
         try:
-            async for event in adk_app.async_stream_query(
-                session_id=request.session_id,
-                user_id=request.user_id,
-                message=request.message
-            ):
-                # 1. Serialize the event object to a JSON string
-                json_data = json.dumps(event)
-
-                # 2. Format as a Server-Sent Event (SSE)
-                # Format: data: <json_payload>\n\n
-                yield f"{json_data}\n\n"
-
-            # Send completion event
-            completion_event = json.dumps(
-                {"type": "done", "status": "completed"})
-            yield f"{completion_event}\n\n"
+            stream = remaining_events()
+            if settings.sse_coalesce_interval_ms > 0:
+                stream = coalesce_text_deltas(
+                    stream, settings.sse_coalesce_interval_ms / 1000)
+
+            # Frames are pre-encoded so EventSourceResponse writes them as-is
+            async for event in stream:
+                yield encode_frame(serialize(event))
+
+            yield DONE_FRAME
             print("DONE STREAMING")
 
         except Exception as e:
             # Send error information as a structured SSE message
             error_message = {"error": str(e), "status": "failed"}
-            json_data = json.dumps(error_message)
-            yield f"data: {json_data}\n\n"
+            yield encode_frame(serialize(error_message))
             print(f"ERROR STREAMING: {str(e)}")
 
+        finally:
+            session_cache.invalidate(request.user_id)
+
     return EventSourceResponse(generate_stream())
 
 
-@router.get("/sessions", response_model=list[Session])
-async def get_sessions(user_id: str):
+@router.get("/sessions", response_model=SessionPage)
+async def get_sessions(
+    user_id: str,
+    cursor: str | None = None,
+    limit: int | None = Query(default=None, ge=1),
+    include_events: bool = True,
+    fields: str | None = None,
+    adk_app=Depends(get_agent_engine),
+):
     """
-    Retrieve all sessions for a user.
+    Retrieve sessions for a user, newest first.
+
+    Listings without events are cached per user and invalidated when the
+    user creates, deletes or sends a message to a session; listings with
+    events are always read from the engine.
 
     Args:
         user_id: The user identifier
+        cursor: next_cursor from a previous page
+        limit: Maximum number of sessions to return (all when omitted)
+        include_events: Whether to include each session's events
+        fields: Comma-separated subset of session fields to return
 
     Returns:
-        user sessions
+        A page of user sessions and the cursor for the next page
     """
-    try:
-        response = await adk_app.async_list_sessions(user_id=user_id)
-        sessions = response["sessions"]
-
-        return [
-            Session(
-                session_id=session["id"],
-                user_id=session["userId"],
-                state=session["state"],
-                app_name=session["appName"],
-                events=session["events"],
-                timestamp=session["lastUpdateTime"]
-            )
-            for session in sessions
-        ]
+    include = set(fields.split(",")) if fields else set(Session.model_fields)
+    if not include_events:
+        include.discard("events")
+    with_events = "events" in include
 
+    try:
+        listing = None if with_events else session_cache.get(user_id)
+        if listing is None:
+            generation = session_cache.generation()
+            response = await adk_app.async_list_sessions(user_id=user_id)
+            listing = SessionListing([
+                Session(
+                    session_id=session["id"],
+                    user_id=session["userId"],
+                    state=session["state"],
+                    app_name=session["appName"],
+                    events=session["events"] if with_events else [],
+                    timestamp=session["lastUpdateTime"]
+                )
+                for session in response["sessions"]
+            ])
+            if not with_events:
+                session_cache.set(user_id, listing, generation)
+
+        page, next_cursor = listing.page(cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to retrieve history: {str(e)}")
+        raise engine_error(e, "Failed to retrieve history")
+
+    return SessionPage(
+        sessions=[session.model_dump(include=include) for session in page],
+        next_cursor=next_cursor
+    )
 
 
 @router.get("/sessions/{session_id}", response_model=Session)
-async def get_session(session_id: str, user_id: str):
+async def get_session(
+    session_id: str,
+    user_id: str,
+    response: Response,
+    since: str | None = None,
+    if_none_match: str | None = Header(default=None),
+    adk_app=Depends(get_agent_engine),
+):
     """
     Retrieve the conversation history for a session.
 
+    Responses carry an ETag; a matching If-None-Match returns 304.
+
     Args:
         session_id: The session identifier
         user_id: The user identifier
+        since: Only return events after this event id or timestamp
+        if_none_match: ETag from a previous response
 
     Returns:
         Conversation history
@@ -191,22 +249,30 @@ async def get_session(session_id: str, user_id: str):
             session_id=session_id,
             user_id=user_id
         )
-
-        return Session(
-            session_id=history["id"],
-            user_id=history["userId"],
-            state=history["state"],
-            app_name=history["appName"],
-            events=history["events"],
-            timestamp=history["lastUpdateTime"]
-        )
     except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to retrieve history: {str(e)}")
+        raise engine_error(e, "Failed to retrieve history")
+
+    etag = session_etag(history)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+    events = history["events"]
+    if since:
+        events = events_since(events, since)
+
+    return Session(
+        session_id=history["id"],
+        user_id=history["userId"],
+        state=history["state"],
+        app_name=history["appName"],
+        events=events,
+        timestamp=history["lastUpdateTime"]
+    )
 
 
 @router.delete("/sessions/{session_id}")
-async def delete_session(session_id: str, user_id: str):
+async def delete_session(session_id: str, user_id: str, adk_app=Depends(get_agent_engine)):
     """
     Delete a chat session.
 
@@ -222,11 +288,11 @@ async def delete_session(session_id: str, user_id: str):
             session_id=session_id,
             user_id=user_id
         )
+        session_cache.invalidate(user_id)
 
         return {
             "message": "Session deleted successfully",
             "session_id": session_id
         }
     except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to delete session: {str(e)}")
+        raise engine_error(e, "Failed to delete session")
@@ -0,0 +1,131 @@
+"""In-process agent engine running an ApplyFlow ADK agent with a local Runner.
+
+The agent is imported from the ``applyflow_agents`` service and runs here,
+calling the real model and tools, with sessions kept in a local
+``SessionStore`` instead of Vertex AI.
+"""
+
+import importlib
+import sys
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+from google.adk.events import Event
+from google.adk.runners import Runner
+from google.adk.sessions import BaseSessionService, Session
+from google.adk.sessions.base_session_service import GetSessionConfig, ListSessionsResponse
+from google.genai import types
+
+from services.session_store import SessionStore
+
+
+def _event_dict(event: Event) -> dict[str, Any]:
+    return event.model_dump(mode="json", exclude_none=True)
+
+
+class StoreSessionService(BaseSessionService):
+    """ADK session service over a ``SessionStore``.
+
+    Session state is kept per session; the ``app:`` and ``user:`` prefixes
+    are not shared across sessions as they are in ADK's database service.
+    """
+
+    def __init__(self, store: SessionStore):
+        self.store = store
+
+    @staticmethod
+    def _to_session(session: dict[str, Any], config: GetSessionConfig | None = None) -> Session:
+        events = session["events"]
+        if config is not None:
+            if config.after_timestamp:
+                events = [e for e in events if e.get("timestamp", 0) >= config.after_timestamp]
+            if config.num_recent_events:
+                events = events[-config.num_recent_events:]
+        return Session(
+            id=session["id"],
+            app_name=session["appName"],
+            user_id=session["userId"],
+            state=dict(session["state"]),
+            events=[Event.model_validate(e) for e in events],
+            last_update_time=session["lastUpdateTime"],
+        )
+
+    async def create_session(
+        self, *, app_name: str, user_id: str, state: dict[str, Any] | None = None,
+        session_id: str | None = None,
+    ) -> Session:
+        session = await self.store.create(app_name, user_id, state, session_id)
+        return self._to_session(session)
+
+    async def get_session(
+        self, *, app_name: str, user_id: str, session_id: str, config: GetSessionConfig | None = None,
+    ) -> Session | None:
+        session = await self.store.get(session_id, user_id)
+        if session is None or session["appName"] != app_name:
+            return None
+        return self._to_session(session, config)
+
+    async def list_sessions(self, *, app_name: str, user_id: str | None = None) -> ListSessionsResponse:
+        sessions = await self.store.find(app_name, user_id) if user_id else []
+        return ListSessionsResponse(sessions=[self._to_session(s) for s in sessions])
+
+    async def delete_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        await self.store.delete(session_id, user_id)
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        # The base class applies the state delta to the in-memory session
+        # and skips partial events
+        event = await super().append_event(session, event)
+        if not event.partial:
+            await self.store.append_event(session.id, session.user_id, _event_dict(event), state=session.state)
+        return event
+
+
+def load_root_agent(agents_dir: str, agent: str) -> Any:
+    """Import ``root_agent`` from an agent package of the applyflow_agents service.
+
+    Each agent package imports its tools as top-level ``tools``, so the
+    package directory goes on ``sys.path`` along with the service root.
+    """
+    root = Path(agents_dir).resolve()
+    for path in (root / agent, root):
+        if str(path) not in sys.path:
+            sys.path.insert(0, str(path))
+    return importlib.import_module(f"{agent}.{agent}").root_agent
+
+
+class AdkRunnerEngine:
+    """Implements the agent engine methods used by the chat router with an ADK Runner."""
+
+    def __init__(self, agent: Any, app_name: str, store: SessionStore):
+        self.app_name = app_name
+        self.store = store
+        self.session_service = StoreSessionService(store)
+        self.runner = Runner(agent=agent, app_name=app_name, session_service=self.session_service)
+
+    async def _session(self, session_id: str, user_id: str) -> dict[str, Any]:
+        session = await self.store.get(session_id, user_id)
+        if session is None or session["appName"] != self.app_name:
+            raise KeyError(f"Session {session_id} not found")
+        return session
+
+    async def async_create_session(self, user_id: str) -> dict[str, Any]:
+        return await self.store.create(self.app_name, user_id)
+
+    async def async_stream_query(
+        self, session_id: str, user_id: str, message: str
+    ) -> AsyncIterator[dict[str, Any]]:
+        await self._session(session_id, user_id)
+        content = types.Content(role="user", parts=[types.Part(text=message)])
+        async for event in self.runner.run_async(user_id=user_id, session_id=session_id, new_message=content):
+            yield _event_dict(event)
+
+    async def async_list_sessions(self, user_id: str) -> dict[str, Any]:
+        return {"sessions": await self.store.find(self.app_name, user_id)}
+
+    async def async_get_session(self, session_id: str, user_id: str) -> dict[str, Any]:
+        return await self._session(session_id, user_id)
+
+    async def async_delete_session(self, session_id: str, user_id: str) -> None:
+        await self._session(session_id, user_id)
+        await self.store.delete(session_id, user_id)
@@ -0,0 +1,131 @@
+"""Lazy, once-only initialization of the agent engine handle."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+from services.engine_client import ResilientEngineClient
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+EngineFactory = Callable[[], Awaitable[Any]]
+
+
+def _connect_vertex() -> Any:
+    # Imported here so worker start-up does not pay for the SDK import either
+    import vertexai
+
+    vertexai.init(
+        project=settings.vertex_project_id,
+        location=settings.vertex_location,
+        staging_bucket=settings.staging_bucket,
+    )
+    client = vertexai.Client(
+        project=settings.vertex_project_id,
+        location=settings.vertex_location,
+    )
+    return client.agent_engines.get(
+        name=f"projects/{settings.vertex_project_id}/locations/{settings.vertex_location}/reasoningEngines/{settings.vertex_resource_id}"
+    )
+
+
+async def create_vertex_engine() -> Any:
+    """Connect to the deployed Vertex AI reasoning engine off the event loop."""
+    return await asyncio.to_thread(_connect_vertex)
+
+
+def _session_store() -> Any:
+    from services.session_store import create_session_store
+
+    return create_session_store(settings.local_session_store, settings.local_session_db)
+
+
+def _build_adk_engine() -> Any:
+    from services.adk_engine import AdkRunnerEngine, load_root_agent
+
+    agent = load_root_agent(settings.adk_agents_dir, settings.adk_agent)
+    return AdkRunnerEngine(agent, app_name=settings.adk_agent, store=_session_store())
+
+
+async def create_adk_engine() -> Any:
+    """Load an applyflow_agents agent and run it in-process, off the event loop."""
+    return await asyncio.to_thread(_build_adk_engine)
+
+
+async def create_local_engine() -> Any:
+    """Build the in-process stand-in engine with its scripted fake model."""
+    from services.fake_llm import ScriptedResponder
+    from services.local_engine import LocalAgentEngine
+
+    responder = None
+    if settings.local_engine_script:
+        responder = ScriptedResponder.from_file(settings.local_engine_script)
+    return LocalAgentEngine(
+        reply_delay=settings.local_engine_reply_delay,
+        latency=settings.local_engine_latency,
+        failure_rate=settings.local_engine_failure_rate,
+        store=_session_store(),
+        responder=responder,
+    )
+
+
+ENGINE_FACTORIES: dict[str, EngineFactory] = {
+    "vertex": create_vertex_engine,
+    "adk": create_adk_engine,
+    "local": create_local_engine,
+}
+
+
+def with_client(factory: EngineFactory) -> EngineFactory:
+    """Wrap the engine a factory builds in the concurrency-limiting, retrying client."""
+    async def create() -> ResilientEngineClient:
+        return ResilientEngineClient(
+            await factory(),
+            max_concurrency=settings.engine_max_concurrency,
+            max_concurrency_per_user=settings.engine_max_concurrency_per_user,
+            max_queue=settings.engine_max_queue,
+            call_timeout=settings.engine_call_timeout_seconds,
+            max_retries=settings.engine_max_retries,
+            retry_base=settings.engine_retry_base_seconds,
+            retry_max=settings.engine_retry_max_seconds,
+            breaker_failure_threshold=settings.engine_breaker_failure_threshold,
+            breaker_reset_seconds=settings.engine_breaker_reset_seconds,
+        )
+    return create
+
+
+class AgentEngineHandle:
+    """Holds the agent engine, creating it at most once on first use."""
+
+    def __init__(self, factory: EngineFactory):
+        self._factory = factory
+        self._engine: Any = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self._engine is not None
+
+    async def get(self) -> Any:
+        if self._engine is None:
+            async with self._lock:
+                if self._engine is None:
+                    self._engine = await self._factory()
+        return self._engine
+
+    async def warm_up(self) -> None:
+        """Initialize in the background, logging instead of raising on failure."""
+        try:
+            await self.get()
+            logger.info("Agent engine ready")
+        except Exception:
+            logger.exception("Agent engine warm-up failed; will retry on first request")
+
+
+engine_handle = AgentEngineHandle(with_client(ENGINE_FACTORIES[settings.agent_engine_backend]))
+
+
+async def get_agent_engine() -> Any:
+    """FastAPI dependency returning the initialized agent engine."""
+    return await engine_handle.get()
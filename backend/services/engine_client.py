@@ -0,0 +1,326 @@
+"""Resilient client around the agent engine: limits, retries, deadlines and a breaker."""
+
+import asyncio
+import logging
+import random
+import time
+from collections import Counter
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Upstream errors worth retrying, matched by class name so the Google SDKs
+# stay optional (google.api_core.exceptions and friends)
+TRANSIENT_ERROR_NAMES = frozenset({
+    "ServiceUnavailable",
+    "TooManyRequests",
+    "ResourceExhausted",
+    "DeadlineExceeded",
+    "InternalServerError",
+    "BadGateway",
+    "GatewayTimeout",
+    "Aborted",
+})
+TRANSIENT_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class EngineUnavailable(Exception):
+    """The engine cannot take the call right now; retry after ``retry_after`` seconds."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class EngineOverloaded(EngineUnavailable):
+    pass
+
+
+class CircuitOpen(EngineUnavailable):
+    pass
+
+
+class EngineTimeout(EngineUnavailable):
+    pass
+
+
+def is_transient(error: BaseException) -> bool:
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    if type(error).__name__ in TRANSIENT_ERROR_NAMES:
+        return True
+    code = getattr(error, "code", None) or getattr(error, "status_code", None)
+    return code in TRANSIENT_STATUS_CODES
+
+
+class CircuitBreaker:
+    """Opens after consecutive transient failures and lets one trial call through after a cool-down."""
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: float | None = None
+        # Token of the half-open trial call in flight, if any
+        self._trial: object | None = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_seconds:
+            return "half_open"
+        return "open"
+
+    def before_call(self) -> object | None:
+        """Raise CircuitOpen if the call may not proceed.
+
+        Returns a token when the call is the half-open trial; pass it to
+        ``end_trial`` once the call is over, however it ended.
+        """
+        state = self.state
+        if state == "open" or (state == "half_open" and self._trial is not None):
+            retry_after = max(0.0, self.reset_seconds - (time.monotonic() - self.opened_at))
+            raise CircuitOpen("Agent engine circuit is open", retry_after=retry_after or self.reset_seconds)
+        if state == "half_open":
+            self._trial = object()
+            return self._trial
+        return None
+
+    def end_trial(self, trial: object | None) -> None:
+        """Free the trial slot if ``trial`` still holds it, e.g. after a cancelled or rejected call."""
+        if trial is not None and self._trial is trial:
+            self._trial = None
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._trial = None
+
+    def record_failure(self) -> None:
+        self._trial = None
+        self.failures += 1
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                logger.warning("Agent engine circuit opened after %d failures", self.failures)
+            self.opened_at = time.monotonic()
+
+
+class ResilientEngineClient:
+    """Wraps an agent engine with the same async_* methods.
+
+    Calls are bounded globally and per user; when more than ``max_queue``
+    calls are waiting, new ones are rejected immediately instead of piling
+    up. Transient failures are retried with full-jitter exponential backoff
+    within a per-call deadline that includes waiting for a slot, and a
+    circuit breaker stops calling an engine that keeps failing.
+    """
+
+    def __init__(
+        self,
+        engine: Any,
+        max_concurrency: int = 64,
+        max_concurrency_per_user: int = 4,
+        max_queue: int = 256,
+        call_timeout: float | None = 30.0,
+        max_retries: int = 3,
+        retry_base: float = 0.2,
+        retry_max: float = 5.0,
+        breaker_failure_threshold: int = 5,
+        breaker_reset_seconds: float = 30.0,
+    ):
+        self.engine = engine
+        self.max_concurrency_per_user = max_concurrency_per_user
+        self.max_queue = max_queue
+        self.call_timeout = call_timeout
+        self.max_retries = max_retries
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.breaker = CircuitBreaker(breaker_failure_threshold, breaker_reset_seconds)
+        self._global = asyncio.Semaphore(max_concurrency)
+        self._users: dict[str, asyncio.Semaphore] = {}
+        self._user_holders: Counter[str] = Counter()
+        self.in_flight = 0
+        self.queued = 0
+        self.peak_queued = 0
+        self.counters: Counter[str] = Counter()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "peak_queued": self.peak_queued,
+            "active_users": len(self._users),
+            "circuit": self.breaker.state,
+            **self.counters,
+        }
+
+    @asynccontextmanager
+    async def _slot(self, user_id: str) -> AsyncIterator[None]:
+        """Hold a per-user and a global slot, waiting in a bounded queue."""
+        if self.queued >= self.max_queue:
+            self.counters["rejected"] += 1
+            raise EngineOverloaded("Agent engine queue is full", retry_after=1.0)
+
+        user = self._users.get(user_id)
+        if user is None:
+            user = self._users[user_id] = asyncio.Semaphore(self.max_concurrency_per_user)
+        self._user_holders[user_id] += 1
+        self.queued += 1
+        self.peak_queued = max(self.peak_queued, self.queued)
+        queued = True
+        try:
+            async with user:
+                async with self._global:
+                    self.queued -= 1
+                    queued = False
+                    self.in_flight += 1
+                    try:
+                        yield
+                    finally:
+                        self.in_flight -= 1
+        finally:
+            if queued:
+                self.queued -= 1
+            self._user_holders[user_id] -= 1
+            if not self._user_holders[user_id]:
+                del self._user_holders[user_id]
+                del self._users[user_id]
+
+    async def _acquire(self, stack: AsyncExitStack, user_id: str, deadline: float | None) -> None:
+        """Enter a slot on ``stack``, giving up with EngineOverloaded at the deadline."""
+        try:
+            async with asyncio.timeout(self._remaining(deadline)):
+                await stack.enter_async_context(self._slot(user_id))
+        except TimeoutError:
+            self.counters["queue_timeouts"] += 1
+            raise EngineOverloaded("Timed out waiting for an agent engine slot", retry_after=1.0) from None
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.retry_max, self.retry_base * 2 ** attempt))
+
+    def _deadline(self) -> float | None:
+        return time.monotonic() + self.call_timeout if self.call_timeout else None
+
+    @staticmethod
+    def _remaining(deadline: float | None) -> float | None:
+        return max(0.0, deadline - time.monotonic()) if deadline else None
+
+    def _timed_out(self, error: Exception, name: str) -> EngineTimeout | None:
+        """The error to raise instead of a deadline expiry, so callers see a 503 rather than a budget cut."""
+        if isinstance(error, TimeoutError):
+            return EngineTimeout(f"Agent engine {name} timed out", retry_after=1.0)
+        return None
+
+    def _retry_delay(self, error: Exception, name: str, attempt: int, deadline: float | None) -> float | None:
+        """Record a failed attempt; return how long to wait before retrying, or None to give up."""
+        if isinstance(error, EngineUnavailable):
+            # Rejected locally, not an engine failure
+            return None
+        if not is_transient(error):
+            # The engine answered (e.g. session not found), so it is healthy
+            self.breaker.record_success()
+            return None
+        self.breaker.record_failure()
+        self.counters["transient_errors"] += 1
+        delay = self._backoff(attempt)
+        if attempt >= self.max_retries or (deadline and time.monotonic() + delay >= deadline):
+            logger.warning("Agent engine %s failed after %d attempts: %s", name, attempt + 1, error)
+            self.counters["failures"] += 1
+            return None
+        self.counters["retries"] += 1
+        return delay
+
+    async def _call(self, user_id: str, name: str, call: Callable[[], Awaitable[T]]) -> T:
+        deadline = self._deadline()
+        attempt = 0
+        while True:
+            trial = self.breaker.before_call()
+            self.counters["calls"] += 1
+            try:
+                async with AsyncExitStack() as stack:
+                    await self._acquire(stack, user_id, deadline)
+                    async with asyncio.timeout(self._remaining(deadline)):
+                        result = await call()
+            except Exception as e:
+                delay = self._retry_delay(e, name, attempt, deadline)
+                if delay is None:
+                    if timeout := self._timed_out(e, name):
+                        raise timeout from e
+                    raise
+            else:
+                self.breaker.record_success()
+                return result
+            finally:
+                # Covers cancellation, which no other path records
+                self.breaker.end_trial(trial)
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def async_create_session(self, user_id: str) -> dict[str, Any]:
+        return await self._call(user_id, "create_session", lambda: self.engine.async_create_session(user_id=user_id))
+
+    async def async_list_sessions(self, user_id: str) -> dict[str, Any]:
+        return await self._call(user_id, "list_sessions", lambda: self.engine.async_list_sessions(user_id=user_id))
+
+    async def async_get_session(self, session_id: str, user_id: str) -> dict[str, Any]:
+        return await self._call(
+            user_id, "get_session",
+            lambda: self.engine.async_get_session(session_id=session_id, user_id=user_id),
+        )
+
+    async def async_delete_session(self, session_id: str, user_id: str) -> Any:
+        return await self._call(
+            user_id, "delete_session",
+            lambda: self.engine.async_delete_session(session_id=session_id, user_id=user_id),
+        )
+
+    async def async_stream_query(self, session_id: str, user_id: str, message: str) -> AsyncIterator[Any]:
+        """Stream a query, holding a slot for the whole stream.
+
+        Only failures before the first event are retried; once events have
+        been yielded a retry would replay the turn. The deadline applies to
+        the wait for a slot and the first event; overall stream budgets
+        belong to the caller.
+        """
+        deadline = self._deadline()
+        attempt = 0
+        while True:
+            trial = self.breaker.before_call()
+            self.counters["calls"] += 1
+            delay = None
+            try:
+                async with AsyncExitStack() as stack:
+                    await self._acquire(stack, user_id, deadline)
+                    stream = self.engine.async_stream_query(
+                        session_id=session_id, user_id=user_id, message=message
+                    )
+                    try:
+                        try:
+                            async with asyncio.timeout(self._remaining(deadline)):
+                                first = await anext(stream)
+                        except StopAsyncIteration:
+                            self.breaker.record_success()
+                            return
+                        except Exception as e:
+                            delay = self._retry_delay(e, "stream_query", attempt, deadline)
+                            if delay is None:
+                                if timeout := self._timed_out(e, "stream_query"):
+                                    raise timeout from e
+                                raise
+                        else:
+                            self.breaker.record_success()
+                            yield first
+                            async for event in stream:
+                                yield event
+                            return
+                    finally:
+                        await stream.aclose()
+            finally:
+                self.breaker.end_trial(trial)
+            # Back off outside the slot so other callers can use it
+            attempt += 1
+            await asyncio.sleep(delay)
@@ -0,0 +1,112 @@
+"""Scripted stand-in for the model, so the local engine produces realistic turns offline.
+
+A script is a JSON file of rules tried in order against the user's message:
+
+    {
+        "rules": [
+            {
+                "pattern": "mark (?P<app>\\\\w+) as (?P<status>\\\\w+)",
+                "tool_calls": [{"name": "update_application", "args": {"application_id": "{app}"}}],
+                "reply": "Updated {app} to {status}."
+            }
+        ],
+        "default": "You said: {message}",
+        "stream_chunk_words": 4
+    }
+
+Replies and tool arguments are formatted with the pattern's named groups and
+``message``. With ``stream_chunk_words`` set, replies are also streamed as
+partial text events before the final one, like a streaming model.
+"""
+
+import json
+import re
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator
+
+
+@dataclass
+class Rule:
+    pattern: re.Pattern
+    reply: str
+    tool_calls: list[dict[str, Any]] = field(default_factory=list)
+
+
+def _format(value: Any, values: dict[str, str]) -> Any:
+    if isinstance(value, str):
+        return value.format(**values)
+    if isinstance(value, dict):
+        return {k: _format(v, values) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_format(v, values) for v in value]
+    return value
+
+
+class ScriptedResponder:
+    """Turns a user message into model events by the first matching rule."""
+
+    def __init__(
+        self,
+        rules: list[Rule] | None = None,
+        default: str = "You said: {message}",
+        stream_chunk_words: int = 0,
+    ):
+        self.rules = rules or []
+        self.default = default
+        self.stream_chunk_words = stream_chunk_words
+
+    @classmethod
+    def from_file(cls, path: str) -> "ScriptedResponder":
+        with open(path, encoding="utf-8") as f:
+            script = json.load(f)
+        rules = [
+            Rule(
+                pattern=re.compile(rule["pattern"], re.IGNORECASE),
+                reply=rule["reply"],
+                tool_calls=rule.get("tool_calls", []),
+            )
+            for rule in script.get("rules", [])
+        ]
+        return cls(
+            rules,
+            default=script.get("default", "You said: {message}"),
+            stream_chunk_words=script.get("stream_chunk_words", 0),
+        )
+
+    def _match(self, message: str) -> tuple[Rule | None, dict[str, str]]:
+        for rule in self.rules:
+            found = rule.pattern.search(message)
+            if found:
+                return rule, {**found.groupdict(default=""), "message": message}
+        return None, {"message": message}
+
+    async def respond(self, author: str, message: str) -> AsyncIterator[dict[str, Any]]:
+        rule, values = self._match(message)
+        for call in rule.tool_calls if rule else ():
+            call_id = uuid.uuid4().hex
+            name, args = call["name"], _format(call.get("args", {}), values)
+            yield model_event(author, {"function_call": {"id": call_id, "name": name, "args": args}})
+            yield model_event(author, {"function_response": {
+                "id": call_id, "name": name, "response": _format(call.get("response", {"status": "success"}), values),
+            }})
+
+        reply = (rule.reply if rule else self.default).format(**values)
+        if self.stream_chunk_words:
+            words = reply.split(" ")
+            for i in range(0, len(words), self.stream_chunk_words):
+                chunk = " ".join(words[i:i + self.stream_chunk_words])
+                if i + self.stream_chunk_words < len(words):
+                    chunk += " "
+                yield {**model_event(author, {"text": chunk}), "partial": True}
+        yield model_event(author, {"text": reply})
+
+
+def model_event(author: str, part: dict[str, Any], role: str = "model") -> dict[str, Any]:
+    return {
+        "id": uuid.uuid4().hex,
+        "author": author,
+        "timestamp": time.time(),
+        "content": {"role": role, "parts": [part]},
+    }
@@ -0,0 +1,88 @@
+"""In-process stand-in for the Vertex agent engine, for offline runs and benchmarks."""
+
+import asyncio
+import random
+from typing import Any, AsyncIterator
+
+from services.fake_llm import ScriptedResponder, model_event
+from services.session_store import MemorySessionStore, SessionStore
+
+
+class LocalAgentEngine:
+    """Implements the agent engine methods used by the chat router without Vertex.
+
+    Replies come from a scripted fake model (echoing the user's message by
+    default), so the full API can be exercised without network access or
+    model calls. Sessions live in ``store``, in memory unless given a SQLite
+    store. ``latency`` and ``failure_rate`` inject per-call delay and
+    transient errors to exercise the engine client.
+    """
+
+    def __init__(
+        self,
+        app_name: str = "local_agent",
+        reply_delay: float = 0.0,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: int | None = None,
+        store: SessionStore | None = None,
+        responder: ScriptedResponder | None = None,
+    ):
+        self.app_name = app_name
+        self.reply_delay = reply_delay
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self._random = random.Random(seed)
+        self.store = store or MemorySessionStore()
+        self.responder = responder or ScriptedResponder()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def _call(self) -> None:
+        """Simulate the network round trip: jittered latency, then maybe a fault."""
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                await asyncio.sleep(self._random.uniform(0.5, 1.5) * self.latency)
+            if self.failure_rate and self._random.random() < self.failure_rate:
+                raise ConnectionError("Injected agent engine fault")
+        finally:
+            self.in_flight -= 1
+
+    async def _session(self, session_id: str, user_id: str) -> dict[str, Any]:
+        session = await self.store.get(session_id, user_id)
+        if session is None:
+            raise KeyError(f"Session {session_id} not found")
+        return session
+
+    async def async_create_session(self, user_id: str) -> dict[str, Any]:
+        await self._call()
+        return await self.store.create(self.app_name, user_id)
+
+    async def async_stream_query(
+        self, session_id: str, user_id: str, message: str
+    ) -> AsyncIterator[dict[str, Any]]:
+        await self._call()
+        await self._session(session_id, user_id)
+        await self.store.append_event(session_id, user_id, model_event("user", {"text": message}, role="user"))
+        if self.reply_delay:
+            await asyncio.sleep(self.reply_delay)
+        async for event in self.responder.respond(self.app_name, message):
+            # Partial chunks are streamed but not kept, as with a streaming model
+            if not event.get("partial"):
+                await self.store.append_event(session_id, user_id, event)
+            yield event
+
+    async def async_list_sessions(self, user_id: str) -> dict[str, Any]:
+        await self._call()
+        return {"sessions": await self.store.find(self.app_name, user_id)}
+
+    async def async_get_session(self, session_id: str, user_id: str) -> dict[str, Any]:
+        await self._call()
+        return await self._session(session_id, user_id)
+
+    async def async_delete_session(self, session_id: str, user_id: str) -> None:
+        await self._call()
+        if not await self.store.delete(session_id, user_id):
+            raise KeyError(f"Session {session_id} not found")
@@ -0,0 +1,117 @@
+"""Per-user TTL + LRU cache for session listings.
+
+Listings are cached as event-less summaries; requests that include events
+read through to the engine. The cache is per process, so with several
+uvicorn workers an invalidation only reaches the worker that handled the
+write, and the others can serve a listing up to the TTL old.
+"""
+
+import base64
+import bisect
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from models.models import Session
+from settings import settings
+
+
+@dataclass
+class SessionListing:
+    """A user's sessions, newest first, with sort keys for cursor lookups."""
+    sessions: list[Session]
+    keys: list[tuple[float, str]] = field(default_factory=list)
+
+    def __post_init__(self):
+        self.sessions.sort(key=lambda s: (-s.timestamp, s.session_id))
+        self.keys = [(-s.timestamp, s.session_id) for s in self.sessions]
+
+    def page(self, cursor: str | None, limit: int | None) -> tuple[list[Session], str | None]:
+        start = bisect.bisect_right(self.keys, decode_cursor(cursor)) if cursor else 0
+        end = len(self.sessions) if limit is None else start + limit
+        page = self.sessions[start:end]
+        next_cursor = encode_cursor(page[-1]) if page and end < len(self.sessions) else None
+        return page, next_cursor
+
+
+def encode_cursor(session: Session) -> str:
+    raw = f"{session.timestamp!r}:{session.session_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[float, str]:
+    try:
+        timestamp, session_id = base64.urlsafe_b64decode(cursor.encode()).decode().split(":", 1)
+        return -float(timestamp), session_id
+    except ValueError as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+class TTLCache:
+    """A bounded LRU mapping whose entries also expire after ``ttl`` seconds.
+
+    A fill takes a ``generation()`` token before reading from the source and
+    passes it to ``set``; if the key was invalidated in between, the value
+    may already be stale and is not cached. A ``ttl`` of 0 disables caching.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        # Generation at each key's last invalidation, bounded like the entries;
+        # keys pushed out fall back to _floor, which only skips extra fills
+        self._generation = 0
+        self._invalidated: OrderedDict[str, int] = OrderedDict()
+        self._floor = 0
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def generation(self) -> int:
+        return self._generation
+
+    def set(self, key: str, value: Any, generation: int | None = None) -> None:
+        if self.ttl <= 0:
+            return
+        if generation is not None and self._invalidated.get(key, self._floor) > generation:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        self._entries.pop(key, None)
+        self._generation += 1
+        self._invalidated[key] = self._generation
+        self._invalidated.move_to_end(key)
+        while len(self._invalidated) > self.max_entries:
+            _, generation = self._invalidated.popitem(last=False)
+            self._floor = max(self._floor, generation)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def default_ttl() -> float:
+    """The configured TTL; unset, 30s for one worker and off for several."""
+    if settings.session_cache_ttl_seconds is not None:
+        return settings.session_cache_ttl_seconds
+    return 0.0 if int(os.getenv("WEB_CONCURRENCY", "1")) > 1 else 30.0
+
+
+session_cache = TTLCache(
+    max_entries=settings.session_cache_max_users,
+    ttl=default_ttl(),
+)
@@ -0,0 +1,203 @@
+"""Session storage for the in-process engines, in memory or in SQLite.
+
+Sessions are plain dicts shaped like the Vertex agent engine's responses
+(``id``, ``userId``, ``appName``, ``state``, ``events``, ``lastUpdateTime``)
+so the routers handle every backend the same way.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any
+
+
+def new_session(app_name: str, user_id: str, state: dict[str, Any] | None = None,
+                session_id: str | None = None) -> dict[str, Any]:
+    return {
+        "id": session_id or uuid.uuid4().hex,
+        "userId": user_id,
+        "appName": app_name,
+        "state": dict(state or {}),
+        "events": [],
+        "lastUpdateTime": time.time(),
+    }
+
+
+class MemorySessionStore:
+    """Sessions in a dict; lost on restart. Returned sessions are the live objects."""
+
+    def __init__(self):
+        self._sessions: dict[str, dict[str, Any]] = {}
+
+    async def create(self, app_name: str, user_id: str, state: dict[str, Any] | None = None,
+                     session_id: str | None = None) -> dict[str, Any]:
+        session = new_session(app_name, user_id, state, session_id)
+        self._sessions[session["id"]] = session
+        return session
+
+    async def get(self, session_id: str, user_id: str) -> dict[str, Any] | None:
+        session = self._sessions.get(session_id)
+        if session is None or session["userId"] != user_id:
+            return None
+        return session
+
+    async def find(self, app_name: str, user_id: str) -> list[dict[str, Any]]:
+        return [
+            s for s in self._sessions.values()
+            if s["userId"] == user_id and s["appName"] == app_name
+        ]
+
+    async def delete(self, session_id: str, user_id: str) -> bool:
+        if await self.get(session_id, user_id) is None:
+            return False
+        del self._sessions[session_id]
+        return True
+
+    async def append_event(self, session_id: str, user_id: str, event: dict[str, Any],
+                           state: dict[str, Any] | None = None) -> None:
+        session = await self.get(session_id, user_id)
+        if session is None:
+            raise KeyError(f"Session {session_id} not found")
+        session["events"].append(event)
+        if state is not None:
+            session["state"] = state
+        session["lastUpdateTime"] = event.get("timestamp") or time.time()
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    app_name TEXT NOT NULL,
+    state TEXT NOT NULL,
+    last_update_time REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_user ON sessions (user_id, app_name);
+CREATE TABLE IF NOT EXISTS session_events (
+    session_id TEXT NOT NULL REFERENCES sessions (id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    event TEXT NOT NULL,
+    PRIMARY KEY (session_id, seq)
+);
+"""
+
+
+class SqliteSessionStore:
+    """Sessions in a WAL-mode SQLite file; queries run off the event loop.
+
+    Events are appended one row each, so a turn writes only its new events
+    rather than rewriting the session.
+    """
+
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _session(self, row: sqlite3.Row, events: list[dict[str, Any]]) -> dict[str, Any]:
+        return {
+            "id": row["id"],
+            "userId": row["user_id"],
+            "appName": row["app_name"],
+            "state": json.loads(row["state"]),
+            "events": events,
+            "lastUpdateTime": row["last_update_time"],
+        }
+
+    def _events(self, session_id: str) -> list[dict[str, Any]]:
+        rows = self._conn.execute(
+            "SELECT event FROM session_events WHERE session_id = ? ORDER BY seq", (session_id,)
+        )
+        return [json.loads(row["event"]) for row in rows]
+
+    def _create(self, session: dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO sessions (id, user_id, app_name, state, last_update_time) VALUES (?, ?, ?, ?, ?)",
+                (session["id"], session["userId"], session["appName"],
+                 json.dumps(session["state"]), session["lastUpdateTime"]),
+            )
+
+    def _get(self, session_id: str, user_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM sessions WHERE id = ? AND user_id = ?", (session_id, user_id)
+            ).fetchone()
+            return None if row is None else self._session(row, self._events(session_id))
+
+    def _find(self, app_name: str, user_id: str) -> list[dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM sessions WHERE user_id = ? AND app_name = ?", (user_id, app_name)
+            ).fetchall()
+            return [self._session(row, self._events(row["id"])) for row in rows]
+
+    def _delete(self, session_id: str, user_id: str) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM sessions WHERE id = ? AND user_id = ?", (session_id, user_id)
+            )
+            return cursor.rowcount > 0
+
+    def _append(self, session_id: str, user_id: str, event: dict[str, Any],
+                state: dict[str, Any] | None) -> None:
+        timestamp = event.get("timestamp") or time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                updated = self._conn.execute(
+                    "UPDATE sessions SET last_update_time = ?, state = COALESCE(?, state) "
+                    "WHERE id = ? AND user_id = ?",
+                    (timestamp, None if state is None else json.dumps(state), session_id, user_id),
+                )
+                if not updated.rowcount:
+                    raise KeyError(f"Session {session_id} not found")
+                self._conn.execute(
+                    "INSERT INTO session_events (session_id, seq, event) VALUES "
+                    "(?, (SELECT COALESCE(MAX(seq), 0) + 1 FROM session_events WHERE session_id = ?), ?)",
+                    (session_id, session_id, json.dumps(event)),
+                )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    async def create(self, app_name: str, user_id: str, state: dict[str, Any] | None = None,
+                     session_id: str | None = None) -> dict[str, Any]:
+        session = new_session(app_name, user_id, state, session_id)
+        await asyncio.to_thread(self._create, session)
+        return session
+
+    async def get(self, session_id: str, user_id: str) -> dict[str, Any] | None:
+        return await asyncio.to_thread(self._get, session_id, user_id)
+
+    async def find(self, app_name: str, user_id: str) -> list[dict[str, Any]]:
+        return await asyncio.to_thread(self._find, app_name, user_id)
+
+    async def delete(self, session_id: str, user_id: str) -> bool:
+        return await asyncio.to_thread(self._delete, session_id, user_id)
+
+    async def append_event(self, session_id: str, user_id: str, event: dict[str, Any],
+                           state: dict[str, Any] | None = None) -> None:
+        await asyncio.to_thread(self._append, session_id, user_id, event, state)
+
+
+SessionStore = MemorySessionStore | SqliteSessionStore
+
+
+def create_session_store(kind: str, path: str) -> SessionStore:
+    """Build the store selected by ``local_session_store``."""
+    if kind == "sqlite":
+        return SqliteSessionStore(path)
+    return MemorySessionStore()
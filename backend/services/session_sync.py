@@ -0,0 +1,40 @@
+"""Helpers for incremental session history fetches."""
+
+import hashlib
+from typing import Any
+
+
+def session_etag(session: dict[str, Any]) -> str:
+    """Weak ETag that changes whenever the session gains events or is updated."""
+    version = f"{session['id']}:{session['lastUpdateTime']!r}:{len(session['events'])}"
+    return f'W/"{hashlib.sha1(version.encode()).hexdigest()[:16]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates or etag.removeprefix("W/") in candidates
+
+
+def events_since(events: list[dict[str, Any]], since: str) -> list[dict[str, Any]]:
+    """
+    Return the events that come after ``since``.
+
+    Args:
+        events: The session's events, oldest first
+        since: An event id, or a timestamp (seconds since the epoch)
+
+    Returns:
+        Events after the given event id, or with a later timestamp. If the
+        event id is unknown, all events are returned.
+    """
+    for index in range(len(events) - 1, -1, -1):
+        if events[index].get("id") == since:
+            return events[index + 1:]
+
+    try:
+        timestamp = float(since)
+    except ValueError:
+        return events
+    return [event for event in events if event.get("timestamp", 0) > timestamp]
@@ -0,0 +1,122 @@
+"""Server-Sent Event framing with a pluggable JSON serializer."""
+
+import asyncio
+import json
+import time
+from contextlib import aclosing, suppress
+from typing import Any, AsyncIterator, Callable
+
+Serializer = Callable[[Any], bytes]
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _orjson_dumps(obj: Any) -> bytes:
+    import orjson
+
+    return orjson.dumps(obj)
+
+
+def get_serializer(name: str = "auto") -> Serializer:
+    """
+    Return a function encoding objects to JSON bytes.
+
+    Args:
+        name: "orjson", "json", or "auto" to use orjson when installed
+
+    Returns:
+        The serializer
+    """
+    if name == "json":
+        return _stdlib_dumps
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        if name == "orjson":
+            raise
+        return _stdlib_dumps
+    return _orjson_dumps
+
+
+def encode_frame(payload: bytes) -> bytes:
+    """Wrap a single-line JSON payload in a complete SSE ``data`` frame."""
+    return b"data: " + payload + b"\n\n"
+
+
+def _text_delta(event: dict[str, Any]) -> str | None:
+    """Return the text of a partial, text-only event, or None for anything else."""
+    if not event.get("partial"):
+        return None
+    parts = event.get("content", {}).get("parts", [])
+    if len(parts) != 1 or set(parts[0]) != {"text"}:
+        return None
+    return parts[0]["text"]
+
+
+async def coalesce_text_deltas(
+    stream: AsyncIterator[dict[str, Any]],
+    flush_interval: float,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Merge consecutive partial text events into one event per flush interval.
+
+    Buffered text is flushed when the interval elapses, when a non-delta
+    event or a delta from another author arrives, or when the stream ends.
+    Other events pass through unchanged and in order.
+
+    Args:
+        stream: Async iterator of agent engine events
+        flush_interval: Maximum seconds to hold buffered text
+
+    Yields:
+        Events, with runs of text deltas merged
+    """
+    buffered: dict[str, Any] | None = None
+    texts: list[str] = []
+    deadline = 0.0
+
+    def flush() -> dict[str, Any]:
+        nonlocal buffered
+        event = {**buffered, "content": {**buffered["content"], "parts": [{"text": "".join(texts)}]}}
+        buffered = None
+        texts.clear()
+        return event
+
+    async with aclosing(stream):
+        iterator = aiter(stream)
+        pending: asyncio.Task | None = None
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(anext(iterator))
+                timeout = max(0.0, deadline - time.monotonic()) if buffered else None
+                done, _ = await asyncio.wait({pending}, timeout=timeout)
+                if not done:
+                    yield flush()
+                    continue
+
+                task, pending = pending, None
+                try:
+                    event = task.result()
+                except StopAsyncIteration:
+                    break
+
+                text = _text_delta(event)
+                if buffered and (text is None or event.get("author") != buffered.get("author")):
+                    yield flush()
+                if text is None:
+                    yield event
+                    continue
+                if buffered is None:
+                    buffered = event
+                    deadline = time.monotonic() + flush_interval
+                texts.append(text)
+            if buffered:
+                yield flush()
+        finally:
+            if pending is not None:
+                pending.cancel()
+                with suppress(asyncio.CancelledError, StopAsyncIteration):
+                    await pending
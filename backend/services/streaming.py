@@ -0,0 +1,61 @@
+"""Helpers for consuming agent engine event streams."""
+
+import asyncio
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
+
+
+@dataclass
+class FinalText:
+    """The last text produced by a stream and whether a budget cut it short."""
+    text: str = ""
+    events: int = 0
+    truncated: bool = False
+
+
+def extract_text(event: dict[str, Any]) -> str:
+    """Return the first text part of an event, or an empty string."""
+    for part in event.get("content", {}).get("parts", []):
+        if "text" in part:
+            return part["text"]
+    return ""
+
+
+async def collect_final_text(
+    stream: AsyncIterator[dict[str, Any]],
+    max_events: int | None = None,
+    timeout: float | None = None,
+) -> FinalText:
+    """
+    Consume a stream keeping only the latest text part, discarding each event.
+
+    Memory stays constant regardless of how many events the turn produces.
+
+    Args:
+        stream: Async iterator of agent engine events
+        max_events: Keep at most this many events
+        timeout: Stop after this many seconds
+
+    Returns:
+        The final text seen before the stream ended or the budget ran out
+    """
+    result = FinalText()
+    budget = asyncio.timeout(timeout)
+    try:
+        async with budget, aclosing(stream):
+            async for event in stream:
+                # Only an event past the budget means the reply was cut short
+                if max_events is not None and result.events >= max_events:
+                    result.truncated = True
+                    break
+                result.events += 1
+                text = extract_text(event)
+                if text:
+                    result.text = text
+    except TimeoutError:
+        # Only our own budget cuts the reply short; the engine's timeouts are errors
+        if not budget.expired():
+            raise
+        result.truncated = True
+    return result
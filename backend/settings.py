@@ -1,14 +1,64 @@
+from typing import Literal, Self
+
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
-    # Vertex AI Configuration
-    vertex_project_id: str
+    # Agent Engine Configuration
+    # "vertex" uses the deployed reasoning engine, "adk" runs an applyflow_agents
+    # agent in-process, "local" answers from a scripted fake model
+    agent_engine_backend: Literal["vertex", "adk", "local"] = "vertex"
+    local_engine_reply_delay: float = 0.0
+    # JSON script of replies for the local fake model; echoes when unset
+    local_engine_script: str | None = None
+    # Fault injection for the local engine: mean per-call latency and error rate
+    local_engine_latency: float = 0.0
+    local_engine_failure_rate: float = 0.0
+
+    # Agent Engine Client Configuration
+    engine_max_concurrency: int = 64
+    engine_max_concurrency_per_user: int = 4
+    # Calls waiting for a slot beyond this are rejected with 503
+    engine_max_queue: int = 256
+    engine_call_timeout_seconds: float | None = 30.0
+    engine_max_retries: int = 3
+    engine_retry_base_seconds: float = 0.2
+    engine_retry_max_seconds: float = 5.0
+    engine_breaker_failure_threshold: int = 5
+    engine_breaker_reset_seconds: float = 30.0
+
+    # Session storage for the "adk" and "local" backends
+    local_session_store: Literal["memory", "sqlite"] = "memory"
+    local_session_db: str = "sessions.db"
+
+    # In-process ADK Configuration (agent_engine_backend "adk")
+    adk_agents_dir: str = "../applyflow_agents"
+    adk_agent: Literal["application_agent", "resume_agent", "insight_agent"] = "application_agent"
+
+    # Vertex AI Configuration (required when agent_engine_backend is "vertex")
+    vertex_project_id: str | None = None
     vertex_location: str = "us-central1"
-    vertex_resource_id: str
-    staging_bucket: str
+    vertex_resource_id: str | None = None
+    staging_bucket: str | None = None
+
+    # Chat Configuration
+    chat_max_events: int | None = None
+    chat_timeout_seconds: float | None = None
+
+    # SSE Configuration
+    # "auto" uses orjson when installed and falls back to the stdlib json module
+    sse_serializer: Literal["auto", "orjson", "json"] = "auto"
+    # Merge partial text events into one frame per interval; 0 disables
+    sse_coalesce_interval_ms: float = 0.0
+
+    # Session Cache Configuration
+    # The cache is per worker process; unset, listings are cached for 30s with
+    # one worker and not at all when WEB_CONCURRENCY runs several. 0 disables
+    session_cache_ttl_seconds: float | None = None
+    session_cache_max_users: int = 1024
 
     # CORS Configuration
     cors_origins: list[str] = ["*"]
@@ -25,6 +75,18 @@ class Settings(BaseSettings):
         extra="ignore"
     )
 
+    @model_validator(mode="after")
+    def _check_vertex(self) -> Self:
+        if self.agent_engine_backend == "vertex":
+            missing = [
+                name.upper()
+                for name in ("vertex_project_id", "vertex_resource_id")
+                if not getattr(self, name)
+            ]
+            if missing:
+                raise ValueError(f"{', '.join(missing)} must be set when AGENT_ENGINE_BACKEND is vertex")
+        return self
+
 
 # Create a single instance to be imported throughout the app
 settings = Settings()